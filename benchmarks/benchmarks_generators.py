@@ -0,0 +1,44 @@
+
+import random
+
+from benchmarks import measure
+from genpo.random import roots
+from genpo.random import values as gens
+
+zeroes_counts = [10, 100, 1000, 10000]
+
+
+def generate_zeroes_rejection(n: int):
+    """The previous implementation of roots.generate_zeroes, that draws values until it has n distinct zeroes"""
+    zeroes: set[int] = set()
+    int_low, int_up = gens.easy_num_interval(min_choices=n)
+
+    while len(zeroes) < n:
+        zeroes = zeroes | {random.randint(int_low, int_up)
+                           for _ in range(n - len(zeroes))}
+
+    return list(zeroes)
+
+
+def benchmark_generate_zeroes():
+    """The time per zero of generate_zeroes should not grow with n"""
+    for n in zeroes_counts:
+        executions = max(10, 100000 // n)
+        measure.measure_executions(lambda: generate_zeroes_rejection(n), n=executions,
+                                   desc=f"rejection sampling of {n} zeroes", show_progress=False)
+        measure.measure_executions(lambda: roots.generate_zeroes(n), n=executions,
+                                   desc=f"generate_zeroes({n})", show_progress=False)
+
+
+def benchmark_generate_multiplicities():
+    for n in zeroes_counts[:3]:
+        executions = max(10, 10000 // n)
+        measure.measure_executions(lambda: roots.generate_multiplicities(n, n, 2 * n, 1, 3), n=executions,
+                                   desc=f"generate_multiplicities({n}, min_grade={n}, max_grade={2 * n}, 1, 3)", show_progress=False)
+        measure.measure_executions(lambda: roots.generate_zeroes_with_multiplicity([3] * n), n=executions,
+                                   desc=f"generate_zeroes_with_multiplicity([3] * {n})", show_progress=False)
+
+
+if __name__ == '__main__':
+    benchmark_generate_zeroes()
+    benchmark_generate_multiplicities()
@@ -0,0 +1,133 @@
+"""
+    Benchmark suite of genpo.
+
+    Run from the root of the repository:
+
+        python -m benchmarks.benchmarks_genpo --output results.json
+        python -m benchmarks.benchmarks_genpo --baseline results.json
+
+    Every benchmark is measured with warmup and repetitions (see `measure.measure`), and the statistics are printed in nanoseconds per call.
+    With --output the results are saved as JSON, with --baseline they are compared with saved results, and the exit status is 1 if a benchmark is slower than the baseline more than --threshold.
+"""
+
+import argparse
+import platform
+import random
+import sys
+from datetime import datetime, timezone
+from fractions import Fraction
+
+from benchmarks import measure
+from genpo import operations as ops
+from genpo import polynomials as pols
+from genpo import representation as repr
+from genpo.random import polynomials as genpo
+
+DEFAULT_DEGREES = [4, 16, 64, 256]
+
+
+def random_pol(degree: int, fractions: bool = False):
+    coff = [random.randint(-100, 100) for _ in range(degree + 1)]
+    if fractions:
+        coff = [Fraction(v, random.randint(1, 4)) for v in coff]
+    return coff
+
+
+def benchmarks(degrees: list[int]):
+    """
+    The benchmarks of the suite, for every degree
+
+    returns: list[tuple] - Name and function without parameters of every benchmark
+    """
+    res = []
+    for d in degrees:
+        random.seed(d)
+        pol1, pol2 = random_pol(d), random_pol(d)
+        fpol1, fpol2 = random_pol(d, True), random_pol(d, True)
+        zeroes = [random.randint(-5, 5) for _ in range(d)]
+        half = max(1, d // 2)
+
+        res += [
+            (f'operations.sum/{d}', lambda pol1=pol1, pol2=pol2: ops.sum(pol1, pol2)),
+            (f'operations.multiply/{d}', lambda pol1=pol1, pol2=pol2: ops.multiply(pol1, pol2)),
+            (f'operations.multiply_fraction/{d}', lambda pol1=fpol1, pol2=fpol2: ops.multiply(pol1, pol2)),
+            (f'operations.horner_evaluate/{d}', lambda pol1=pol1: ops.horner_evaluate(pol1, 3)),
+            (f'polynomials.from_roots/{d}', lambda zeroes=zeroes: pols.from_roots(zeroes)),
+            (f'representation.coff_str/{d}', lambda pol1=fpol1: repr.coff_str(pol1)),
+            (f'representation.render_latex/{d}', lambda pol1=fpol1: repr.render(pol1, 'latex')),
+            (f'random.pol_fz_count/{d}', lambda d=d, half=half: genpo.pol_fz_count(d, half)),
+            (f'random.pol_fz_multiplicities/{d}', lambda d=d, half=half: genpo.pol_fz_multiplicities([d // half] * half)),
+            (f'random.pol_1/{d}', lambda d=d, half=half: genpo.pol_1([1] * (d - 2 * (half // 2)), d)),
+            (f'random.pol_2/{d}', lambda d=d: genpo.pol_2(d, d)),
+            (f'random.pol_fz_count_batch/{d}', lambda d=d, half=half: genpo.pol_fz_count_batch(d, half, 100, seed=1)),
+            (f'random.pol_fz_multiplicities_batch/{d}', lambda d=d, half=half: genpo.pol_fz_multiplicities_batch([d // half] * half, 100, seed=1)),
+            (f'random.pol_1_batch/{d}', lambda d=d, half=half: genpo.pol_1_batch([1] * (d - 2 * (half // 2)), d, 100, seed=1)),
+        ]
+
+    res.append(('random.parabola_no_zeroes', genpo.parabola_no_zeroes))
+    return res
+
+
+def format_ns(ns: float):
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('us', 1e3)):
+        if ns >= scale:
+            return f'{ns / scale:.2f}{unit}'
+    return f'{ns:.0f}ns'
+
+
+def run(degrees: list[int], warmup: int, repeat: int, filter: str = None):
+    results = {}
+    for name, fun in benchmarks(degrees):
+        if filter != None and filter not in name:
+            continue
+
+        random.seed(0)
+        stats = measure.measure(fun, warmup=warmup, repeat=repeat)
+        results[name] = stats
+        print(f"{name:45} median {format_ns(stats['median']):>10}  p90 {format_ns(stats['p90']):>10}  p99 {format_ns(stats['p99']):>10}  x{stats['number']}")
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks of genpo")
+    parser.add_argument('--degrees', type=int, nargs='+', default=DEFAULT_DEGREES, help="degrees of the polynomials of the benchmarks")
+    parser.add_argument('--warmup', type=int, default=3, help="executions before measuring")
+    parser.add_argument('--repeat', type=int, default=20, help="samples for every benchmark")
+    parser.add_argument('--filter', help="run only the benchmarks with this text in the name")
+    parser.add_argument('--output', help="save the results in this JSON file")
+    parser.add_argument('--baseline', help="compare the results with the ones saved in this JSON file")
+    parser.add_argument('--threshold', type=float, default=0.1, help="relative slowdown over the baseline that is a regression (default 0.1)")
+    args = parser.parse_args(argv)
+
+    results = run(args.degrees, args.warmup, args.repeat, args.filter)
+
+    if args.output != None:
+        measure.save_results({
+            'meta': {
+                'python': sys.version,
+                'platform': platform.platform(),
+                'date': datetime.now(timezone.utc).isoformat(),
+            },
+            'results': results,
+        }, args.output)
+
+    if args.baseline != None:
+        baseline = measure.load_results(args.baseline)['results']
+        rows = measure.compare(results, baseline, args.threshold)
+
+        print()
+        print(f"{'benchmark':45} {'baseline':>10} {'now':>10} {'change':>8}")
+        for name, old, new, change, regression in rows:
+            print(f"{name:45} {format_ns(old):>10} {format_ns(new):>10} {change:>+8.1%}{'  REGRESSION' if regression else ''}")
+
+        regressions = [row for row in rows if row[4]]
+        if len(regressions) > 0:
+            print(f"\n{len(regressions)} regressions over {args.threshold:.0%}")
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
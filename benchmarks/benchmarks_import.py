@@ -0,0 +1,78 @@
+"""
+    Benchmark of the import time of genpo and of the startup of the `genpo` command.
+
+    Run from the root of the repository:
+
+        python -m benchmarks.benchmarks_import
+        python -m benchmarks.benchmarks_import --top 15 --module genpo.random.polynomials
+
+    Every import is measured in a new interpreter with `python -X importtime`, and the median of the repetitions is printed. The startup of the command is measured as the wall time of a whole run, compared to an interpreter that does nothing.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = ['genpo', 'genpo.random', 'genpo.operations', 'genpo.polynomials', 'genpo.random.polynomials', 'genpo.representation', 'genpo.cli']
+
+COMMANDS = {
+    'python -c pass': ['-c', 'pass'],
+    'genpo --help': ['-m', 'genpo.cli', '--help'],
+    'genpo fz-count 4': ['-m', 'genpo.cli', 'fz-count', '4'],
+    'genpo -n 10000 fz-count 4': ['-m', 'genpo.cli', '-n', '10000', '--format', 'compact', 'fz-count', '4'],
+}
+
+
+def _run(args: list):
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    return subprocess.run([sys.executable] + args, capture_output=True, text=True, env=env, check=True)
+
+
+def import_times(module: str):
+    """
+    Import the module in a new interpreter with -X importtime
+
+    returns: dict - The cumulative import time in microseconds of every module imported, by name
+    """
+    res = {}
+    for line in _run(['-X', 'importtime', '-c', f'import {module}']).stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        res[name.strip()] = int(cumulative)
+
+    return res
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import time of genpo")
+    parser.add_argument('--repeat', type=int, default=10, help="runs of every measure")
+    parser.add_argument('--module', default='genpo.random.polynomials', help="module whose slowest imports are printed")
+    parser.add_argument('--top', type=int, default=10, help="number of slowest imports printed")
+    args = parser.parse_args(argv)
+
+    print(f"{'import':35} {'median ms':>10}")
+    for module in MODULES:
+        times = [import_times(module)[module] for _ in range(args.repeat)]
+        print(f"{module:35} {statistics.median(times) / 1000:>10.2f}")
+
+    print(f"\nSlowest imports of {args.module} (cumulative ms)")
+    times = import_times(args.module)
+    for name, us in sorted(times.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {name:40} {us / 1000:>8.2f}")
+
+    print(f"\n{'command':35} {'median ms':>10}")
+    for name, command in COMMANDS.items():
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            _run(command)
+            times.append(time.perf_counter() - start)
+        print(f"{name:35} {statistics.median(times) * 1000:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+    Comparison of the compiled kernels of `genpo._speedups` with the python code.
+
+    Build the extension, then run from the root of the repository:
+
+        python setup.py build_ext --inplace
+        python -m benchmarks.benchmarks_speedups
+        python -m benchmarks.benchmarks_speedups --degrees 16 256 --min-speedup 10
+
+    Every kernel is run with int coefficients that fit in 64 bits, with big ints, with floats and with fractions, once with the compiled kernels and once with the python code. The results must be the same, with the same types, and the median times are compared.
+    The exit status is 1 if a result is different, or if the expansion of int64 or float roots is less than --min-speedup times faster than the python code.
+"""
+
+import argparse
+import random
+import sys
+from fractions import Fraction
+from math import copysign
+
+from benchmarks import measure
+from genpo import operations as ops
+from genpo import polynomials as pols
+
+DEFAULT_DEGREES = [16, 64, 256]
+# The kernels that must reach the min speedup with the kinds of values that don't use the python number protocol. The other kernels create a python object for every coefficient, so they are a few times faster at most
+CHECKED_KERNELS = ('from_roots',)
+FAST_KINDS = ('int64', 'float')
+
+
+def random_values(kind: str, n: int):
+    if kind == 'int64':
+        return [random.randint(-5, 5) for _ in range(n)]
+    if kind == 'bigint':
+        return [random.randint(-10 ** 30, 10 ** 30) for _ in range(n)]
+    if kind == 'float':
+        return [random.uniform(-5, 5) for _ in range(n)]
+    return [Fraction(random.randint(-5, 5), random.randint(1, 4)) for _ in range(n)]
+
+
+def cases(degrees: list[int]):
+    """
+    returns: list[tuple] - The name, the kind of values and the function without parameters of every case
+    """
+    res = []
+    for d in degrees:
+        for kind in ('int64', 'bigint', 'float', 'fraction'):
+            random.seed(d)
+            pol1, pol2 = random_values(kind, d + 1), random_values(kind, d + 1)
+            # With int64 values the point is 1 or -1, so the value of the polinomy fits in 64 bits too
+            x = random.choice([-1, 1]) if kind == 'int64' else random_values(kind, 1)[0]
+            factor = 3 if kind == 'int64' else x
+            # Small roots, so the expansion fits in 64 bits at the degrees of the suite with int64 roots
+            zeroes = [v % 3 - 1 if kind == 'int64' else v for v in random_values(kind, min(d, 32))]
+
+            res += [
+                (f'horner_evaluate/{kind}/{d}', kind, lambda pol1=pol1, x=x: ops.horner_evaluate(pol1, x)),
+                (f'sum_2/{kind}/{d}', kind, lambda pol1=pol1, pol2=pol2: ops.sum_2(pol1[:], pol2)),
+                (f'apply_factor/{kind}/{d}', kind, lambda pol1=pol1, factor=factor: (lambda coff: (ops.apply_factor(coff, factor), coff)[1])(pol1[:])),
+                (f'from_roots/{kind}/{len(zeroes)}', kind, lambda zeroes=zeroes: pols.from_roots(zeroes)),
+            ]
+
+    # The same roots are used by many degrees
+    return list({name: (name, kind, fun) for name, kind, fun in res}.values())
+
+
+def same(a, b):
+    """
+    returns: bool - True if the values are equal and have the same types, like int and float, and the float zeroes have the same sign
+    """
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if type(a) is float:
+        return a == b and copysign(1, a) == copysign(1, b) or a != a and b != b
+    return a == b
+
+
+def set_speedups(module):
+    ops._speedups = module
+    pols._speedups = module
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compiled kernels of genpo compared with the python code")
+    parser.add_argument('--degrees', type=int, nargs='+', default=DEFAULT_DEGREES)
+    parser.add_argument('--repeat', type=int, default=20, help="samples of every measure")
+    parser.add_argument('--min-speedup', type=float, default=10.0, help="min speedup of the expansion of int64 and float roots")
+    args = parser.parse_args(argv)
+
+    compiled = ops._speedups
+    if compiled is None:
+        print("The compiled kernels are not available: build them with `python setup.py build_ext --inplace`, and don't set GENPO_PURE_PYTHON")
+        return 1
+
+    failed = False
+    print(f"{'kernel':32} {'python ns':>12} {'compiled ns':>12} {'speedup':>8}")
+    for name, kind, fun in cases(args.degrees):
+        try:
+            set_speedups(None)
+            expected = fun()
+            python_ns = measure.measure(fun, repeat=args.repeat)['median']
+
+            set_speedups(compiled)
+            result = fun()
+            compiled_ns = measure.measure(fun, repeat=args.repeat)['median']
+        finally:
+            set_speedups(compiled)
+
+        speedup = python_ns / compiled_ns
+        notes = []
+        if not same(result, expected):
+            notes.append('DIFFERENT RESULT')
+        if name.split('/')[0] in CHECKED_KERNELS and kind in FAST_KINDS and speedup < args.min_speedup:
+            notes.append('SLOW')
+        failed = failed or len(notes) > 0
+
+        print(f"{name:32} {python_ns:>12.0f} {compiled_ns:>12.0f} {speedup:>7.1f}x {' '.join(notes)}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
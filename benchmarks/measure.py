@@ -1,3 +1,5 @@
+import json
+import statistics
 import time
 
 
@@ -10,12 +12,12 @@ def measure_executions(fun, desc: str = None, n: int = 100, show_progress: bool
     if show_progress:
         print(" 0\t", end='')
 
-    elasped = 0.0
+    elasped = 0
 
     for i in range(n):
-        start = time.time()
+        start = time.perf_counter_ns()
         fun()
-        stop = time.time()
+        stop = time.perf_counter_ns()
         elasped = elasped + (stop - start)
 
         if show_progress:
@@ -26,5 +28,95 @@ def measure_executions(fun, desc: str = None, n: int = 100, show_progress: bool
 
     if show_progress:
         print()
-    print("--- %f seconds ---" % (elasped))
-    print("--- %f seconds per execution ---" % (elasped / n))
+    print("--- %f seconds ---" % (elasped / 1e9))
+    print("--- %f seconds per execution ---" % (elasped / 1e9 / n))
+
+
+def percentile(sorted_values: list, p: float):
+    """
+    Percentile p (0-100) of sorted values, interpolating linearly between the closest ranks
+    """
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+
+    rank = (len(sorted_values) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def measure(fun, warmup: int = 3, repeat: int = 20, number: int = None, min_time_ns: int = 2_000_000):
+    """
+    Measure the time of an execution of fun with `time.perf_counter_ns`.
+    fun is executed `warmup` times without measuring, then `repeat` samples are taken. Every sample times `number` consecutive executions, so that very fast functions are measured over a time long enough.
+
+    parameters:
+        - fun - Function without parameters to measure
+        - warmup: int - Executions before measuring
+        - repeat: int - Number of samples
+        - number: int - Executions in every sample. If None, it's chosen so a sample lasts at least min_time_ns
+        - min_time_ns: int - Minimum duration of a sample when number is None
+
+    returns: dict - Statistics of the time of one execution, in nanoseconds: min, mean, median, p90, p99, stdev, and the number of samples and executions per sample
+    """
+    for _ in range(warmup):
+        fun()
+
+    if number == None:
+        number = 1
+        while True:
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                fun()
+            if time.perf_counter_ns() - start >= min_time_ns:
+                break
+            number *= 2
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            fun()
+        samples.append((time.perf_counter_ns() - start) / number)
+
+    samples.sort()
+    return {
+        'min': samples[0],
+        'mean': statistics.fmean(samples),
+        'median': statistics.median(samples),
+        'p90': percentile(samples, 90),
+        'p99': percentile(samples, 99),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'repeat': repeat,
+        'number': number,
+    }
+
+
+def save_results(results: dict, path: str):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_results(path: str):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results: dict, baseline: dict, threshold: float = 0.1, stat: str = 'median'):
+    """
+    Compare the results of the benchmarks with the ones of a baseline.
+
+    parameters:
+        - results, baseline: dict - Statistics of the benchmarks by name, as returned by `measure`
+        - threshold: float - Relative slowdown over which a benchmark is a regression. 0.1 is 10%
+        - stat: str - Statistic to compare
+
+    returns: list[tuple] - For every benchmark in both results: name, baseline time, new time, relative change and True if it's a regression
+    """
+    rows = []
+    for name in sorted(results.keys() & baseline.keys()):
+        old, new = baseline[name][stat], results[name][stat]
+        change = (new - old) / old if old > 0 else 0.0
+        rows.append((name, old, new, change, change > threshold))
+
+    return rows
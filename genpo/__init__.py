@@ -1,17 +1,62 @@
-    """
-        Module for manipulating polynomials and generating random ones that are simple to resolve by hand
-
-        Manipulation
-        ----
-        - polynomials: pure functions for creating polynomials from parameters
-        - operations: sum, multiplication and evaluation in one point
-        - roots: utilities functions when working with roots and multiplicities
-        - representation: string representations
-
-        Random generators
-        ----
-        Functions for generating random roots and polynomials. All values generated are simple to find for a human that resolve the problem by hand
-        - values: generators for intervals of values, simple fractions or expanding randomly a list of items
-        - roots: generators for random roots. All integers and simple to find
-        - polynomials: generator for polynomials, with or without roots
-    """
\ No newline at end of file
+"""
+    Module for manipulating polynomials and generating random ones that are simple to resolve by hand
+
+    Manipulation
+    ----
+    - polynomials: pure functions for creating polynomials from parameters
+    - operations: sum, multiplication and evaluation in one point
+    - modular: expansion and multiplication of polynomials of high degree modulo many primes
+    - roots: utilities functions when working with roots and multiplicities
+    - representation: string representations
+    - compact: compact representation of polynomials, as integer numerators and a common denominator
+    - cache: optional cache of the expansions of roots
+    - builder: incremental construction of a polynomial from its roots, with undo and redo
+
+    Random generators
+    ----
+    Functions for generating random roots and polynomials. All values generated are simple to find for a human that resolve the problem by hand
+    - values: generators for intervals of values, simple fractions or expanding randomly a list of items
+    - roots: generators for random roots. All integers and simple to find
+    - polynomials: generator for polynomials, with or without roots
+    - space: exact counting, enumeration and sampling by index of the polynomials of the generators
+    - difficulty: generation of polynomials by level of difficulty, from an index of configurations cached on disk
+
+    Verification
+    ----
+    - verify: recovery of the rational roots of polynomials and checks of their multiplicities
+
+    Parallel generation
+    ----
+    - parallel: generation of many polynomials in worker processes, with results that depend only on the seed
+    - service: asyncio server that generates polynomials for clients, with a line-delimited JSON protocol
+    - shared: batches of polynomials in shared memory, read by other processes without copies
+
+    Storage
+    ----
+    - store: binary files of generated polynomials, readable by index without loading the whole file
+    - dedup: indexes of the polynomials already generated, to generate them without duplicates
+
+    Command line
+    ----
+    - cli: the `genpo` command
+
+    Instrumentation
+    ----
+    - instrument: opt-in counters and timings of the stages of the generation, and profiling with cProfile
+"""
+
+import importlib
+
+# The submodules are imported only when they are used, like `genpo.operations` after `import genpo`
+_SUBMODULES = {'polynomials', 'operations', 'modular', 'roots', 'representation', 'compact', 'cache', 'builder', 'random', 'verify',
+               'parallel', 'service', 'shared', 'store', 'dedup', 'instrument', 'cli'}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
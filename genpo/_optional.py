@@ -0,0 +1,45 @@
+"""
+    Lazy imports of the optional dependencies, so importing genpo doesn't pay for them until they are used
+"""
+
+import os
+import sys
+
+_numpy = None
+_numpy_tried = False
+
+
+def numpy():
+    """
+    returns: module | None - NumPy, imported at the first call, or None if it isn't installed
+    """
+    global _numpy, _numpy_tried
+    if not _numpy_tried:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+        _numpy_tried = True
+
+    return _numpy
+
+
+def numpy_if_imported():
+    """
+    returns: module | None - NumPy if it was already imported by someone, without importing it. Enough to check if an object is a NumPy one, because it can't exist before NumPy is imported
+    """
+    return sys.modules.get('numpy')
+
+
+def speedups():
+    """
+    returns: module | None - The compiled kernels of `genpo._speedups`, or None if the extension isn't built or the environment variable GENPO_PURE_PYTHON is set to a non empty value
+    """
+    if os.environ.get('GENPO_PURE_PYTHON'):
+        return None
+    try:
+        from genpo import _speedups
+        return _speedups
+    except ImportError:
+        return None
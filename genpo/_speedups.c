@@ -0,0 +1,481 @@
+/*
+    Optional compiled kernels of genpo.operations and genpo.polynomials.
+
+    Every kernel has a fast path for 64 bits integers, with overflow checks, one for floats, and a generic path that does the same
+    operations of the python functions, in the same order, with the python number protocol. So the results are always the same
+    of the pure python functions, for any type of coefficients (int, float, Fraction, ...). The python functions check the
+    arguments before calling the kernels, so the kernels don't repeat the checks.
+*/
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <limits.h>
+
+static int
+mul_int64(long long a, long long b, long long *res)
+{
+#if defined(__GNUC__) || defined(__clang__)
+    return !__builtin_mul_overflow(a, b, res);
+#else
+    if (a > 0 ? (b > 0 ? a > LLONG_MAX / b : b < LLONG_MIN / a)
+              : (b > 0 ? a < LLONG_MIN / b : (a != 0 && b < LLONG_MAX / a))) {
+        return 0;
+    }
+    *res = a * b;
+    return 1;
+#endif
+}
+
+static int
+add_int64(long long a, long long b, long long *res)
+{
+#if defined(__GNUC__) || defined(__clang__)
+    return !__builtin_add_overflow(a, b, res);
+#else
+    if ((b > 0 && a > LLONG_MAX - b) || (b < 0 && a < LLONG_MIN - b)) {
+        return 0;
+    }
+    *res = a + b;
+    return 1;
+#endif
+}
+
+static int
+sub_int64(long long a, long long b, long long *res)
+{
+#if defined(__GNUC__) || defined(__clang__)
+    return !__builtin_sub_overflow(a, b, res);
+#else
+    if ((b < 0 && a > LLONG_MAX + b) || (b > 0 && a < LLONG_MIN + b)) {
+        return 0;
+    }
+    *res = a - b;
+    return 1;
+#endif
+}
+
+/* Read an int that fits in 64 bits. Returns 0 if the object is not an int or doesn't fit */
+static int
+as_int64(PyObject *obj, long long *res)
+{
+    int overflow;
+
+    if (!PyLong_CheckExact(obj)) {
+        return 0;
+    }
+    *res = PyLong_AsLongLongAndOverflow(obj, &overflow);
+    return overflow == 0;
+}
+
+/* Copy the items to values if they are all ints that fit in 64 bits */
+static int
+all_int64(PyObject **items, Py_ssize_t n, long long *values)
+{
+    for (Py_ssize_t i = 0; i < n; i++) {
+        if (!as_int64(items[i], &values[i])) {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+/* Copy the items to values if they are all floats */
+static int
+all_float(PyObject **items, Py_ssize_t n, double *values)
+{
+    for (Py_ssize_t i = 0; i < n; i++) {
+        if (!PyFloat_CheckExact(items[i])) {
+            return 0;
+        }
+        values[i] = PyFloat_AS_DOUBLE(items[i]);
+    }
+    return 1;
+}
+
+/* p = p * x + a, replacing the reference of p. Returns 0 on errors */
+static int
+multiply_add(PyObject **p, PyObject *x, PyObject *a)
+{
+    PyObject *product, *res;
+
+    product = PyNumber_Multiply(*p, x);
+    if (product == NULL) {
+        return 0;
+    }
+    res = PyNumber_Add(product, a);
+    Py_DECREF(product);
+    if (res == NULL) {
+        return 0;
+    }
+    Py_SETREF(*p, res);
+    return 1;
+}
+
+static PyObject *
+horner_generic(PyObject **coff, Py_ssize_t n, PyObject *x)
+{
+    PyObject *p = coff[n - 1], *pdx = coff[n - 1];
+
+    Py_INCREF(p);
+    Py_INCREF(pdx);
+    for (Py_ssize_t i = n - 2; i >= 1; i--) {
+        if (!multiply_add(&p, x, coff[i]) || !multiply_add(&pdx, x, p)) {
+            goto error;
+        }
+    }
+    if (n > 1 && !multiply_add(&p, x, coff[0])) {
+        goto error;
+    }
+    return Py_BuildValue("(NN)", p, pdx);
+
+error:
+    Py_DECREF(p);
+    Py_DECREF(pdx);
+    return NULL;
+}
+
+/* Returns 0 if a coefficient is not an int of 64 bits, or on overflow */
+static int
+horner_int64(PyObject **coff, Py_ssize_t n, long long x, long long *p_res, long long *pdx_res)
+{
+    long long p, pdx, a;
+
+    if (!as_int64(coff[n - 1], &p)) {
+        return 0;
+    }
+    pdx = p;
+    for (Py_ssize_t i = n - 2; i >= 1; i--) {
+        if (!as_int64(coff[i], &a) || !mul_int64(p, x, &p) || !add_int64(p, a, &p)) {
+            return 0;
+        }
+        if (!mul_int64(pdx, x, &pdx) || !add_int64(pdx, p, &pdx)) {
+            return 0;
+        }
+    }
+    if (n > 1 && (!as_int64(coff[0], &a) || !mul_int64(p, x, &p) || !add_int64(p, a, &p))) {
+        return 0;
+    }
+    *p_res = p;
+    *pdx_res = pdx;
+    return 1;
+}
+
+/* Returns 0 if a coefficient is not a float */
+static int
+horner_float(PyObject **coff, Py_ssize_t n, double x, double *p_res, double *pdx_res)
+{
+    double p, pdx;
+
+    if (!PyFloat_CheckExact(coff[n - 1])) {
+        return 0;
+    }
+    p = pdx = PyFloat_AS_DOUBLE(coff[n - 1]);
+    for (Py_ssize_t i = n - 2; i >= 1; i--) {
+        if (!PyFloat_CheckExact(coff[i])) {
+            return 0;
+        }
+        p = p * x + PyFloat_AS_DOUBLE(coff[i]);
+        pdx = pdx * x + p;
+    }
+    if (n > 1) {
+        if (!PyFloat_CheckExact(coff[0])) {
+            return 0;
+        }
+        p = p * x + PyFloat_AS_DOUBLE(coff[0]);
+    }
+    *p_res = p;
+    *pdx_res = pdx;
+    return 1;
+}
+
+static PyObject *
+horner_evaluate(PyObject *module, PyObject *args)
+{
+    PyObject *coff_arg, *x, *seq, *res;
+    PyObject **coff;
+    Py_ssize_t n;
+    long long x_int, p_int, pdx_int;
+    double p_float, pdx_float;
+
+    if (!PyArg_ParseTuple(args, "OO:horner_evaluate", &coff_arg, &x)) {
+        return NULL;
+    }
+    seq = PySequence_Fast(coff_arg, "coff must be a sequence");
+    if (seq == NULL) {
+        return NULL;
+    }
+    n = PySequence_Fast_GET_SIZE(seq);
+    coff = PySequence_Fast_ITEMS(seq);
+
+    if (n < 1) {
+        PyErr_Format(PyExc_ValueError, "coff len must be at least 1. Found %zd", n);
+        res = NULL;
+    }
+    else if (as_int64(x, &x_int) && horner_int64(coff, n, x_int, &p_int, &pdx_int)) {
+        res = Py_BuildValue("(LL)", p_int, pdx_int);
+    }
+    else if (PyFloat_CheckExact(x) && horner_float(coff, n, PyFloat_AS_DOUBLE(x), &p_float, &pdx_float)) {
+        res = Py_BuildValue("(dd)", p_float, pdx_float);
+    }
+    else {
+        res = horner_generic(coff, n, x);
+    }
+
+    Py_DECREF(seq);
+    return res;
+}
+
+static PyObject *
+from_roots_generic(PyObject **zeroes, Py_ssize_t m)
+{
+    PyObject *coff, *t0, *t1, *product, *value;
+
+    coff = PyList_New(m + 1);
+    if (coff == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t k = 0; k <= m; k++) {
+        PyList_SET_ITEM(coff, k, PyLong_FromLong(1));
+    }
+
+    /* The iteration i multiplies the partial polinomy by (x - zeroes[i]) */
+    for (Py_ssize_t i = 0; i < m; i++) {
+        t0 = PyLong_FromLong(0);
+        for (Py_ssize_t j = 0; j <= i; j++) {
+            t1 = t0;
+            t0 = PyList_GET_ITEM(coff, j);
+            Py_INCREF(t0);
+
+            product = PyNumber_Multiply(t0, zeroes[i]);
+            if (product == NULL) {
+                Py_DECREF(t1);
+                goto error;
+            }
+            value = PyNumber_Subtract(t1, product);
+            Py_DECREF(product);
+            Py_DECREF(t1);
+            if (value == NULL) {
+                goto error;
+            }
+            PyList_SetItem(coff, j, value);
+        }
+        Py_DECREF(t0);
+    }
+    return coff;
+
+error:
+    Py_DECREF(t0);
+    Py_DECREF(coff);
+    return NULL;
+}
+
+/* Returns 0 on overflow */
+static int
+from_roots_int64(const long long *zeroes, Py_ssize_t m, long long *coff)
+{
+    long long t0, t1, product;
+
+    for (Py_ssize_t k = 0; k <= m; k++) {
+        coff[k] = 1;
+    }
+    for (Py_ssize_t i = 0; i < m; i++) {
+        t0 = 0;
+        for (Py_ssize_t j = 0; j <= i; j++) {
+            t1 = t0;
+            t0 = coff[j];
+            if (!mul_int64(t0, zeroes[i], &product) || !sub_int64(t1, product, &coff[j])) {
+                return 0;
+            }
+        }
+    }
+    return 1;
+}
+
+static PyObject *
+from_roots(PyObject *module, PyObject *arg)
+{
+    PyObject *seq, *res = NULL;
+    PyObject **zeroes;
+    Py_ssize_t m;
+    long long *int_zeroes = NULL, *int_coff = NULL;
+    double *float_zeroes = NULL, *float_coff = NULL;
+
+    seq = PySequence_Fast(arg, "zeroes must be a sequence");
+    if (seq == NULL) {
+        return NULL;
+    }
+    m = PySequence_Fast_GET_SIZE(seq);
+    zeroes = PySequence_Fast_ITEMS(seq);
+
+    /* Fractions and the other numbers go to the generic path, without allocating and filling the buffers of the fast paths */
+    if (m > 0 && !PyLong_CheckExact(zeroes[0]) && !PyFloat_CheckExact(zeroes[0])) {
+        res = from_roots_generic(zeroes, m);
+        goto done;
+    }
+
+    if (m == 0 || PyLong_CheckExact(zeroes[0])) {
+        int_zeroes = PyMem_New(long long, m + 1);
+        int_coff = PyMem_New(long long, m + 1);
+        if (int_zeroes == NULL || int_coff == NULL) {
+            PyErr_NoMemory();
+            goto done;
+        }
+    }
+    if (int_zeroes != NULL && all_int64(zeroes, m, int_zeroes) && from_roots_int64(int_zeroes, m, int_coff)) {
+        res = PyList_New(m + 1);
+        for (Py_ssize_t k = 0; res != NULL && k <= m; k++) {
+            PyObject *value = PyLong_FromLongLong(int_coff[k]);
+            if (value == NULL) {
+                Py_CLEAR(res);
+                break;
+            }
+            PyList_SET_ITEM(res, k, value);
+        }
+        goto done;
+    }
+
+    if (m > 0 && PyFloat_CheckExact(zeroes[0])) {
+        float_zeroes = PyMem_New(double, m + 1);
+        float_coff = PyMem_New(double, m + 1);
+        if (float_zeroes == NULL || float_coff == NULL) {
+            PyErr_NoMemory();
+            goto done;
+        }
+    }
+    if (float_zeroes != NULL && all_float(zeroes, m, float_zeroes)) {
+        double t0, t1;
+        for (Py_ssize_t k = 0; k <= m; k++) {
+            float_coff[k] = 1.0;
+        }
+        for (Py_ssize_t i = 0; i < m; i++) {
+            t0 = 0.0;
+            for (Py_ssize_t j = 0; j <= i; j++) {
+                t1 = t0;
+                t0 = float_coff[j];
+                float_coff[j] = t1 - t0 * float_zeroes[i];
+            }
+        }
+
+        /* Like the python function, the highest coefficient is never changed, so it stays the int 1 */
+        res = PyList_New(m + 1);
+        for (Py_ssize_t k = 0; res != NULL && k <= m; k++) {
+            PyObject *value = k < m ? PyFloat_FromDouble(float_coff[k]) : PyLong_FromLong(1);
+            if (value == NULL) {
+                Py_CLEAR(res);
+                break;
+            }
+            PyList_SET_ITEM(res, k, value);
+        }
+        goto done;
+    }
+
+    res = from_roots_generic(zeroes, m);
+
+done:
+    PyMem_Free(int_zeroes);
+    PyMem_Free(int_coff);
+    PyMem_Free(float_zeroes);
+    PyMem_Free(float_coff);
+    Py_DECREF(seq);
+    return res;
+}
+
+/* a * b, with the fast paths for ints of 64 bits and floats. Returns a new reference */
+static PyObject *
+multiply_values(PyObject *a, PyObject *b)
+{
+    long long a_int, b_int, res;
+
+    if (as_int64(a, &a_int) && as_int64(b, &b_int) && mul_int64(a_int, b_int, &res)) {
+        return PyLong_FromLongLong(res);
+    }
+    if (PyFloat_CheckExact(a) && PyFloat_CheckExact(b)) {
+        return PyFloat_FromDouble(PyFloat_AS_DOUBLE(a) * PyFloat_AS_DOUBLE(b));
+    }
+    return PyNumber_Multiply(a, b);
+}
+
+static PyObject *
+apply_factor(PyObject *module, PyObject *args)
+{
+    PyObject *coffs, *factor, *value;
+
+    if (!PyArg_ParseTuple(args, "O!O:apply_factor", &PyList_Type, &coffs, &factor)) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(coffs); i++) {
+        value = multiply_values(PyList_GET_ITEM(coffs, i), factor);
+        if (value == NULL) {
+            return NULL;
+        }
+        PyList_SetItem(coffs, i, value);
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+sum_2(PyObject *module, PyObject *args)
+{
+    PyObject *pol1, *pol2_arg, *pol2, *a, *b, *value;
+    long long a_int, b_int, res;
+
+    if (!PyArg_ParseTuple(args, "O!O:sum_2", &PyList_Type, &pol1, &pol2_arg)) {
+        return NULL;
+    }
+    pol2 = PySequence_Fast(pol2_arg, "pol2 must be a sequence");
+    if (pol2 == NULL) {
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < PySequence_Fast_GET_SIZE(pol2); i++) {
+        if (i >= PyList_GET_SIZE(pol1)) {
+            PyErr_SetString(PyExc_IndexError, "list index out of range");
+            Py_DECREF(pol2);
+            return NULL;
+        }
+
+        a = PyList_GET_ITEM(pol1, i);
+        b = PySequence_Fast_GET_ITEM(pol2, i);
+        if (as_int64(a, &a_int) && as_int64(b, &b_int) && add_int64(a_int, b_int, &res)) {
+            value = PyLong_FromLongLong(res);
+        }
+        else if (PyFloat_CheckExact(a) && PyFloat_CheckExact(b)) {
+            value = PyFloat_FromDouble(PyFloat_AS_DOUBLE(a) + PyFloat_AS_DOUBLE(b));
+        }
+        else {
+            value = PyNumber_InPlaceAdd(a, b);
+        }
+
+        if (value == NULL) {
+            Py_DECREF(pol2);
+            return NULL;
+        }
+        PyList_SetItem(pol1, i, value);
+    }
+
+    Py_DECREF(pol2);
+    Py_INCREF(pol1);
+    return pol1;
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"horner_evaluate", horner_evaluate, METH_VARARGS, "Compiled kernel of genpo.operations.horner_evaluate"},
+    {"from_roots", from_roots, METH_O, "Compiled kernel of the expansion of genpo.polynomials.from_roots"},
+    {"apply_factor", apply_factor, METH_VARARGS, "Compiled kernel of genpo.operations.apply_factor, for lists"},
+    {"sum_2", sum_2, METH_VARARGS, "Compiled kernel of genpo.operations.sum_2, for lists"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "genpo._speedups",
+    "Optional compiled kernels of genpo.operations and genpo.polynomials",
+    -1,
+    speedups_methods
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    return PyModule_Create(&speedups_module);
+}
@@ -0,0 +1,197 @@
+"""
+    Incremental construction of a polinomy from its roots, with undo and redo.
+
+    A `PolynomialBuilder` keeps the expansion of the monic polinomy with its roots and its highest coefficient, and updates the expansion at every edit instead of expanding all the roots again:
+     - adding a root multiplies the expansion by (x - root)
+     - removing a root divides it by (x - root) with the synthetic division
+     - changing the highest coefficient only replaces it, because the expansion is monic
+
+    So an edit of a root costs O(n) operations, instead of the O(n^2) of `genpo.polynomials.from_roots`, and every edit can be undone and redone at the same cost:
+
+        builder = PolynomialBuilder([1, 1, -2], high_coff=3)
+        builder.add_root(4)
+        builder.set_multiplicity(1, 1)
+        builder.undo()
+        builder.coefficients()
+"""
+
+from collections import Counter, deque
+
+import genpo.operations as ops
+import genpo.polynomials as pols
+from genpo.compact import CompactPolynomial
+
+
+class PolynomialBuilder:
+    """
+    A polinomy built from its roots and its highest coefficient, edited one change at time.
+
+    parameters:
+        - zeroes: list - Optional. The initial roots, int or Fraction. Every root is repeated as many times as its multiplicity
+        - high_coff - The highest coefficient. Can't be 0
+        - max_history: int - Optional. Max number of edits that can be undone. If not passed all the edits are kept
+    """
+
+    def __init__(self, zeroes: list = (), high_coff=1, max_history: int = None):
+        if high_coff == 0:
+            raise ValueError("The highest coefficient can't be 0")
+
+        self._monic = pols.from_roots(list(zeroes))
+        self._roots = Counter(zeroes)
+        self.high_coff = high_coff
+        self._undo = deque(maxlen=max_history)
+        self._redo = []
+
+    @property
+    def grade(self):
+        return len(self._monic) - 1
+
+    @property
+    def zeroes(self):
+        """
+        returns: list - The roots, sorted. Every root is repeated as many times as its multiplicity
+        """
+        return sorted(self._roots.elements())
+
+    def multiplicity(self, zero):
+        """
+        returns: int - The multiplicity of the root, 0 if it isn't a root
+        """
+        return self._roots[zero]
+
+    def coefficients(self, compact: bool = False):
+        """
+        The coefficients of the polinomy, with the highest coefficient applied. Costs O(n)
+
+        parameter: bool - True to return a `CompactPolynomial`
+
+        returns: list - A new list of coefficients. The element at the index i is the cofficient of x^i.
+        """
+        coff = CompactPolynomial.from_coefficients(self._monic) if compact else self._monic[:]
+        ops.apply_factor(coff, self.high_coff)
+        return coff
+
+    def _multiply_root(self, zero):
+        # Multiply in place by (x - zero)
+        coff = self._monic
+        coff.append(coff[-1])
+        for j in range(len(coff) - 2, 0, -1):
+            coff[j] = coff[j - 1] - zero * coff[j]
+        coff[0] = -zero * coff[0]
+
+    def _divide_root(self, zero):
+        quotient, rem = ops.synthetic_division(self._monic, zero)
+        if rem != 0:
+            raise ArithmeticError(f"{zero} is not a root of the expansion")
+        self._monic = quotient
+
+    def _apply(self, changes: tuple, high_coff):
+        """
+        Change the multiplicities of the roots by the deltas of changes, removing the roots before adding the new ones so the expansion stays short, then set the highest coefficient
+        """
+        for zero, delta in sorted(changes, key=lambda change: change[1]):
+            for _ in range(-delta):
+                self._divide_root(zero)
+            for _ in range(delta):
+                self._multiply_root(zero)
+
+            self._roots[zero] += delta
+            if self._roots[zero] == 0:
+                del self._roots[zero]
+
+        self.high_coff = high_coff
+
+    def _edit(self, changes: tuple, high_coff=None):
+        """
+        Apply an edit and record it to be undone
+
+        parameters:
+            - changes: tuple - Pairs (root, delta of its multiplicity)
+            - high_coff - The new highest coefficient. None to keep the current one
+        """
+        changes = tuple((zero, delta) for zero, delta in changes if delta != 0)
+        high_coff = self.high_coff if high_coff == None else high_coff
+        if high_coff == 0:
+            raise ValueError("The highest coefficient can't be 0")
+        for zero, delta in changes:
+            if self._roots[zero] + delta < 0:
+                raise ValueError(f"Can't remove {-delta} times the root {zero}: its multiplicity is {self._roots[zero]}")
+
+        edit = (changes, self.high_coff, high_coff)
+        self._apply(changes, high_coff)
+        self._undo.append(edit)
+        self._redo.clear()
+
+    def add_root(self, zero, multiplicity: int = 1):
+        """Add a root, or increase its multiplicity. Costs O(n) for every multiplicity added"""
+        if multiplicity < 1:
+            raise ValueError(f"The multiplicity must be at least 1. Found {multiplicity}")
+        self._edit(((zero, multiplicity),))
+
+    def remove_root(self, zero, multiplicity: int = 1):
+        """
+        Remove a root, or decrease its multiplicity. Costs O(n) for every multiplicity removed
+
+        raise: ValueError if the multiplicity of the root is less than the one to remove
+        """
+        if multiplicity < 1:
+            raise ValueError(f"The multiplicity must be at least 1. Found {multiplicity}")
+        self._edit(((zero, -multiplicity),))
+
+    def set_multiplicity(self, zero, multiplicity: int):
+        """Set the multiplicity of a root. With 0 the root is removed"""
+        if multiplicity < 0:
+            raise ValueError(f"The multiplicity can't be negative. Found {multiplicity}")
+        self._edit(((zero, multiplicity - self._roots[zero]),))
+
+    def move_root(self, zero, new_zero):
+        """
+        Replace a root with another one with the same multiplicity, in a single edit
+
+        raise: ValueError if zero is not a root
+        """
+        multiplicity = self._roots[zero]
+        if multiplicity == 0:
+            raise ValueError(f"{zero} is not a root")
+        if new_zero != zero:
+            self._edit(((zero, -multiplicity), (new_zero, multiplicity)))
+
+    def set_high_coff(self, high_coff):
+        """Set the highest coefficient. Costs O(1): the expansion is monic"""
+        self._edit((), high_coff)
+
+    def can_undo(self):
+        return len(self._undo) > 0
+
+    def can_redo(self):
+        return len(self._redo) > 0
+
+    def undo(self):
+        """
+        Undo the last edit, at the same cost of the edit
+
+        returns: bool - False if there are no edits to undo
+        """
+        if len(self._undo) == 0:
+            return False
+
+        edit = self._undo.pop()
+        changes, old_high, _ = edit
+        self._apply(tuple((zero, -delta) for zero, delta in changes), old_high)
+        self._redo.append(edit)
+        return True
+
+    def redo(self):
+        """
+        Redo the last edit undone
+
+        returns: bool - False if there are no edits to redo
+        """
+        if len(self._redo) == 0:
+            return False
+
+        edit = self._redo.pop()
+        changes, _, new_high = edit
+        self._apply(changes, new_high)
+        self._undo.append(edit)
+        return True
@@ -0,0 +1,106 @@
+"""
+    Bounded cache of the expansions of roots done by `genpo.polynomials.from_roots`.
+
+    The exercises generated often repeat the same small sets of roots, so the coefficients of a polinomy are cached by its sorted roots and their types. The expansion of the first k sorted roots is cached too, so a new set of roots that shares the first roots with one already expanded multiplies only by the factors of the roots left.
+
+    The cache is disabled by default:
+
+        import genpo.cache
+
+        genpo.cache.configure(enabled=True, maxsize=4096)
+        ...
+        genpo.cache.info()  # {'hits': ..., 'prefix_hits': ..., 'misses': ..., 'size': ..., 'maxsize': ..., 'hit_rate': ...}
+"""
+
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 4096
+
+
+class ExpansionCache:
+    """
+    LRU cache from tuples of sorted pairs (name of the type, root) to the tuple of the coefficients of the polinomy with those roots
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, enabled: bool = False):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.prefix_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def longest_prefix(self, key: tuple):
+        """
+        Search the longest prefix of key that is cached, the whole key first
+
+        returns: tuple - The length of the prefix found, 0 if none, and its coefficients, None if none
+        """
+        entries = self._entries
+        for length in range(len(key), 1, -1):
+            coff = entries.get(key[:length])
+            if coff is not None:
+                entries.move_to_end(key[:length])
+                if length == len(key):
+                    self.hits += 1
+                else:
+                    self.prefix_hits += 1
+                return length, coff
+
+        self.misses += 1
+        return 0, None
+
+    def put(self, key: tuple, coff: tuple):
+        """Cache the coefficients of key, removing the least recently used entry if the cache is full"""
+        entries = self._entries
+        entries[key] = coff
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all the entries and reset the statistics"""
+        self._entries.clear()
+        self.hits = self.prefix_hits = self.misses = 0
+
+    def info(self):
+        """
+        returns: dict - The hits, the partial hits of a prefix, the misses, the size and the max size of the cache, and the rate of the lookups that were full or partial hits
+        """
+        lookups = self.hits + self.prefix_hits + self.misses
+        return {
+            'hits': self.hits,
+            'prefix_hits': self.prefix_hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': (self.hits + self.prefix_hits) / lookups if lookups > 0 else 0.0,
+        }
+
+
+# The cache used by genpo.polynomials.from_roots
+expansion_cache = ExpansionCache()
+
+
+def configure(enabled: bool = True, maxsize: int = None):
+    """
+    Enable or disable the cache of the expansions, and change its max size. The entries over the new max size are removed
+    """
+    expansion_cache.enabled = enabled
+    if maxsize != None:
+        expansion_cache.maxsize = maxsize
+        while len(expansion_cache._entries) > maxsize:
+            expansion_cache._entries.popitem(last=False)
+
+
+def info():
+    """The statistics of the cache. See `ExpansionCache.info()`"""
+    return expansion_cache.info()
+
+
+def clear():
+    """Remove all the cached expansions and reset the statistics"""
+    expansion_cache.clear()
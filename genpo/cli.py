@@ -0,0 +1,166 @@
+"""
+    Command line interface of genpo, installed as the `genpo` command:
+
+        genpo fz-count 4 --zeroes-count 2
+        genpo -n 100000 --seed 1 --format compact pol-1 --multiplicities 1 1 --grade 4 > bank.txt
+
+    The generators are imported only after the arguments are parsed, so `genpo --help` and the errors of the arguments are fast. With `-n` the polynomials are generated in batches and written to stdout one per line.
+    The compact format writes the integer numerators of the coefficients, from x^0, separated by commas, followed by /denominator if it isn't 1: `3,-1,2/4` is 3/4 - 1/4x + 2/4x^2.
+"""
+
+import argparse
+import sys
+
+FORMATS = ['compact', 'plain', 'latex', 'mathml']
+# Polynomies generated and written at a time
+CHUNK_SIZE = 1000
+
+
+def compact_line(numerators, denominator: int):
+    """The line of a polinomy in the compact format"""
+    line = ','.join(map(str, numerators))
+    return line if denominator == 1 else f'{line}/{denominator}'
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog='genpo', description="Generate random polynomials that are simple to solve by hand")
+    parser.add_argument('-n', '--count', type=int, default=1, help="number of polynomials to generate (default 1)")
+    parser.add_argument('--seed', type=int, default=None, help="seed of the random values. The same seed generates the same polynomials")
+    parser.add_argument('--format', choices=FORMATS, default='plain', help="output format, one polynomial per line (default plain)")
+    parser.add_argument('--zeroes', action='store_true', help="write the zeroes after every polynomial, separated by a tab")
+
+    generators = parser.add_subparsers(dest='generator', required=True, metavar='GENERATOR')
+
+    fz_count = generators.add_parser('fz-count', help="polynomial with integer zeroes only (pol_fz_count)")
+    fz_count.add_argument('grade', type=int)
+    fz_count.add_argument('--zeroes-count', type=int, default=None, help="number of distinct zeroes (default: the grade)")
+
+    fz_multiplicities = generators.add_parser('fz-multiplicities', help="polynomial with integer zeroes with the multiplicities passed (pol_fz_multiplicities)")
+    fz_multiplicities.add_argument('multiplicities', type=int, nargs='+')
+
+    pol_1 = generators.add_parser('pol-1', help="polynomial with integer zeroes and factors without zeroes (pol_1)")
+    pol_1.add_argument('--multiplicities', type=int, nargs='+', default=None)
+    pol_1.add_argument('--grade', type=int, default=None)
+
+    pol_2 = generators.add_parser('pol-2', help="polynomial with random grade, zeroes and multiplicities (pol_2)")
+    for name in ('min-grade', 'max-grade', 'min-zeroes', 'max-zeroes', 'min-multiplicity', 'max-multiplicity'):
+        pol_2.add_argument(f'--{name}', type=int, default=None)
+
+    return parser
+
+
+def _batches(args):
+    """
+    The batches of polynomies to write, drawn from the same random generator. The same seed and count always generate the same polynomies
+
+    returns: generator - `PolynomialBatch` of at most `CHUNK_SIZE` polynomies
+    """
+    import genpo.random.polynomials as genpo
+    import genpo.random.values as gens
+
+    if args.generator == 'fz-count':
+        make_batch = lambda n, rng: genpo.pol_fz_count_batch(args.grade, args.zeroes_count, n, rng)
+    elif args.generator == 'fz-multiplicities':
+        make_batch = lambda n, rng: genpo.pol_fz_multiplicities_batch(args.multiplicities, n, rng)
+    else:
+        make_batch = lambda n, rng: genpo.pol_1_batch(args.multiplicities, args.grade, n, rng)
+
+    rng = gens.make_rng(args.seed)
+    for start in range(0, args.count, CHUNK_SIZE):
+        yield make_batch(min(CHUNK_SIZE, args.count - start), rng)
+
+
+def _pol_2_records(args):
+    """
+    returns: generator - The records (numerators, denominator, None) of the polynomies generated by `pol_2`
+    """
+    import random
+
+    import genpo.random.polynomials as genpo
+
+    random.seed(args.seed)
+    for _ in range(args.count):
+        pol = genpo.pol_2(args.min_grade, args.max_grade, args.min_zeroes, args.max_zeroes, args.min_multiplicity, args.max_multiplicity, compact=True)
+        yield pol.numerators, pol.denominator, None
+
+
+def _records(args):
+    """
+    returns: generator - The records (numerators, denominator, zeroes) to write. The numerators and the denominator are coprime
+    """
+    if args.generator == 'pol-2':
+        yield from _pol_2_records(args)
+        return
+
+    from fractions import Fraction
+    from math import gcd
+
+    highs = {}
+    for batch in _batches(args):
+        for coff, high, zeroes in zip(batch.coefficients, batch.high_coffs, batch.zeroes):
+            if high not in highs:
+                high_fraction = Fraction(high)
+                highs[high] = (high_fraction.numerator, high_fraction.denominator)
+            num, den = highs[high]
+
+            numerators = [v * num for v in coff]
+            if den != 1:
+                divisor = gcd(den, *numerators)
+                if divisor != 1:
+                    numerators = [v // divisor for v in numerators]
+                    den //= divisor
+
+            yield numerators, den, zeroes
+
+
+def write(args, out):
+    """Generate the polynomies and write them to out, a line for each one"""
+    if args.format == 'compact':
+        line = compact_line
+    else:
+        import genpo.representation as representation
+        from genpo.compact import CompactPolynomial
+        line = lambda numerators, denominator: representation.render(CompactPolynomial(numerators, denominator), args.format)
+
+    lines = []
+    for numerators, denominator, zeroes in _records(args):
+        if args.zeroes and zeroes != None:
+            lines.append(f"{line(numerators, denominator)}\t{','.join(map(str, sorted(zeroes)))}")
+        else:
+            lines.append(line(numerators, denominator))
+
+        if len(lines) == CHUNK_SIZE:
+            lines.append('')
+            out.write('\n'.join(lines))
+            lines = []
+
+    if len(lines) > 0:
+        lines.append('')
+        out.write('\n'.join(lines))
+
+
+def main(argv=None):
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.generator == 'pol-2' and args.zeroes:
+        # pol_2 doesn't return the zeroes of its polynomies
+        parser.error("--zeroes is not supported by pol-2")
+    if args.count < 0:
+        print("genpo: error: the count can't be negative", file=sys.stderr)
+        return 2
+
+    try:
+        write(args, sys.stdout)
+    except ValueError as e:
+        print(f"genpo: error: {e}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # The reader of the output stopped, like `genpo -n 1000 ... | head`
+        sys.stderr.close()
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
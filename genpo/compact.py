@@ -0,0 +1,139 @@
+"""
+    Compact representation of polynomials with rational coefficients: a common denominator and an array of integer numerators.
+
+    The numerators are kept in an `array.array` of signed 64 bits integers when they fit, so a polinomy uses 8 bytes per coefficient instead of a python object for every `Fraction`, and the numerators can be passed without copies to NumPy or written to a file: `numerators` is the buffer to export, like `numpy.frombuffer(pol.numerators, dtype=numpy.int64)`. If a numerator doesn't fit in 64 bits they are kept in a list of python ints.
+"""
+
+from array import array
+from fractions import Fraction
+from math import gcd, lcm
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def _store(ints: list):
+    """
+    Store the integers in an array of 64 bits integers if they all fit, otherwise in a list
+    """
+    if all(INT64_MIN <= v <= INT64_MAX for v in ints):
+        return array('q', ints)
+
+    return list(ints)
+
+
+class CompactPolynomial:
+    """
+    Polinomy with coefficients numerators[i] / denominator. The element at the index i is the numerator of the cofficient of x^i.
+
+    It behaves as a read only sequence of its coefficients, so it can be used where a list of coefficients is read. The coefficients are int if the denominator is 1, Fraction otherwise.
+    """
+
+    __slots__ = ('numerators', 'denominator')
+
+    def __init__(self, numerators, denominator: int = 1):
+        self._set(numerators, denominator)
+
+    def _set(self, numerators, denominator: int):
+        if denominator == 0:
+            raise ValueError("denominator can't be 0")
+
+        numerators = [int(v) for v in numerators]
+        if denominator < 0:
+            numerators = [-v for v in numerators]
+            denominator = -denominator
+
+        # Keep the fraction reduced
+        common = gcd(denominator, *numerators)
+        if common > 1:
+            numerators = [v // common for v in numerators]
+            denominator //= common
+
+        self.numerators = _store(numerators)
+        self.denominator = denominator
+
+    @classmethod
+    def from_coefficients(cls, coff):
+        """
+        Create a compact polinomy from a list of int and Fraction coefficients. The element at the index i is the cofficient of x^i.
+        """
+        if isinstance(coff, CompactPolynomial):
+            return coff
+
+        den = 1
+        for val in coff:
+            if type(val) is not int:
+                den = lcm(den, val.denominator)
+
+        return cls([val * den for val in coff], den)
+
+    @classmethod
+    def from_buffer(cls, buffer, denominator: int = 1):
+        """
+        Create a compact polinomy from a buffer of 64 bits signed integers, for example the bytes written by `tobytes()` or a NumPy int64 array
+        """
+        numerators = array('q')
+        numerators.frombytes(memoryview(buffer).cast('B'))
+        return cls(numerators, denominator)
+
+    def __len__(self):
+        return len(self.numerators)
+
+    def _value(self, numerator: int):
+        return numerator if self.denominator == 1 else Fraction(numerator, self.denominator)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._value(v) for v in self.numerators[i]]
+
+        return self._value(self.numerators[i])
+
+    def __iter__(self):
+        return (self._value(v) for v in self.numerators)
+
+    def __reversed__(self):
+        return (self._value(v) for v in reversed(self.numerators))
+
+    def __eq__(self, other):
+        if isinstance(other, CompactPolynomial):
+            return self.denominator == other.denominator and list(self.numerators) == list(other.numerators)
+
+        if isinstance(other, list):
+            return self.to_list() == other
+
+        return NotImplemented
+
+    def __repr__(self):
+        return f'CompactPolynomial({list(self.numerators)}, {self.denominator})'
+
+    def to_list(self):
+        """
+        returns: list - The coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+        """
+        return list(self)
+
+    def tobytes(self):
+        """
+        returns: bytes - The numerators as 64 bits signed integers in the machine byte order
+        raise: OverflowError if a numerator doesn't fit in 64 bits
+        """
+        if not isinstance(self.numerators, array):
+            raise OverflowError("the numerators don't fit in 64 bits")
+
+        return self.numerators.tobytes()
+
+    def scale(self, factor):
+        """
+        Multiply in place the polinomy by an int or Fraction factor. Only the numerators are multiplied by the numerator of the factor
+        """
+        factor = Fraction(factor)
+        if factor != 1:
+            self._set([v * factor.numerator for v in self.numerators],
+                      self.denominator * factor.denominator)
+
+
+def as_list(coff):
+    """
+    Return the coefficients of a polinomy as a list, converting a `CompactPolynomial` if needed
+    """
+    return coff.to_list() if isinstance(coff, CompactPolynomial) else coff
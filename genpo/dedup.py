@@ -0,0 +1,336 @@
+"""
+    Indexes of the polynomials already generated, to generate banks without duplicates.
+
+    Every polinomy is reduced to a canonical form and hashed: the coefficients are scaled to coprime integers with the highest one positive, so the polynomies that differ only by the highest coefficient drawn by `genpo.random.values.rand_high_coff()`, or by how the fractions are written, have the same hash. The hashes are kept in a `SetIndex`, exact, or in a `BloomIndex`, of fixed size but with a small rate of false duplicates. Both can be saved to a file and loaded back with `load_index()`.
+
+        index = SetIndex()
+        for coff in generate_unique(genpo.pol_fz_count, 1000, index, grade=4):
+            ...
+        index.stats()  # {'size': ..., 'checked': ..., 'duplicates': ..., 'rejection_rate': ..., ...}
+
+    The rate of duplicates of the last checks tells when the polynomies of a generator with some parameters are close to be all generated.
+"""
+
+import hashlib
+import struct
+from abc import ABC, abstractmethod
+from collections import deque
+from math import ceil, exp, gcd, log
+
+from genpo.compact import CompactPolynomial
+
+# Bytes of the hash of a polinomy
+HASH_SIZE = 16
+# Number of last checks used for the recent rejection rate
+RECENT_WINDOW = 1000
+# Consecutive duplicates after which the generators stop
+DEFAULT_MAX_REJECTIONS = 1000
+
+MAGIC = b'GENPODDX'
+VERSION = 1
+# Magic, version, kind of index, flags, number of hashes of the Bloom filter, number of polynomies, number of bits of the Bloom filter
+FILE_HEADER = struct.Struct('<8sIIIIQQ')
+
+KIND_SET = 0
+KIND_BLOOM = 1
+FLAG_SCALE_INVARIANT = 1
+
+
+def canonical(coff, scale_invariant: bool = True):
+    """
+    The canonical form of a polinomy: its coefficients scaled to integers, without the zeroes of the highest grades.
+
+    parameters:
+        - coff - List of int or Fraction coefficients, or a `CompactPolynomial`. The element at the index i is the cofficient of x^i.
+        - scale_invariant: bool - True to divide the coefficients by their greatest common divisor, with the highest one positive, so the polynomies multiple of each other have the same form. Else the common denominator is the first element of the form
+
+    returns: tuple[int] - The canonical form
+    """
+    if isinstance(coff, CompactPolynomial):
+        nums, den = list(coff.numerators), coff.denominator
+    elif all(type(val) is int for val in coff):
+        nums, den = coff, 1
+    else:
+        compact = CompactPolynomial.from_coefficients(coff)
+        nums, den = list(compact.numerators), compact.denominator
+
+    high = len(nums)
+    while high > 0 and nums[high - 1] == 0:
+        high -= 1
+
+    if not scale_invariant:
+        return (den, *nums[:high])
+
+    if high == 0:
+        return ()
+
+    divisor = gcd(*nums[:high])
+    if nums[high - 1] < 0:
+        divisor = -divisor
+    return tuple(val // divisor for val in nums[:high])
+
+
+def canonical_hash(coff, scale_invariant: bool = True):
+    """
+    returns: bytes - The hash of `HASH_SIZE` bytes of the canonical form of the polinomy. See `canonical()`
+    """
+    return hashlib.blake2b(','.join(map(str, canonical(coff, scale_invariant))).encode(), digest_size=HASH_SIZE).digest()
+
+
+class DedupIndex(ABC):
+    """
+    Base class of the indexes. Keeps the statistics of the checks. The subclasses store the hashes
+    """
+    kind = None
+
+    def __init__(self, scale_invariant: bool = True):
+        self.scale_invariant = scale_invariant
+        self.checked = 0
+        self.duplicates = 0
+        self._recent = deque(maxlen=RECENT_WINDOW)
+        self._recent_duplicates = 0
+
+    def add(self, coff):
+        """
+        Add a polinomy to the index
+
+        returns: bool - True if the polinomy is new, False if it's a duplicate
+        """
+        new = self.add_hash(canonical_hash(coff, self.scale_invariant))
+
+        self.checked += 1
+        duplicate = 0 if new else 1
+        self.duplicates += duplicate
+        if len(self._recent) == RECENT_WINDOW:
+            self._recent_duplicates -= self._recent[0]
+        self._recent.append(duplicate)
+        self._recent_duplicates += duplicate
+
+        return new
+
+    def __contains__(self, coff):
+        return self.contains_hash(canonical_hash(coff, self.scale_invariant))
+
+    @abstractmethod
+    def __len__(self):
+        """The number of polynomies in the index"""
+
+    @abstractmethod
+    def add_hash(self, key: bytes):
+        """
+        Add the hash of a polinomy
+
+        returns: bool - True if the hash is new
+        """
+
+    @abstractmethod
+    def contains_hash(self, key: bytes):
+        """True if the hash is in the index"""
+
+    @abstractmethod
+    def collision_rate(self):
+        """The probability that a new polinomy is taken as a duplicate"""
+
+    def stats(self):
+        """
+        returns: dict - The number of polynomies in the index, of checks and of duplicates found, the rate of duplicates of all the checks and of the last `RECENT_WINDOW` ones, and the probability that a new polinomy is taken as a duplicate
+        """
+        return {
+            'size': len(self),
+            'checked': self.checked,
+            'duplicates': self.duplicates,
+            'rejection_rate': self.duplicates / self.checked if self.checked > 0 else 0.0,
+            'recent_rejection_rate': self._recent_duplicates / len(self._recent) if len(self._recent) > 0 else 0.0,
+            'collision_rate': self.collision_rate(),
+        }
+
+    def _header(self, hashes: int, count: int, bits: int):
+        return FILE_HEADER.pack(MAGIC, VERSION, self.kind, FLAG_SCALE_INVARIANT if self.scale_invariant else 0, hashes, count, bits)
+
+
+class SetIndex(DedupIndex):
+    """
+    Exact index, that keeps the hashes of all the polynomies. Uses about 100 bytes for every polinomy
+    """
+    kind = KIND_SET
+
+    def __init__(self, scale_invariant: bool = True):
+        super().__init__(scale_invariant)
+        self._hashes = set()
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def add_hash(self, key: bytes):
+        if key in self._hashes:
+            return False
+        self._hashes.add(key)
+        return True
+
+    def contains_hash(self, key: bytes):
+        return key in self._hashes
+
+    def collision_rate(self):
+        # Probability that a new hash is equal to one of the hashes in the index
+        return len(self._hashes) / 2 ** (8 * HASH_SIZE)
+
+    def save(self, path):
+        """Write the hashes to a file, sorted. See `load_index()`"""
+        with open(path, 'wb') as file:
+            file.write(self._header(0, len(self._hashes), 0))
+            file.write(b''.join(sorted(self._hashes)))
+
+
+class BloomIndex(DedupIndex):
+    """
+    Bloom filter of the hashes: uses a fixed number of bits, but a new polinomy is taken as a duplicate with a small probability, that grows with the number of polynomies added
+
+    parameters:
+        - capacity: int - Number of polynomies expected
+        - error_rate: float - Probability of a false duplicate when the index has `capacity` polynomies
+        - scale_invariant: bool - See `canonical()`
+    """
+    kind = KIND_BLOOM
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001, scale_invariant: bool = True):
+        super().__init__(scale_invariant)
+        self.bits = max(8, ceil(-capacity * log(error_rate) / log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * log(2)))
+        self.count = 0
+        self._filter = bytearray((self.bits + 7) // 8)
+
+    @classmethod
+    def _from_filter(cls, bits: int, hashes: int, count: int, filter: bytearray, scale_invariant: bool):
+        """The index with the filter passed, without allocating a new one. Used by `load_index()`"""
+        index = cls.__new__(cls)
+        DedupIndex.__init__(index, scale_invariant)
+        index.bits, index.hashes, index.count, index._filter = bits, hashes, count, filter
+        return index
+
+    def __len__(self):
+        return self.count
+
+    def _positions(self, key: bytes):
+        # Double hashing: the positions are h1 + i * h2
+        h1 = int.from_bytes(key[:8], 'little')
+        h2 = int.from_bytes(key[8:16], 'little') | 1
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in range(self.hashes)]
+
+    def add_hash(self, key: bytes):
+        filter = self._filter
+        new = False
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not filter[pos >> 3] & mask:
+                filter[pos >> 3] |= mask
+                new = True
+
+        if new:
+            self.count += 1
+        return new
+
+    def contains_hash(self, key: bytes):
+        filter = self._filter
+        return all(filter[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def collision_rate(self):
+        return (1 - exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def save(self, path):
+        """Write the bits of the filter to a file. See `load_index()`"""
+        with open(path, 'wb') as file:
+            file.write(self._header(self.hashes, self.count, self.bits))
+            file.write(self._filter)
+
+
+def load_index(path):
+    """
+    Load an index saved with `SetIndex.save()` or `BloomIndex.save()`. The statistics of the checks start from 0
+
+    returns: SetIndex | BloomIndex - The index
+    raise: ValueError if the file is not an index
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+
+    if len(data) < FILE_HEADER.size:
+        raise ValueError(f"{path} is not an index of polynomies")
+
+    magic, version, kind, flags, hashes, count, bits = FILE_HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not an index of polynomies, or has an unsupported version")
+
+    body = memoryview(data)[FILE_HEADER.size:]
+    scale_invariant = bool(flags & FLAG_SCALE_INVARIANT)
+
+    if kind == KIND_SET:
+        if len(body) < count * HASH_SIZE:
+            raise ValueError(f"The hashes in {path} are truncated")
+        index = SetIndex(scale_invariant)
+        index._hashes = {bytes(body[i:i + HASH_SIZE]) for i in range(0, count * HASH_SIZE, HASH_SIZE)}
+    elif kind == KIND_BLOOM:
+        if len(body) < (bits + 7) // 8:
+            raise ValueError(f"The Bloom filter in {path} is truncated")
+        index = BloomIndex._from_filter(bits, hashes, count, bytearray(body[:(bits + 7) // 8]), scale_invariant)
+    else:
+        raise ValueError(f"Unknown kind of index {kind} in {path}")
+
+    return index
+
+
+def unique_records(records, index: DedupIndex = None, max_rejections: int = DEFAULT_MAX_REJECTIONS):
+    """
+    Skip the records with polynomies already in the index, and add the others. Can be chained with the `iter_` generators of `genpo.random.polynomials`
+
+    parameters:
+        - records: iterable - Tuples (coefficients, zeroes)
+        - index: DedupIndex - Optional. The index of the polynomies already generated. If not passed a new `SetIndex`
+        - max_rejections: int - Stop after this many consecutive duplicates. None to never stop
+
+    returns: generator - The records with new polynomies
+    raise: ValueError when max_rejections consecutive duplicates are found, because almost all the polynomies with the parameters of the generator were already generated
+    """
+    index = SetIndex() if index == None else index
+    rejections = 0
+
+    for record in records:
+        if index.add(record[0]):
+            rejections = 0
+            yield record
+            continue
+
+        rejections += 1
+        if max_rejections != None and rejections >= max_rejections:
+            raise ValueError(
+                f"Found {rejections} duplicates in a row: the polynomies with these parameters are almost exhausted")
+
+
+def generate_unique(generator, count: int, index: DedupIndex = None, max_rejections: int = DEFAULT_MAX_REJECTIONS, **params):
+    """
+    Generate `count` polynomies not in the index, calling the generator with the params passed, and add them to the index
+
+    parameters:
+        - generator - A generator of `genpo.random.polynomials`, like `pol_fz_count`
+        - count: int - Number of polynomies to generate
+        - index, max_rejections - See `unique_records()`
+        - params - Parameters passed to the generator
+
+    returns: generator - The coefficients of the new polynomies
+    raise: ValueError if the polynomies with the parameters passed are almost exhausted. See `unique_records()`
+    """
+    if count <= 0:
+        return
+
+    generated = 0
+    for coff, _ in unique_records(_endless(generator, params), index, max_rejections):
+        yield coff
+        generated += 1
+        if generated == count:
+            return
+
+
+def _endless(generator, params: dict):
+    """The records of the polynomies generated calling the generator forever"""
+    while True:
+        yield generator(**params), None
@@ -0,0 +1,233 @@
+"""
+    Opt-in instrumentation of the stages of the generation of polynomials.
+
+    When enabled, the functions of the stages (root sampling, expansion of roots, operations, generators) are replaced in their modules by wrappers that record for every stage:
+     - the number of calls and of calls rejected with an exception (invalid parameters: since the generators sample without retries this is the only rejection left)
+     - an histogram of the time of the calls
+     - an histogram of the degree and of the bits of the biggest coefficient of the polynomies returned, for the stages in `POLYNOMIAL_STAGES`
+
+    The generators of `genpo.parallel.GENERATORS` keep their own references to the functions, so they are replaced by the wrappers too. Only the calls in the current process are recorded: the chunks generated in the worker processes of `genpo.parallel` and `genpo.service` are not.
+
+    When disabled the original functions are restored, so there is no overhead at all.
+
+        import genpo.instrument as instrument
+
+        with instrument.instrumented():
+            genpo.random.polynomials.pol_fz_count(5)
+        instrument.summary()
+
+    `profile()` is a context manager that runs the code inside it under `cProfile`.
+"""
+
+import cProfile
+import importlib
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from genpo.compact import CompactPolynomial
+
+# Functions instrumented, by module
+STAGES = {
+    'genpo.random.roots': ['generate_zeroes', 'generate_multiplicities', 'sample_multiplicities', 'generate_zeroes_with_multiplicity', 'generate_zeroes_batch'],
+    'genpo.random.values': ['rand_high_coff', 'rand_high_coff_batch'],
+    'genpo.polynomials': ['from_roots', 'from_roots_tree', 'from_roots_batch'],
+    'genpo.operations': ['sum', 'multiply', 'multiply_2', 'apply_factor', 'horner_evaluate', 'evaluate_many'],
+    'genpo.random.polynomials': ['pol_fz_multiplicities_base', 'pol_fz_multiplicities', 'pol_fz_count', 'parabola_no_zeroes', 'pol_1', 'pol_2',
+                                 'pol_fz_count_batch', 'pol_fz_multiplicities_batch', 'pol_1_batch', 'pol_2_batch'],
+}
+
+# Functions of `STAGES` that return a polinomy, the only ones with the histograms of the degree and of the coefficients
+POLYNOMIAL_STAGES = {
+    'genpo.polynomials.from_roots', 'genpo.polynomials.from_roots_tree',
+    'genpo.operations.sum', 'genpo.operations.multiply', 'genpo.operations.multiply_2',
+    'genpo.random.polynomials.pol_fz_multiplicities_base', 'genpo.random.polynomials.pol_fz_multiplicities', 'genpo.random.polynomials.pol_fz_count',
+    'genpo.random.polynomials.parabola_no_zeroes', 'genpo.random.polynomials.pol_1', 'genpo.random.polynomials.pol_2',
+}
+
+# The original functions replaced, by (module, name)
+_originals = {}
+# The original functions replaced in `genpo.parallel.GENERATORS`, by name
+_generators = {}
+_stats = {}
+
+
+class _StageStats:
+    __slots__ = ('calls', 'rejections', 'total_ns', 'times', 'degrees', 'coff_bits')
+
+    def __init__(self):
+        self.calls = 0
+        self.rejections = 0
+        self.total_ns = 0
+        self.times = {}
+        self.degrees = {}
+        self.coff_bits = {}
+
+    def snapshot(self):
+        return {
+            'calls': self.calls,
+            'rejections': self.rejections,
+            'total_ns': self.total_ns,
+            'time_histogram_ns': _histogram_labels(self.times),
+            'degree_histogram': dict(sorted(self.degrees.items())),
+            'coefficient_bits_histogram': _histogram_labels(self.coff_bits),
+        }
+
+
+def _histogram_labels(histogram: dict):
+    """Label the log2 buckets with their upper bound"""
+    return {f'<{1 << bucket}': count for bucket, count in sorted(histogram.items())}
+
+
+def _coff_bits(coff):
+    """Bits of the biggest numerator of the coefficients"""
+    if isinstance(coff, CompactPolynomial):
+        values = coff.numerators
+    else:
+        values = [v if type(v) is int else getattr(v, 'numerator', 0) for v in coff]
+    return max((abs(int(v)).bit_length() for v in values), default=0)
+
+
+def _record_result(stats: _StageStats, res):
+    if len(res) > 0:
+        degree = len(res) - 1
+        stats.degrees[degree] = stats.degrees.get(degree, 0) + 1
+        bucket = _coff_bits(res).bit_length()
+        stats.coff_bits[bucket] = stats.coff_bits.get(bucket, 0) + 1
+
+
+def _wrap(name: str, fun):
+    stats = _stats.setdefault(name, _StageStats())
+    returns_polynomial = name in POLYNOMIAL_STAGES
+
+    @wraps(fun)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            res = fun(*args, **kwargs)
+        except Exception:
+            stats.rejections += 1
+            raise
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            stats.calls += 1
+            stats.total_ns += elapsed
+            bucket = elapsed.bit_length()
+            stats.times[bucket] = stats.times.get(bucket, 0) + 1
+
+        if returns_polynomial:
+            _record_result(stats, res)
+        return res
+
+    return wrapper
+
+
+def is_enabled():
+    return len(_originals) > 0
+
+
+def enable(stages: dict = None):
+    """
+    Start recording the stages. Does nothing if already enabled
+
+    parameter: dict - Optional. The functions to instrument by module name, like `STAGES`. If not passed all `STAGES` are instrumented
+    """
+    if is_enabled():
+        return
+
+    for module_name, names in (STAGES if stages == None else stages).items():
+        module = importlib.import_module(module_name)
+        for name in names:
+            _originals[(module, name)] = getattr(module, name)
+
+    _install()
+
+
+def _install():
+    """Replace the original functions with new wrappers, in their modules and in `genpo.parallel.GENERATORS`"""
+    from genpo.parallel import GENERATORS
+
+    wrappers = {}
+    for (module, name), fun in _originals.items():
+        wrappers[fun] = _wrap(f'{module.__name__}.{name}', fun)
+        setattr(module, name, wrappers[fun])
+
+    for name, fun in GENERATORS.items():
+        fun = _generators.get(name, fun)
+        if fun in wrappers:
+            _generators[name] = fun
+            GENERATORS[name] = wrappers[fun]
+
+
+def disable():
+    """
+    Stop recording and restore the original functions. The statistics recorded are kept until `reset()`
+    """
+    for (module, name), fun in _originals.items():
+        setattr(module, name, fun)
+    _originals.clear()
+
+    if len(_generators) > 0:
+        from genpo.parallel import GENERATORS
+        GENERATORS.update(_generators)
+        _generators.clear()
+
+
+def reset():
+    """Delete the statistics recorded"""
+    for name in list(_stats):
+        _stats[name] = _StageStats()
+
+    # The wrappers keep a reference to their stats, so replace them if enabled
+    if is_enabled():
+        _install()
+
+
+@contextmanager
+def instrumented(stages: dict = None):
+    """Context manager that enables the instrumentation inside it"""
+    was_enabled = is_enabled()
+    enable(stages)
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def snapshot():
+    """
+    returns: dict - The statistics of every stage called at least once, by name of the function. Can be serialized as JSON
+    """
+    return {name: stats.snapshot() for name, stats in _stats.items() if stats.calls > 0}
+
+
+def summary(file=None):
+    """
+    Print a table with the calls, rejections, total and mean time of every stage, sorted by total time
+    """
+    file = sys.stdout if file == None else file
+    rows = sorted(((name, stats) for name, stats in _stats.items() if stats.calls > 0),
+                  key=lambda row: row[1].total_ns, reverse=True)
+
+    print(f"{'stage':55} {'calls':>10} {'rejections':>10} {'total ms':>10} {'mean us':>10}", file=file)
+    for name, stats in rows:
+        print(f"{name:55} {stats.calls:>10} {stats.rejections:>10} {stats.total_ns / 1e6:>10.2f} {stats.total_ns / stats.calls / 1e3:>10.2f}", file=file)
+
+
+@contextmanager
+def profile(sort: str = 'cumulative', limit: int = 30, file=None):
+    """
+    Context manager that profiles the code inside it with `cProfile`, and prints the `limit` top functions sorted by `sort` when it exits
+
+    returns: cProfile.Profile - The profiler, to save or inspect the stats
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        pstats.Stats(profiler, stream=sys.stdout if file == None else file).sort_stats(sort).print_stats(limit)
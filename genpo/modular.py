@@ -0,0 +1,292 @@
+"""
+    Multi-prime modular backend for the expansion and the multiplication of polynomials of high degree.
+
+    The integer coefficients of the result are computed modulo many primes of 31 bits, with NumPy int64 vectors, then rebuilt exactly with the Chinese remainder theorem. The primes are chosen so that their product is more than twice a bound of the coefficients, computed from the roots or the factors, so the result is always exact. For every prime the polinomy is computed in the points that are powers of a root of unity modulo the prime, and its coefficients are taken back with an inverse number theoretic transform, so the cost is O(n log n) operations on small integers for every prime, instead of O(n^2) operations on big integers.
+
+        import genpo.modular as modular
+        coff = modular.from_roots([1, -2, 3] * 1000)  # Same as genpo.polynomials.from_roots
+
+    `genpo.polynomials.from_roots` and `genpo.operations.multiply` use this backend when NumPy is installed and the result is long enough: see `genpo.polynomials.FROM_ROOTS_MODULAR_THRESHOLD` and `genpo.operations.MODULAR_THRESHOLD`.
+"""
+
+from collections import Counter
+from fractions import Fraction
+from math import prod
+
+from genpo._optional import numpy
+
+# The primes are all p < 2^31 with p - 1 multiple of 2^MAX_LENGTH_BITS, so the products of two residues fit in int64 and there are roots of unity of every order up to MAX_LENGTH
+MAX_LENGTH_BITS = 16
+MAX_LENGTH = 1 << MAX_LENGTH_BITS
+PRIME_LIMIT = 1 << 31
+# Max number of tables of the values of the factors, one for every prime and distinct root, for each coefficient of the expansion. Over it the tables cost more time and memory than the expansion with big integers
+MAX_FACTOR_TABLES = 1
+
+_primes = []
+_next_candidate = (PRIME_LIMIT - 1) >> MAX_LENGTH_BITS
+
+
+def _is_prime(n: int):
+    """Deterministic Miller-Rabin test, valid for n < 4759123141"""
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7, 61):
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in (2, 7, 61):
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def primes(count: int):
+    """
+    The first primes used by the backend, from the greatest. They are found at the first use and kept
+
+    returns: list[int] - The primes
+    raise: ValueError if there aren't enough primes of 31 bits with the roots of unity needed
+    """
+    global _next_candidate
+    while len(_primes) < count and _next_candidate > 0:
+        candidate = (_next_candidate << MAX_LENGTH_BITS) + 1
+        _next_candidate -= 1
+        if _is_prime(candidate):
+            _primes.append(candidate)
+
+    if len(_primes) < count:
+        raise ValueError(f"The coefficients need {count} primes, but only {len(_primes)} are available")
+
+    return _primes[:count]
+
+
+def moduli(bound: int):
+    """
+    returns: list[int] - The fewest primes whose product is more than twice the bound, so the coefficients in [-bound, bound] can be rebuilt from their residues
+    raise: ValueError if the bound is too big for the primes available
+    """
+    # Every prime is greater than 2^30
+    return primes(max(1, (2 * bound).bit_length() // 30 + 1))
+
+
+def _roots_of_unity(ps, length: int):
+    """
+    returns: numpy.ndarray - For every prime p, the powers w^0, ... w^(length - 1) modulo p of a root of unity w of order `length`. A row for every prime
+    """
+    np = numpy()
+    ws = []
+    for p in ps:
+        # A quadratic non residue raised to (p - 1) / length has order length
+        r = 2
+        while pow(r, (p - 1) // 2, p) != p - 1:
+            r += 1
+        ws.append(pow(r, (p - 1) // length, p))
+
+    p = np.array(ps, dtype=np.int64)[:, None]
+    table = np.ones((len(ps), length), dtype=np.int64)
+    step = np.array(ws, dtype=np.int64)[:, None]
+    size = 1
+    while size < length:
+        table[:, size:2 * size] = table[:, :size] * step % p
+        step = step * step % p
+        size *= 2
+
+    return table
+
+
+def _transform(values, ps, powers):
+    """
+    Number theoretic transform of the rows of values, the row i modulo ps[i]. With the powers of w it's the evaluation of the polynomies in the powers of w, with the powers of 1 / w it's the inverse, without the division by the length
+
+    parameters:
+        - values: numpy.ndarray - A row for every prime, with length a power of 2
+        - ps: numpy.ndarray - The primes, a column
+        - powers: numpy.ndarray - The powers of the root of unity of every prime, a row for every prime. See `_roots_of_unity()`
+
+    returns: numpy.ndarray - The transformed rows
+    """
+    np = numpy()
+    k, length = values.shape
+    p = ps[:, :, None]
+
+    # Iterative Cooley-Tukey: the column j of a level is the transform of the values with index congruent to j modulo the number of columns
+    res = values.reshape(k, 1, length)
+    while res.shape[1] < length:
+        half = res.shape[2] // 2
+        even = res[:, :, :half]
+        odd = res[:, :, half:]
+        twiddles = powers[:, ::length // (2 * res.shape[1])][:, :res.shape[1], None]
+        odd = twiddles * odd % p
+        res = np.concatenate(((even + odd) % p, (even - odd) % p), axis=1)
+
+    return res.reshape(k, length)
+
+
+def _inverse_powers(powers):
+    """The powers of 1 / w from the powers of w: w^-i = w^(length - i)"""
+    np = numpy()
+    return np.concatenate((powers[:, :1], powers[:, :0:-1]), axis=1)
+
+
+def _interpolate(values, ps, powers, count: int):
+    """
+    returns: numpy.ndarray - The first count coefficients of the polynomies modulo the primes whose values in the powers of w are the rows of values
+    """
+    np = numpy()
+    length = values.shape[1]
+    res = _transform(values, ps, _inverse_powers(powers))[:, :count]
+    inverses = np.array([pow(length, -1, int(p)) for p in ps[:, 0]], dtype=np.int64)[:, None]
+    return res * inverses % ps
+
+
+def _residues(pol: list, ps: list):
+    """
+    returns: numpy.ndarray - The integer coefficients modulo the primes, a row for every prime
+    """
+    np = numpy()
+    try:
+        ints = np.array(pol, dtype=np.int64)
+    except OverflowError:
+        ints = None
+
+    if ints is not None:
+        return ints[None, :] % np.array(ps, dtype=np.int64)[:, None]
+
+    objects = np.array(pol, dtype=object)
+    return np.array([(objects % p).astype(np.int64) for p in ps])
+
+
+def crt(residues, ps: list):
+    """
+    Rebuild the integers from their residues modulo the primes, merging the primes two at time in a tree. The first level is done in int64, the others with python ints
+
+    parameters:
+        - residues: numpy.ndarray - The residues, a row for every prime
+        - ps: list - The primes
+
+    returns: list[int] - The integers in [-M/2, M/2), where M is the product of the primes
+    """
+    np = numpy()
+    values = residues
+    mods = list(ps)
+
+    while len(mods) > 1:
+        pairs = len(mods) // 2
+        low, high = values[0:2 * pairs:2], values[1:2 * pairs:2]
+        m1, m2 = mods[0:2 * pairs:2], mods[1:2 * pairs:2]
+        inverses = [pow(a, -1, b) for a, b in zip(m1, m2)]
+
+        if values.dtype == np.int64:
+            col = lambda vals: np.array(vals, dtype=np.int64)[:, None]
+        else:
+            col = lambda vals: np.array(vals, dtype=object)[:, None]
+
+        m1c, m2c = col(m1), col(m2)
+        # x = low + m1 * ((high - low) / m1 mod m2)
+        merged = low + m1c * ((high - low) % m2c * col(inverses) % m2c)
+        if values.dtype == np.int64:
+            merged = merged.astype(object)
+
+        next_mods = [a * b for a, b in zip(m1, m2)]
+        if len(mods) % 2 != 0:
+            merged = np.concatenate((merged, values[-1:].astype(object)))
+            next_mods.append(mods[-1])
+
+        values, mods = merged, next_mods
+
+    modulus = mods[0]
+    half = modulus // 2
+    return [int(v) - modulus if v >= half else int(v) for v in values[0].tolist()]
+
+
+def from_roots(zeroes: list):
+    """
+    Same as `genpo.polynomials.from_roots`, with the modular backend. The roots must be int or Fraction: the polinomy is expanded as the product of the integer factors (den * x - num), then divided by the product of the denominators
+
+    parameter: list - List of int or Fraction roots. If a root has a multiplicity of m, it will appear m times in the list
+
+    returns: list - The coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+    raise: ValueError if the degree is at least `MAX_LENGTH`, the coefficients are too big, or there are too many distinct roots for the primes needed. See `MAX_FACTOR_TABLES`
+    """
+    np = numpy()
+    n = len(zeroes) + 1
+    if n > MAX_LENGTH:
+        raise ValueError(f"The degree must be less than {MAX_LENGTH}. Found {n - 1}")
+
+    factors = Counter()
+    for zero, mul in Counter(zeroes).items():
+        zero = Fraction(zero)
+        factors[zero.denominator, zero.numerator] += mul
+    bound = prod((den + abs(num)) ** mul for (den, num), mul in factors.items())
+    ps = moduli(bound)
+    if len(ps) * len(factors) > MAX_FACTOR_TABLES * n:
+        raise ValueError(
+            f"Too many distinct roots for the modular backend: {len(factors)} roots need {len(ps)} primes for a polinomy of degree {n - 1}")
+
+    length = 1
+    while length < n:
+        length *= 2
+
+    p = np.array(ps, dtype=np.int64)[:, None]
+    powers = _roots_of_unity(ps, length)
+
+    # The numerators and the denominators are reduced with python ints, because they can be bigger than int64
+    residue = lambda val: np.array([val % q for q in ps], dtype=np.int64)[:, None]
+
+    # The values of the polinomy in the powers of w are the products of the powers of the values of its factors. The powers are computed all together, squaring the product once for every bit of the multiplicities
+    bases = [((powers * residue(den) - residue(num)) % p, mul) for (den, num), mul in factors.items()]
+    values = np.ones((len(ps), length), dtype=np.int64)
+    for bit in reversed(range(max(factors.values(), default=0).bit_length())):
+        values = values * values % p
+        for base, mul in bases:
+            if mul >> bit & 1:
+                values = values * base % p
+
+    coff = crt(_interpolate(values, p, powers, n), ps)
+
+    high = prod(den ** mul for (den, _), mul in factors.items())
+    return coff if high == 1 else [Fraction(val, high) for val in coff]
+
+
+def multiply(*pols: list):
+    """
+    Multiply polynomies with integer coefficients with the modular backend. The bound of the coefficients of the product is the product of the sums of the absolute values of the coefficients of the factors
+
+    returns: list[int] - The coefficients of the product
+    raise: ValueError if the product has length more than `MAX_LENGTH` or its coefficients are too big
+    """
+    np = numpy()
+    n = sum(len(pol) for pol in pols) - len(pols) + 1
+    if n > MAX_LENGTH:
+        raise ValueError(f"The product must have length at most {MAX_LENGTH}. Found {n}")
+
+    ps = moduli(prod(sum(abs(val) for val in pol) for pol in pols))
+
+    length = 1
+    while length < n:
+        length *= 2
+
+    p = np.array(ps, dtype=np.int64)[:, None]
+    powers = _roots_of_unity(ps, length)
+
+    values = None
+    for pol in pols:
+        rows = np.zeros((len(ps), length), dtype=np.int64)
+        rows[:, :len(pol)] = _residues(pol, ps)
+        transformed = _transform(rows, p, powers)
+        values = transformed if values is None else values * transformed % p
+
+    return crt(_interpolate(values, p, powers, n), ps)
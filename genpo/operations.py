@@ -1,19 +1,38 @@
 """
     Operations with polynomials:
      - sum
-     - multiplication
+     - multiplication (schoolbook, Karatsuba, Kronecker substitution or modulo many primes, chosen by size)
      - multiplication by a factor
      - evaluation of the polinomomy and its derivative in one point
+     - synthetic division by (x - r)
+     - long division, derivative, greatest common divisor and square-free decomposition
+     - evaluation of the polinomomy in many points, vectorized or exact
 """
 
+from fractions import Fraction
 from functools import reduce
+from math import gcd as int_gcd
+from math import lcm, prod
+from numbers import Rational
+
+import genpo.modular as modular
+from genpo._optional import numpy, numpy_if_imported, speedups
+from genpo.compact import CompactPolynomial, as_list
+
+# The compiled kernels of the hottest functions, or None to use only python. They return the same results of the python code
+_speedups = speedups()
 
 
 def apply_factor(coffs: list, factor):
     """
     Multiply in place a polinomy by a factor
     """
-    if factor != 1:
+    if isinstance(coffs, CompactPolynomial):
+        coffs.scale(factor)
+    elif factor != 1:
+        if _speedups is not None and type(coffs) is list:
+            _speedups.apply_factor(coffs, factor)
+            return
         for i, val in enumerate(coffs):
             coffs[i] = val * factor
 
@@ -27,45 +46,268 @@ def sort_by_grade(*pols: list):
     sorted_pols.sort(key=lambda l: len(l), reverse=True)
     return sorted_pols
 
+# Alias used by functions that have a parameter named sort_by_grade
+_sort_by_grade = sort_by_grade
+
 def sum_2(pol1: list, pol2: list):
     """
     Sum two polynomies, using the first to save the results
 
     raise: IndexError if pol1 len is less than pol2
     """
+    if _speedups is not None and type(pol1) is list:
+        return _speedups.sum_2(pol1, pol2)
+
     for i in range(len(pol2)):
         pol1[i] += pol2[i]
 
     return pol1
 
+def _any_compact(pols):
+    return any(isinstance(pol, CompactPolynomial) for pol in pols)
+
+def _compact_numerators(pols):
+    """
+    Convert the polynomies to compact ones
+
+    returns: tuple - The lists of numerators of the polynomies, and their denominators
+    """
+    compacts = [CompactPolynomial.from_coefficients(pol) for pol in pols]
+    return [list(pol.numerators) for pol in compacts], [pol.denominator for pol in compacts]
+
 def sum(*pols: list, sort_by_grade=True):
     """
-        Sum the polynomies passed. They must be sorted by grade to be summed, so if already sorted, pass False to sort_by_grade to reduce useless computation
+        Sum the polynomies passed. They must be sorted by grade to be summed, so if already sorted, pass False to sort_by_grade to reduce useless computation.
+        If one of the polynomies is a `CompactPolynomial`, the sum is done on the integer numerators and a `CompactPolynomial` is returned
     """
+    if _any_compact(pols):
+        numerators, dens = _compact_numerators(pols)
+        den = lcm(*dens)
+        scaled = [[v * (den // d) for v in nums] for nums, d in zip(numerators, dens)]
+        return CompactPolynomial(sum(*scaled, sort_by_grade=sort_by_grade), den)
+
     if sort_by_grade:
-        sorted = sort_by_grade(*pols)
+        sorted = _sort_by_grade(*pols)
         return reduce(sum_2, sorted[1:], sorted[0][:])
     else:
         return reduce(sum_2, pols[1:], pols[0][:])
 
+# Length of the shortest factor under which multiply_2 uses the schoolbook algorithm
+KARATSUBA_THRESHOLD = 48
+# Length of the shortest factor from which int and Fraction polynomials are multiplied with Kronecker substitution
+KRONECKER_THRESHOLD = 32
+# Length of the product from which int and Fraction polynomials are multiplied with `genpo.modular`, if NumPy is installed
+MODULAR_THRESHOLD = 1024
+
+
+def _schoolbook(pol1: list, pol2: list):
+    """
+    Multiply two polynomies with the schoolbook algorithm, writing directly in the result list without creating intermediate polynomies
+    """
+    res = [0] * (len(pol1) + len(pol2) - 1)
+    for j, coff in enumerate(pol2):
+        if coff != 0:
+            for i, val in enumerate(pol1, j):
+                res[i] += val * coff
+
+    return res
+
+
+def _add_shifted(res: list, pol: list, shift: int):
+    """
+    Sum in place to res the polynomy pol multiplied by x^shift
+    """
+    for i, val in enumerate(pol, shift):
+        res[i] += val
+
+
+def _karatsuba(pol1: list, pol2: list):
+    """
+    Multiply two polynomies with the Karatsuba algorithm. Falls back to the schoolbook algorithm when one of the polynomies is shorter than `KARATSUBA_THRESHOLD`
+    """
+    len1, len2 = len(pol1), len(pol2)
+    if min(len1, len2) < KARATSUBA_THRESHOLD:
+        return _schoolbook(pol1, pol2)
+
+    k = max(len1, len2) // 2
+    res = [0] * (len1 + len2 - 1)
+
+    # One of the polynomies is too short to be splitted: multiply it by the two halves of the other
+    if len1 <= k or len2 <= k:
+        if len1 <= k:
+            pol1, pol2 = pol2, pol1
+        _add_shifted(res, _karatsuba(pol1[:k], pol2), 0)
+        _add_shifted(res, _karatsuba(pol1[k:], pol2), k)
+        return res
+
+    low1, high1 = pol1[:k], pol1[k:]
+    low2, high2 = pol2[:k], pol2[k:]
+
+    low = _karatsuba(low1, low2)
+    high = _karatsuba(high1, high2)
+    mid = _karatsuba(sum(low1, high1), sum(low2, high2))
+
+    # mid - low - high is the coefficient of x^k
+    for i, val in enumerate(low):
+        mid[i] -= val
+    for i, val in enumerate(high):
+        mid[i] -= val
+
+    _add_shifted(res, low, 0)
+    _add_shifted(res, mid, k)
+    _add_shifted(res, high, 2 * k)
+    return res
+
+
+def _common_denominator(pol: list):
+    """
+    Find the least common denominator of the coefficients of a polynomy with int and Fraction coefficients
+
+    returns: tuple - The integer numerators of the coefficients scaled by the common denominator, and the common denominator
+    """
+    den = 1
+    for val in pol:
+        if type(val) is not int:
+            den = lcm(den, val.denominator)
+
+    if den == 1:
+        return [int(val) for val in pol], 1
+
+    return [int(val * den) for val in pol], den
+
+
+def _pack(ints: list, bits: int):
+    """
+    Evaluate a polynomy with non negative integer coefficients in 2^bits. bits must be a multiple of 8
+    """
+    size = bits // 8
+    return int.from_bytes(b''.join(v.to_bytes(size, 'little') for v in ints), 'little')
+
+
+def _kronecker(pol1: list, pol2: list):
+    """
+    Multiply two polynomies with integer coefficients using the Kronecker substitution: the polynomies are evaluated in a power of 2 big enough to keep the coefficients of the product separated, then the integers are multiplied and the coefficients are read back from the bits of the product.
+    """
+    res_len = len(pol1) + len(pol2) - 1
+    bound = max(map(abs, pol1)) * max(map(abs, pol2)) * min(len(pol1), len(pol2))
+    if bound == 0:
+        return [0] * res_len
+
+    # One bit for the sign, rounded up to a whole byte
+    bits = (bound.bit_length() + 8) // 8 * 8
+
+    def evaluate(pol):
+        return _pack([max(v, 0) for v in pol], bits) - _pack([max(-v, 0) for v in pol], bits)
+
+    product = evaluate(pol1) * evaluate(pol2)
+    sign = -1 if product < 0 else 1
+    product = abs(product)
+
+    size = bits // 8
+    half = 1 << (bits - 1)
+    full = 1 << bits
+    data = product.to_bytes(res_len * size + 1, 'little')
+
+    res = [0] * res_len
+    carry = 0
+    for i in range(res_len):
+        digit = int.from_bytes(data[i * size:(i + 1) * size], 'little') + carry
+        if digit >= half:
+            digit -= full
+            carry = 1
+        else:
+            carry = 0
+        res[i] = sign * digit
+
+    return res
+
+
+def _is_exact(pol: list):
+    return all(type(val) is int or type(val) is Fraction for val in pol)
+
+
 def multiply_2(pol1: list, pol2: list):
-    multiplications_by_pol2_coff = [None] * len(pol2)
-    for i, coff in enumerate(pol2):
-        pol1_copy = pol1[:]
-        apply_factor(pol1_copy, coff)
+    """
+    Multiply two polynomies. The algorithm is chosen by the length of the shortest polynomy:
+     - schoolbook if shorter than `KARATSUBA_THRESHOLD` and `KRONECKER_THRESHOLD`
+     - Kronecker substitution if all coefficients are int or Fraction and the polynomies are at least `KRONECKER_THRESHOLD` long
+     - Karatsuba otherwise
+
+    returns: list - A new list with the coefficients of the product. The passed polynomies are not modified. If one of the polynomies is a `CompactPolynomial`, a `CompactPolynomial` is returned
+    """
+    if _any_compact((pol1, pol2)):
+        return multiply(pol1, pol2)
 
-        # Add padding to multiply by the power of x^i
-        if i > 0:
-            pol1_copy = [0] * i + pol1_copy
+    if len(pol1) == 0 or len(pol2) == 0:
+        return []
 
-        multiplications_by_pol2_coff[i] = pol1_copy
+    shortest = min(len(pol1), len(pol2))
+
+    if shortest >= KRONECKER_THRESHOLD and _is_exact(pol1) and _is_exact(pol2):
+        ints1, den1 = _common_denominator(pol1)
+        ints2, den2 = _common_denominator(pol2)
+        res = _kronecker(ints1, ints2)
+        den = den1 * den2
+        return res if den == 1 else [Fraction(val, den) for val in res]
+
+    if shortest < KARATSUBA_THRESHOLD:
+        return _schoolbook(pol1, pol2)
+
+    return _karatsuba(pol1, pol2)
+
+def _multiply_modular(pols: list):
+    """
+    Multiply with `genpo.modular` the polynomies with int and Fraction coefficients, if NumPy is installed and the product is at least `MODULAR_THRESHOLD` long
+
+    returns: list | None - The coefficients of the product, or None if the modular backend can't be used
+    """
+    length = 1
+    for pol in pols:
+        length += len(pol) - 1
+
+    if length < MODULAR_THRESHOLD or numpy() is None or not all(len(pol) > 0 and _is_exact(pol) for pol in pols):
+        return None
+
+    scaled = [_common_denominator(pol) for pol in pols]
+    try:
+        res = modular.multiply(*[ints for ints, _ in scaled])
+    except (ValueError, OverflowError):
+        # The product is too long or its coefficients too big for the primes available
+        return None
+
+    den = prod(den for _, den in scaled)
+    return res if den == 1 else [Fraction(val, den) for val in res]
 
-    multiplications_by_pol2_coff.reverse()
-    return sum(*multiplications_by_pol2_coff, sort_by_grade=False)
 
 def multiply(*pols: list):
-    sorted_pols = sort_by_grade(*pols)
-    return reduce(multiply_2, sorted_pols)
+    """
+    Multiply the polynomies passed. The polynomies are multiplied in pairs of similar grade, in a product tree, so the most expensive multiplications are done with the faster algorithms of `multiply_2`. If NumPy is installed and the product is at least `MODULAR_THRESHOLD` long, int and Fraction polynomies are multiplied all together with `genpo.modular`
+
+    returns: list - A new list with the coefficients of the product. If one of the polynomies is a `CompactPolynomial`, the integer numerators are multiplied and a `CompactPolynomial` is returned
+    """
+    if len(pols) == 0:
+        raise ValueError("Must pass at least one polynomy to multiply")
+
+    if _any_compact(pols):
+        numerators, dens = _compact_numerators(pols)
+        return CompactPolynomial(multiply(*numerators), prod(dens))
+
+    level = sort_by_grade(*pols)
+    if len(level) == 1:
+        return level[0][:]
+
+    res = _multiply_modular(level)
+    if res is not None:
+        return res
+
+    while len(level) > 1:
+        next_level = [multiply_2(level[i], level[i + 1])
+                      for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2 != 0:
+            next_level.append(level[-1])
+        level = sort_by_grade(*next_level)
+
+    return level[0]
 
 
 def horner_evaluate(coff: list, x):
@@ -85,13 +327,310 @@ def horner_evaluate(coff: list, x):
     if coff_len < 1:
         raise ValueError(f"coff len must be at least 1. Found {coff_len}")
 
+    if isinstance(coff, CompactPolynomial):
+        # Evaluate the integer numerators and divide only the results
+        p, pdx = horner_evaluate(list(coff.numerators), x)
+        if coff.denominator == 1:
+            return (p, pdx)
+        if isinstance(p, Rational) and isinstance(pdx, Rational):
+            return (Fraction(p, coff.denominator), Fraction(pdx, coff.denominator))
+        return (p / coff.denominator, pdx / coff.denominator)
+
+    if _speedups is not None:
+        return _speedups.horner_evaluate(coff, x)
+
     pdx = p = coff[-1]
 
     for a in reversed(coff[1:-1]):
         p = p * x + a
-        pdx = pdx * x + p-4
+        pdx = pdx * x + p
 
     if coff_len > 1:
         p = p*x + coff[0]
 
-    return (p, pdx)
\ No newline at end of file
+    return (p, pdx)
+
+
+def synthetic_division(coff: list, x):
+    """
+    Divide the polinomy by (x - `x`) with the synthetic division (Ruffini's rule).
+
+    parameters:
+        - coff: list - List of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+        - x - The root of the linear divisor
+
+    returns: tuple - The coefficients of the quotient and the remainder, that is the evaluation of the polinomy in x
+    raise: ValueError if the list of coefficients length isn't at least 1. 
+    """
+    coff = as_list(coff)
+    coff_len = len(coff)
+
+    if coff_len < 1:
+        raise ValueError(f"coff len must be at least 1. Found {coff_len}")
+
+    quotient = [0] * (coff_len - 1)
+    rem = coff[-1]
+    for i in range(coff_len - 2, -1, -1):
+        quotient[i] = rem
+        rem = rem * x + coff[i]
+
+    return quotient, rem
+
+
+def _trim(pol: list):
+    """
+    returns: list - The polinomy without the zero coefficients of the highest grades. The polinomy 0 is an empty list
+    """
+    high = len(pol)
+    while high > 0 and pol[high - 1] == 0:
+        high -= 1
+    return pol[:high] if high < len(pol) else pol
+
+
+def _exact_div(a, b):
+    """Divide a by b, keeping the result an int when the division of two ints is exact"""
+    if type(a) is int and type(b) is int and a % b == 0:
+        return a // b
+    return Fraction(a, b)
+
+
+def derivative(coff: list, order: int = 1):
+    """
+    The derivative of the polinomy.
+
+    parameters:
+        - coff: list - List of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+        - order: int - The order of the derivative
+
+    returns: list - The coefficients of the derivative, [0] if it is 0. A `CompactPolynomial` if coff is one
+    """
+    if isinstance(coff, CompactPolynomial):
+        return CompactPolynomial(derivative(list(coff.numerators), order), coff.denominator)
+
+    for _ in range(order):
+        coff = [i * coff[i] for i in range(1, len(coff))]
+
+    return coff if len(coff) > 0 else [0]
+
+
+def divide(dividend: list, divisor: list):
+    """
+    Divide two polynomies with the long division. The coefficients stay int when the divisions are exact, otherwise they become Fraction.
+    When the divisor is (x - r) the synthetic division is used.
+
+    parameters:
+        - dividend: list - List of coefficients of the polinomy to divide. The element at the index i is the cofficient of x^i.
+        - divisor: list - List of coefficients of the divisor
+
+    returns: tuple - The coefficients of the quotient and of the remainder. The polinomy 0 is [0]
+    raise: ZeroDivisionError if the divisor is 0
+    """
+    dividend = _trim(as_list(dividend))
+    divisor = _trim(as_list(divisor))
+
+    if len(divisor) == 0:
+        raise ZeroDivisionError("Division by the polinomy 0")
+
+    if len(dividend) < len(divisor):
+        return [0], dividend[:] if len(dividend) > 0 else [0]
+
+    if len(divisor) == 2 and divisor[1] == 1:
+        quotient, rem = synthetic_division(dividend, -divisor[0])
+        return quotient, [rem]
+
+    rem = dividend[:]
+    high = divisor[-1]
+    divisor_grade = len(divisor) - 1
+    quotient = [0] * (len(dividend) - divisor_grade)
+
+    for k in range(len(quotient) - 1, -1, -1):
+        q = _exact_div(rem[k + divisor_grade], high)
+        quotient[k] = q
+        if q != 0:
+            for j in range(divisor_grade):
+                rem[k + j] -= q * divisor[j]
+
+    rem = _trim(rem[:divisor_grade])
+    return quotient, rem if len(rem) > 0 else [0]
+
+
+def _primitive(pol: list):
+    """
+    Scale a polinomy different from 0 to integer coefficients without common divisors, with the highest one positive. It has the same roots of the polinomy
+
+    returns: list[int] - The coefficients
+    """
+    numerators, _ = _common_denominator(_trim(pol))
+    content = int_gcd(*numerators)
+    if numerators[-1] < 0:
+        content = -content
+    return [v // content for v in numerators] if content != 1 else numerators
+
+
+def _pseudo_remainder(a: list, b: list):
+    """
+    The remainder of the division of high(b)^(grade(a) - grade(b) + 1) * a by b, that has integer coefficients when a and b have them
+    """
+    rem = a[:]
+    high = b[-1]
+    b_grade = len(b) - 1
+
+    for top in range(len(a) - 1, b_grade - 1, -1):
+        t = rem[top]
+        for i in range(top):
+            rem[i] *= high
+        for j in range(b_grade):
+            rem[top - b_grade + j] -= t * b[j]
+
+    return _trim(rem[:b_grade])
+
+
+def _gcd_2(a: list, b: list):
+    """
+    Greatest common divisor of two polynomies with the subresultant pseudo-remainder sequence: the pseudo-remainders are divided by the factors predicted by the subresultant theorem, so the coefficients stay integers and grow only linearly.
+
+    returns: list[int] - The primitive greatest common divisor, with the highest coefficient positive
+    """
+    a, b = _trim(as_list(a)), _trim(as_list(b))
+    if len(b) == 0:
+        return _primitive(a) if len(a) > 0 else [0]
+    if len(a) == 0:
+        return _primitive(b)
+
+    a, b = _primitive(a), _primitive(b)
+    if len(a) < len(b):
+        a, b = b, a
+
+    g = h = 1
+    while True:
+        delta = len(a) - len(b)
+        rem = _pseudo_remainder(a, b)
+        if len(rem) == 0:
+            return _primitive(b)
+        if len(rem) == 1:
+            # The remainder is a constant different from 0: the polynomies are coprime
+            return [1]
+
+        divisor = g * h ** delta
+        a, b = b, [v // divisor for v in rem]
+        g = a[-1]
+        h = h if delta == 0 else g ** delta // h ** (delta - 1)
+
+
+def gcd(*pols: list):
+    """
+    Greatest common divisor of polynomies with int or Fraction coefficients. The coefficients are scaled to integers, and the subresultant algorithm keeps them integers without fractions growing in the intermediate results.
+
+    parameter: list - Lists of coefficients of the polynomies. The element at the index i is the cofficient of x^i.
+
+    returns: list[int] - The greatest common divisor, defined up to a constant factor: its coefficients are integers without common divisors and its highest coefficient is positive. [1] if the polynomies are coprime, [0] if they are all 0
+    raise: ValueError if no polynomies are passed
+    """
+    if len(pols) == 0:
+        raise ValueError("Must pass at least one polinomy")
+
+    return reduce(_gcd_2, pols[1:], _gcd_2(pols[0], [0]))
+
+
+def _exact_quotient(a: list, b: list):
+    """The quotient of a by a divisor b, scaled to a primitive integer polinomy"""
+    return _primitive(divide(a, b)[0])
+
+
+def square_free(coff: list):
+    """
+    Square-free decomposition of the polinomy with Yun's algorithm: the polinomy is c * f1 * f2^2 * ... * fk^k where the factors fi have no repeated roots and are coprime with each other, so the roots of fi are the roots with multiplicity i.
+
+    parameter: list - List of int or Fraction coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+
+    returns: list[tuple] - The factors fi different from 1 and their multiplicity i, by multiplicity. The factors are primitive integer polynomies with the highest coefficient positive
+    raise: ValueError if the polinomy is 0
+    """
+    coff = _trim(as_list(coff))
+    if len(coff) == 0:
+        raise ValueError("The polinomy 0 has no square-free decomposition")
+
+    a = _primitive(coff)
+    if len(a) == 1:
+        return []
+
+    da = derivative(a)
+    c = gcd(a, da)
+    w = _exact_quotient(a, c)
+    y = divide(da, c)[0]
+
+    res = []
+    multiplicity = 1
+    while len(w) > 1:
+        z = sum(y, [-v for v in derivative(w)])
+        if len(_trim(z)) == 0:
+            res.append((w, multiplicity))
+            break
+
+        g = gcd(w, z)
+        if len(g) > 1:
+            res.append((g, multiplicity))
+        w = _exact_quotient(w, g)
+        y = divide(z, g)[0]
+        multiplicity += 1
+
+    return res
+
+
+def _evaluate_exact(numerators: list, den: int, x):
+    """
+    Evaluate a polinomy with coefficients numerators[i] / den in an int or Fraction x, using only integer arithmetic.
+    With x = n / d, the Horner algorithm is applied to the homogeneous polinomy sum(numerators[i] * n^i * d^(deg - i)), and the division is done once at the end
+    """
+    x = Fraction(x)
+    n, d = x.numerator, x.denominator
+
+    p = numerators[-1]
+    if d == 1:
+        for a in reversed(numerators[:-1]):
+            p = p * n + a
+        return p if den == 1 else Fraction(p, den)
+
+    d_pow = 1
+    for a in reversed(numerators[:-1]):
+        d_pow *= d
+        p = p * n + a * d_pow
+
+    return Fraction(p, den * d_pow)
+
+
+def evaluate_many(coff: list, xs, exact: bool = False):
+    """
+    Evaluate the polinomy in many points.
+
+    parameters:
+        - coff: list - List of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+        - xs - The points. A list or a NumPy array
+        - exact: bool - If False the polinomy is evaluated in floating point, vectorizing the Horner algorithm on a NumPy array of the points (a list of floats is returned if NumPy is not installed).
+            If True the coefficients and the points must be int or Fraction and the values are exact. The coefficients are scaled to integers, and the Horner algorithm uses only integer arithmetic, dividing once for every point
+
+    returns: numpy.ndarray | list - The values of the polinomy in the points. A list if exact is True
+    raise: ValueError if the list of coefficients length isn't at least 1. 
+    """
+    coff = as_list(coff)
+    if len(coff) < 1:
+        raise ValueError(f"coff len must be at least 1. Found {len(coff)}")
+
+    if exact:
+        np = numpy_if_imported()
+        xs = xs.tolist() if np is not None and isinstance(xs, np.ndarray) else xs
+        numerators, den = _common_denominator(coff)
+        return [_evaluate_exact(numerators, den, x) for x in xs]
+
+    np = numpy()
+    if np is None:
+        floats = [float(a) for a in coff]
+        return [horner_evaluate(floats, float(x))[0] for x in xs]
+
+    xs = np.asarray(xs, dtype=np.float64)
+    p = np.full(xs.shape, float(coff[-1]))
+    for a in reversed(coff[:-1]):
+        p *= xs
+        p += float(a)
+
+    return p
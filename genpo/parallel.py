@@ -0,0 +1,113 @@
+"""
+    Generation of many random polynomials using all the cores of the machine.
+
+    A job is splitted in chunks of polynomies, and every chunk is generated in a worker process of a `ProcessPoolExecutor`, with its own random seed derived from the seed of the job. The chunks are always the same for the same job, so the polynomies generated depend only on the seed and the chunk size, not on the number of workers.
+"""
+
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import genpo.random.polynomials as genpo
+
+# Generators that can be used in a job, by name
+GENERATORS = {
+    'pol_fz_count': genpo.pol_fz_count,
+    'pol_fz_multiplicities': genpo.pol_fz_multiplicities,
+    'pol_1': genpo.pol_1,
+    'pol_2': genpo.pol_2,
+}
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def chunk_seeds(seed, chunks: int):
+    """
+    Derive the seeds of the chunks of a job from the seed of the job
+
+    returns: list[int] - A 64 bits seed for each chunk
+    """
+    master = random.Random(seed)
+    return [master.getrandbits(64) for _ in range(chunks)]
+
+
+def generate_chunk(generator: str, params: dict, count: int, seed: int):
+    """
+    Generate `count` polynomies calling the generator with the params passed, after seeding the `random` module with seed. Executed in the worker processes
+
+    returns: list[list] - The coefficients of the generated polynomies
+    """
+    fun = GENERATORS[generator]
+    random.seed(seed)
+    return [fun(**params) for _ in range(count)]
+
+
+def generate_chunks(generator: str, count: int, seed=None, chunk_size: int = DEFAULT_CHUNK_SIZE, max_workers: int = None, executor: ProcessPoolExecutor = None, **params):
+    """
+    Generate `count` polynomies in parallel, yielding them in chunks.
+
+    parameters:
+     - generator: str - Name of the generator to use. One of the keys of `GENERATORS`
+     - count: int - Number of polynomies to generate
+     - seed - Seed of the job. The same seed and chunk size always generate the same polynomies, in the same order
+     - chunk_size: int - Number of polynomies generated by a single task of a worker
+     - max_workers: int - Number of worker processes. If None, the number of processors of the machine. If executor is passed, it's only used to limit the number of pending chunks
+     - executor: ProcessPoolExecutor - Optional. Executor to use instead of creating a new one
+     - params - Parameters passed to the generator
+
+    returns: generator - The chunks of coefficients of the generated polynomies, in order. Only a limited number of chunks are pending at the same time, so a slow consumer doesn't fill the memory
+    raise: ValueError if the generator doesn't exist or count or chunk_size are not valid
+    """
+    if generator not in GENERATORS:
+        raise ValueError(
+            f"Unknown generator {generator}. Must be one of {', '.join(GENERATORS)}")
+
+    if count < 0:
+        raise ValueError("count can't be negative")
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    sizes = [chunk_size] * (count // chunk_size)
+    if count % chunk_size != 0:
+        sizes.append(count % chunk_size)
+
+    return _generate_chunks(generator, params, sizes, seed, max_workers, executor)
+
+
+def _generate_chunks(generator: str, params: dict, sizes: list, seed, max_workers: int, executor: ProcessPoolExecutor):
+    """
+    The generator of the chunks of `generate_chunks`, with the sizes of the chunks. Separated so the arguments are validated when `generate_chunks` is called, not at the first chunk
+    """
+    if len(sizes) == 0:
+        return
+
+    own_executor = executor == None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    try:
+        # Keep a window of pending chunks, and yield them in submission order
+        window = 2 * (max_workers or os.cpu_count() or 1)
+        pending = deque()
+
+        for size, chunk_seed in zip(sizes, chunk_seeds(seed, len(sizes))):
+            pending.append(executor.submit(
+                generate_chunk, generator, params, size, chunk_seed))
+
+            if len(pending) >= window:
+                yield pending.popleft().result()
+
+        while len(pending) > 0:
+            yield pending.popleft().result()
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def generate(generator: str, count: int, seed=None, chunk_size: int = DEFAULT_CHUNK_SIZE, max_workers: int = None, executor: ProcessPoolExecutor = None, **params):
+    """
+    Same as `generate_chunks`, but yields the polynomies one by one
+    """
+    return (pol for chunk in generate_chunks(generator, count, seed, chunk_size, max_workers, executor, **params) for pol in chunk)
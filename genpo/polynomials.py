@@ -1,5 +1,27 @@
 """Functions to create polynomials from parameters"""
 
+from collections import Counter
+from fractions import Fraction
+from math import comb
+
+import genpo.modular as modular
+import genpo.operations as ops
+from genpo._optional import numpy, speedups
+from genpo.cache import expansion_cache
+from genpo.compact import CompactPolynomial
+
+# Degree from which from_roots expands non integer roots with from_roots_tree
+FROM_ROOTS_TREE_THRESHOLD = 64
+# Degree from which from_roots expands int and Fraction roots with `genpo.modular`, if NumPy is installed
+FROM_ROOTS_MODULAR_THRESHOLD = 512
+# Coefficients of a batch row are computed with int64 only if their bound has less bits than this
+INT64_SAFE_BITS = 62
+# Number of lists of roots from which from_roots_batch uses NumPy. Smaller batches are faster with from_roots, and don't pay the import of NumPy
+FROM_ROOTS_BATCH_NUMPY_THRESHOLD = 32
+
+# The compiled kernel of the expansion, or None to use only python. It returns the same coefficients of the python code
+_speedups = speedups()
+
 def parabola(a=1, b=1, c=1):
     """
     Generate a second degree polinomy, with the parameters specified.
@@ -9,19 +31,43 @@ def parabola(a=1, b=1, c=1):
     """
     return [c, b, a]
 
-def from_roots(zeroes: list):
+def from_roots(zeroes: list, compact: bool = False):
 
     """
     Generate the coefficients of a polinomy that has the roots specified in the list. The multeplicity of each root is determined by how many times it appears in the list.
 
-    Parameter: 
-        list - List of roots. If a root has a multiplicity of m, it will appear m times in the list. Btw, the length of list is the degree of the polinomy.
+    Parameters: 
+        zeroes: list - List of roots. If a root has a multiplicity of m, it will appear m times in the list. Btw, the length of list is the degree of the polinomy.
+        compact: bool - True to return a `CompactPolynomial`
+
+    If the cache of expansions is enabled (see `genpo.cache`), the coefficients are taken from it when possible. If NumPy is installed and the degree is at least `FROM_ROOTS_MODULAR_THRESHOLD`, int and Fraction roots are expanded with `genpo.modular`.
 
     Returns:
         list: Coefficients of the polinomy. The element at the index i is the cofficient of x^i.
     """
 
+    if compact:
+        return CompactPolynomial.from_coefficients(from_roots(zeroes))
+
     n = len(zeroes) + 1
+
+    if len(zeroes) >= FROM_ROOTS_MODULAR_THRESHOLD and numpy() is not None and all(type(zero) is int or type(zero) is Fraction for zero in zeroes):
+        try:
+            return modular.from_roots(zeroes)
+        except (ValueError, OverflowError):
+            # The degree or the coefficients are too big for the primes available
+            pass
+
+    # With integer roots the expansion below is faster at every degree, because it only multiplies by small integers
+    if n > FROM_ROOTS_TREE_THRESHOLD and any(type(zero) is not int for zero in zeroes):
+        return from_roots_tree(zeroes)
+
+    if expansion_cache.enabled and n > 2:
+        return _from_roots_cached(zeroes)
+
+    if _speedups is not None:
+        return _speedups.from_roots(zeroes)
+
     coff = [1 for _ in range(n)]
 
     # The iteration i does a multiplication between the partial polinomy built and (x - zeroes[i])
@@ -36,4 +82,139 @@ def from_roots(zeroes: list):
             t0 = coff[j]
             coff[j] = t1 - (t0 * zero)
 
-    return coff
\ No newline at end of file
+    return coff
+
+def _multiply_root(coff: tuple, zero):
+    """
+    returns: tuple - The coefficients of the polinomy coff multiplied by (x - zero)
+    """
+    return (-zero * coff[0],) + tuple(coff[j - 1] - zero * coff[j] for j in range(1, len(coff))) + (coff[-1],)
+
+def _from_roots_cached(zeroes: list):
+    """
+    `from_roots` with the cache of expansions. The roots are sorted, then the expansion of the longest prefix cached is multiplied by the factors of the roots left, caching the expansion of every longer prefix.
+    The key pairs every root with the name of its type, because equal roots of different types, like 0.5 and Fraction(1, 2), have coefficients of different types
+    """
+    key = tuple(sorted((type(zero).__name__, zero) for zero in zeroes))
+    length, coff = expansion_cache.longest_prefix(key)
+
+    if coff is None:
+        coff = (1,)
+
+    for i in range(length, len(key)):
+        coff = _multiply_root(coff, key[i][1])
+        if i > 0:
+            expansion_cache.put(key[:i + 1], coff)
+
+    return list(coff)
+
+def root_power(zero, multiplicity: int):
+    """
+    Generate the coefficients of the polinomy (x - zero)^multiplicity, using the binomial expansion.
+
+    Returns:
+        list: Coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+    """
+    return [comb(multiplicity, k) * (-zero) ** (multiplicity - k) for k in range(multiplicity + 1)]
+
+
+def from_roots_tree(zeroes: list):
+    """
+    Same as `from_roots`, but the repeated roots are grouped and expanded with the binomial formula, then all the factors are multiplied in a product tree with `genpo.operations.multiply`. Faster than expanding one root at time when the roots are fractions and the degree is high.
+
+    Parameter: 
+        list - List of roots. If a root has a multiplicity of m, it will appear m times in the list.
+
+    Returns:
+        list: Coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+    """
+    if len(zeroes) == 0:
+        return [1]
+
+    return ops.multiply(*[root_power(zero, mul) for zero, mul in Counter(zeroes).items()])
+
+
+def _from_roots_array(zeroes, dtype):
+    """
+    Expand in a vectorized way the rows of a 2d NumPy array of roots. All rows have the same number of roots.
+
+    returns: numpy.ndarray - A 2d array where the row i contains the coefficients of the polinomy with the roots of the row i of zeroes
+    """
+    np = numpy()
+    rows, degree = zeroes.shape
+    coff = np.zeros((rows, degree + 1), dtype=dtype)
+    coff[:, 0] = 1
+
+    # Multiply every row by (x - zeroes[:, i]), like from_roots does one polinomy at time
+    for i in range(degree):
+        zero = zeroes[:, i:i + 1]
+        coff[:, 1:i + 2] = coff[:, 0:i + 1] - coff[:, 1:i + 2] * zero
+        coff[:, 0:1] = coff[:, 0:1] * -zero
+
+    return coff
+
+
+def _from_roots_same_degree(zeroes_lists: list):
+    """
+    Expand with NumPy a list of lists of roots, all with the same length. The rows whose coefficients can overflow int64 are expanded with arrays of python ints
+
+    returns: list[list] - The coefficients of the polinomies
+    """
+    # NumPy truncates Fraction and float roots converted to int64, so only int roots are vectorized
+    if not all(type(zero) is int for zeroes in zeroes_lists for zero in zeroes):
+        return [from_roots(zeroes) for zeroes in zeroes_lists]
+
+    np = numpy()
+    try:
+        zeroes = np.array(zeroes_lists, dtype=np.int64)
+    except OverflowError:
+        return _from_roots_array(np.array(zeroes_lists, dtype=object), object).tolist()
+
+    # The absolute values of the coefficients are bounded by (1 + max|zero|)^degree
+    degree = zeroes.shape[1]
+    bits = degree * np.log2(1 + np.abs(zeroes.astype(np.float64)).max(axis=1, initial=0))
+    safe = bits < INT64_SAFE_BITS
+
+    if safe.all():
+        return _from_roots_array(zeroes, np.int64).tolist()
+
+    res = [None] * len(zeroes_lists)
+    for mask, dtype in ((safe, np.int64), (~safe, object)):
+        indexes = np.flatnonzero(mask)
+        if len(indexes) > 0:
+            coffs = _from_roots_array(zeroes[indexes].astype(dtype), dtype).tolist()
+            for i, coff in zip(indexes.tolist(), coffs):
+                res[i] = coff
+
+    return res
+
+
+def from_roots_batch(zeroes_lists: list):
+    """
+    Generate the coefficients of many polinomies with integer roots. See `from_roots`.
+
+    If NumPy is installed and there are at least `FROM_ROOTS_BATCH_NUMPY_THRESHOLD` lists, the lists with the same number of int roots are expanded all together with a vectorized algorithm. The rows whose coefficients fit in int64 are computed with int64 arrays, the others with arrays of python ints, so the results are always exact. Without NumPy every list is expanded with `from_roots`.
+
+    Parameter:
+        list[list[int]] - List of lists of integer roots
+
+    Returns:
+        list[list[int]] - The coefficients of the polinomies, in the same order of the roots passed
+    """
+    if len(zeroes_lists) < FROM_ROOTS_BATCH_NUMPY_THRESHOLD or numpy() is None:
+        return [from_roots(zeroes) for zeroes in zeroes_lists]
+
+    groups: dict[int, list[int]] = {}
+    for i, zeroes in enumerate(zeroes_lists):
+        groups.setdefault(len(zeroes), []).append(i)
+
+    if len(groups) == 1:
+        return _from_roots_same_degree(zeroes_lists)
+
+    res = [None] * len(zeroes_lists)
+    for indexes in groups.values():
+        coffs = _from_roots_same_degree([zeroes_lists[i] for i in indexes])
+        for i, coff in zip(indexes, coffs):
+            res[i] = coff
+
+    return res
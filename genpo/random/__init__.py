@@ -1,3 +1,18 @@
 """
 Random generators for roots and polynomials simple to find and solve by hand
-"""
\ No newline at end of file
+"""
+
+import importlib
+
+# The submodules are imported only when they are used, like `genpo.random.polynomials` after `import genpo.random`
+_SUBMODULES = {'values', 'roots', 'polynomials', 'space', 'difficulty'}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
@@ -0,0 +1,240 @@
+"""
+    Generation of polynomials by level of difficulty.
+
+    The difficulty of a polinomy to solve by hand depends on its configuration: its grade, the multiplicities of its zeroes, the number of second grade factors without zeroes and if the highest coefficient is a fraction. `score` gives a value to every configuration, and the configurations up to a max grade are splitted by score in `DEFAULT_LEVELS` levels of difficulty, from 1, the easiest, to the hardest.
+
+    The index from the levels to their configurations is built once and saved in a JSON file in the cache directory, `GENPO_CACHE_DIR` or `~/.cache/genpo`, so the next processes only read it. Every configuration in the index is valid, so the generation draws a configuration and builds its polinomy without retries:
+
+        batch = generate_by_difficulty(3, n=100, seed=1)
+        batch[0]           # coefficients of the first polinomy
+        batch.zeroes[0]    # its zeroes, without the ones of the second grade factors
+"""
+
+import json
+import os
+import tempfile
+
+import genpo.operations as ops
+import genpo.polynomials as pols
+import genpo.random.roots as roots
+import genpo.random.values as gens
+from genpo.random.polynomials import PolynomialBatch, parabola_no_zeroes_batch
+
+DEFAULT_MAX_GRADE = 8
+DEFAULT_LEVELS = 10
+# Change it when the score or the format of the index changes, so the indexes already saved are built again
+INDEX_VERSION = 1
+
+# Weight in the score of every part of a configuration
+GRADE_WEIGHT = 1
+ZERO_WEIGHT = 2
+REPEATED_ZERO_WEIGHT = 1
+PARABOLA_WEIGHT = 3
+FRACTION_WEIGHT = 2
+
+# The indexes already loaded, by max grade and levels
+_indexes = {}
+
+
+def score(grade: int, multiplicities: tuple, parabolas: int, fraction_high: bool):
+    """
+    Score the difficulty of a configuration. Every distinct zero must be searched, every repetition of a zero is another division, a factor without zeroes must be recognized and a fractional highest coefficient makes the candidate roots harder to test
+
+    parameters:
+        - grade: int - Grade of the polinomy
+        - multiplicities: tuple[int] - The multiplicity of each zero
+        - parabolas: int - Number of second grade factors without zeroes
+        - fraction_high: bool - True if the highest coefficient is a fraction
+
+    returns: int - The score. Higher is harder
+    """
+    distinct = len(multiplicities)
+    return (GRADE_WEIGHT * grade + ZERO_WEIGHT * distinct + REPEATED_ZERO_WEIGHT * (sum(multiplicities) - distinct)
+            + PARABOLA_WEIGHT * parabolas + FRACTION_WEIGHT * int(fraction_high))
+
+
+def _partitions(total: int, largest: int = None):
+    """
+    returns: generator - The partitions of total, as tuples of values sorted from the biggest
+    """
+    if total == 0:
+        yield ()
+        return
+
+    largest = total if largest == None else largest
+    for first in range(min(total, largest), 0, -1):
+        for rest in _partitions(total - first, first):
+            yield (first,) + rest
+
+
+def configurations(max_grade: int = DEFAULT_MAX_GRADE):
+    """
+    Enumerate all the valid configurations up to max_grade: the grade not covered by the zeroes is covered by second grade factors without zeroes, so it's even
+
+    returns: generator - Tuples (grade, multiplicities, parabolas, fraction_high)
+    """
+    for grade in range(1, max_grade + 1):
+        for parabolas in range(grade // 2 + 1):
+            for multiplicities in _partitions(grade - 2 * parabolas):
+                for fraction_high in (False, True):
+                    yield grade, multiplicities, parabolas, fraction_high
+
+
+def build_index(max_grade: int = DEFAULT_MAX_GRADE, levels: int = DEFAULT_LEVELS):
+    """
+    Split the configurations up to max_grade in levels of difficulty. The distinct scores are splitted in levels of about the same number of scores, so the configurations with the same score are always in the same level
+
+    returns: dict[int, list[tuple]] - The configurations of every level, from 1 to levels
+    raise: ValueError if there are less distinct scores than levels
+    """
+    by_score = {}
+    for config in configurations(max_grade):
+        by_score.setdefault(score(*config), []).append(config)
+
+    scores = sorted(by_score)
+    if len(scores) < levels:
+        raise ValueError(
+            f"Can't split the configurations up to grade {max_grade} in {levels} levels: there are only {len(scores)} distinct scores")
+
+    index = {level: [] for level in range(1, levels + 1)}
+    for rank, value in enumerate(scores):
+        index[1 + rank * levels // len(scores)].extend(by_score[value])
+
+    return index
+
+
+def cache_dir():
+    """
+    returns: str - The directory of the indexes saved: the environment variable GENPO_CACHE_DIR, or `~/.cache/genpo`
+    """
+    return os.environ.get('GENPO_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'genpo')
+
+
+def _index_path(max_grade: int, levels: int):
+    return os.path.join(cache_dir(), f'difficulty-v{INDEX_VERSION}-grade{max_grade}-levels{levels}.json')
+
+
+def _read_index(path: str):
+    """
+    returns: dict | None - The index saved in path, None if the file doesn't exist or is not valid
+    """
+    try:
+        with open(path) as file:
+            data = json.load(file)
+        if data['version'] != INDEX_VERSION:
+            return None
+        return {int(level): [(grade, tuple(multiplicities), parabolas, fraction_high)
+                             for grade, multiplicities, parabolas, fraction_high in configs]
+                for level, configs in data['index'].items()}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_index(path: str, index: dict):
+    """Save the index, replacing the file at once so a reader never finds it half written. A cache directory that can't be written is ignored"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, 'w') as file:
+            json.dump({'version': INDEX_VERSION, 'index': {str(level): configs for level, configs in index.items()}}, file)
+        os.replace(tmp, path)
+    except BaseException as e:
+        # Don't leave the temporary file behind, also when the write is interrupted
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        if not isinstance(e, OSError):
+            raise
+
+
+def load_index(max_grade: int = DEFAULT_MAX_GRADE, levels: int = DEFAULT_LEVELS):
+    """
+    The index of the levels of difficulty, read from the cache directory. If it isn't saved yet it's built with `build_index` and saved. The index is kept in memory after the first call
+
+    returns: dict[int, list[tuple]] - The configurations of every level. See `build_index`
+    """
+    key = (max_grade, levels)
+    index = _indexes.get(key)
+    if index == None:
+        path = _index_path(max_grade, levels)
+        index = _read_index(path)
+        if index == None:
+            index = build_index(max_grade, levels)
+            _write_index(path, index)
+        _indexes[key] = index
+
+    return index
+
+
+def _high_coffs(fraction_high: bool, n: int, rng):
+    """
+    returns: list - n highest coefficients, fractions from `genpo.random.values.fractions` if fraction_high is True, otherwise 1 or -1
+    """
+    signs = gens.rand_int_batch(0, 1, n, rng)
+    if not fraction_high:
+        return [1 if sign else -1 for sign in signs]
+
+    indexes = gens.rand_int_batch(0, len(gens.fractions) - 1, n, rng)
+    return [gens.fractions[i] if sign else -gens.fractions[i] for sign, i in zip(signs, indexes)]
+
+
+def _config_batch(config: tuple, n: int, rng):
+    """
+    Generate n polynomies with the same configuration, like `genpo.random.polynomials.pol_1_batch`
+
+    returns: PolynomialBatch - The polynomies
+    """
+    _, multiplicities, parabolas, fraction_high = config
+
+    if len(multiplicities) > 0:
+        zeroes = roots.generate_zeroes_with_multiplicity_batch(list(multiplicities), n, rng)
+        coffs = pols.from_roots_batch(zeroes)
+    else:
+        zeroes = [[] for _ in range(n)]
+        coffs = [[1] for _ in range(n)]
+
+    if parabolas > 0:
+        factors = parabola_no_zeroes_batch(n * parabolas, rng)
+        coffs = [ops.multiply(coff, *factors[i * parabolas:(i + 1) * parabolas]) for i, coff in enumerate(coffs)]
+
+    return PolynomialBatch(coffs, _high_coffs(fraction_high, n, rng), zeroes)
+
+
+def generate_by_difficulty(level: int, n: int = 1, seed=None, max_grade: int = DEFAULT_MAX_GRADE, levels: int = DEFAULT_LEVELS):
+    """
+    Generate n polynomies of a level of difficulty. The configuration of every polinomy is drawn uniformly from the configurations of the level in the index of `load_index`, then the polynomies with the same configuration are generated together
+
+    parameters:
+        - level: int - The level of difficulty, from 1 to levels
+        - n: int - Number of polynomies to generate
+        - seed - A `random.Random`, a NumPy `Generator` or a seed for a new `random.Random`. The same seed always generates the same batch
+        - max_grade, levels: int - The index to use. See `build_index`
+
+    returns: PolynomialBatch - The polynomies, in the order their configurations are drawn. The zeroes don't include the ones of the second grade factors, because they aren't real
+    raise: ValueError if the level is not between 1 and levels
+    """
+    if level < 1 or level > levels:
+        raise ValueError(f"The level must be between 1 and {levels}. Found {level}")
+
+    configs = load_index(max_grade, levels)[level]
+    rng = gens.make_rng(seed)
+
+    groups = {}
+    for i, choice in enumerate(gens.rand_int_batch(0, len(configs) - 1, n, rng)):
+        groups.setdefault(choice, []).append(i)
+
+    res = PolynomialBatch([None] * n, [None] * n, [None] * n)
+    for choice in sorted(groups):
+        positions = groups[choice]
+        batch = _config_batch(configs[choice], len(positions), rng)
+        for i, coff, high, zeroes in zip(positions, batch.coefficients, batch.high_coffs, batch.zeroes):
+            res.coefficients[i] = coff
+            res.high_coffs[i] = high
+            res.zeroes[i] = zeroes
+
+    return res
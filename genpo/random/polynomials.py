@@ -7,19 +7,26 @@
 """
 
 import random
-from math import ceil, floor
+from collections import OrderedDict
+from fractions import Fraction
+from itertools import count as count_from
+from math import ceil, floor, sqrt
 
 import genpo.operations as ops
 import genpo.polynomials as pols
 import genpo.random.roots as roots
 import genpo.random.values as gens
+from genpo.compact import CompactPolynomial
 
 
-def pol_fz_multiplicities_base(zeroes_multiplicity: list[int], highest_coff=None):
+def pol_fz_multiplicities_base(zeroes_multiplicity: list[int], highest_coff=None, compact=False):
     """
     Generate a polinomy with integer zeroes that are easy to solve. The sum of multeplicities of all the zeroes passed is the grade of the polinomy.
 
-    parameter: list[int] - List of zeroes of the polinomy. Each zero is repeated in the list many times as its multeplicity
+    parameters:
+     - zeroes_multiplicity: list[int] - List of zeroes of the polinomy. Each zero is repeated in the list many times as its multeplicity
+     - highest_coff - Optional. The highest coefficient. If not passed, a random one is generated with `rand_high_coff()`
+     - compact: bool - True to return a `genpo.compact.CompactPolynomial`: integer coefficients and a common denominator, so the coefficients never become `Fraction`
 
     returns: list - List of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
     """
@@ -28,37 +35,41 @@ def pol_fz_multiplicities_base(zeroes_multiplicity: list[int], highest_coff=None
         raise ValueError(
             "length of zeroes_multiplicity must be at least one. This function can't generate a polinomy without zeroes")
 
-    roots.raise_if_not_valid_multiplicities(multiplicities=zeroes_multiplicity)
-
-    coff = pols.from_roots(zeroes_multiplicity)
+    coff = pols.from_roots(zeroes_multiplicity, compact=compact)
 
     ops.apply_factor(coff, highest_coff if highest_coff !=
                  None else gens.rand_high_coff())
     return coff
 
-def pol_fz_multiplicities(multiplicities: list[int], show_zeroes=False):
+def pol_fz_multiplicities(multiplicities: list[int], show_zeroes=False, compact=False):
+    """
+    Generate a polinomy with integer zeroes that are easy to solve, with the multiplicities passed. The sum of the multiplicities is the grade of the polinomy
+
+    parameters:
+     - multiplicities: list[int] - The multiplicity of each zero
+     - show_zeroes: bool - True to print the zeroes of the generated polinomy to stdout
+     - compact: bool - See `pol_fz_multiplicities_base`
+
+     returns: list - List of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+    """
 
     zeroes_multiplicity = roots.generate_zeroes_with_multiplicity(
         multiplicities)
 
-    coff = pol_fz_multiplicities_base(zeroes_multiplicity)
+    coff = pol_fz_multiplicities_base(zeroes_multiplicity, compact=compact)
 
     if show_zeroes:
         zeroes_multiplicity.sort()
         print(f'Zeroes with multiplicity: {zeroes_multiplicity}')
 
-def pol_fz_count(grade: int, zeroes_count: int = None, show_zeroes=False):
-    """
-    Generate a polinomy with integer zeroes that are easy to solve. The sum of multeplicities of all zeroes of this polinomy is its grade
-
-    parameters:
-     - grade: int - Grade of the polinomy. Can't be less than the number of zeroes
-     - zeroes_count: int - Number of zeroes of the polinomy. They will be all zeroes easy to find. If no value is passed or the value `None` is passed, a polinomy with the number of zeroes equal its grade will be generated. For more information see `generate_zeroes(int)`
-     - show_zeroes: bool - True to print the zeroes of the generated polinomy to stdout
+    return coff
 
-     returns: list - List of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+def _check_fz_count(grade: int, zeroes_count: int = None):
     """
+    Validate the parameters of `pol_fz_count`
 
+    returns: int - The number of zeroes to generate
+    """
     if zeroes_count == None:
         zeroes_count = grade
 
@@ -70,10 +81,27 @@ def pol_fz_count(grade: int, zeroes_count: int = None, show_zeroes=False):
         raise ValueError(
             "zeroes_count can't be <= 0. There must be at least one zero")
 
+    return zeroes_count
+
+def pol_fz_count(grade: int, zeroes_count: int = None, show_zeroes=False, compact=False):
+    """
+    Generate a polinomy with integer zeroes that are easy to solve. The sum of multeplicities of all zeroes of this polinomy is its grade
+
+    parameters:
+     - grade: int - Grade of the polinomy. Can't be less than the number of zeroes
+     - zeroes_count: int - Number of zeroes of the polinomy. They will be all zeroes easy to find. If no value is passed or the value `None` is passed, a polinomy with the number of zeroes equal its grade will be generated. For more information see `generate_zeroes(int)`
+     - show_zeroes: bool - True to print the zeroes of the generated polinomy to stdout
+     - compact: bool - See `pol_fz_multiplicities_base`
+
+     returns: list - List of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+    """
+
+    zeroes_count = _check_fz_count(grade, zeroes_count)
+
     zeroes = roots.generate_zeroes(zeroes_count)
     zeroes_multiplicity = gens.rand_span(zeroes, grade)
 
-    coff = pol_fz_multiplicities_base(zeroes_multiplicity)
+    coff = pol_fz_multiplicities_base(zeroes_multiplicity, compact=compact)
 
     if show_zeroes:
         zeroes_multiplicity.sort()
@@ -81,33 +109,38 @@ def pol_fz_count(grade: int, zeroes_count: int = None, show_zeroes=False):
 
     return coff
 
-def parabola_no_zeroes():
+def _no_zeroes_parabolas():
     """
-    Generate a second grade polinomy without zeroes. The cofficients of this polinomy are all integer numbers, and a is 1
+    The table of the parabolas x^2 + bx + c generated by `parabola_no_zeroes`: for every c, 1 more than an easy number >= 0, the values of b in [-(2 floor(sqrt(c)) - 1), 2 floor(sqrt(c)) - 1], for which the delta b^2 - 4c is negative
 
-    return: list - List of coefficients of polinomy of the form x^2 + bx + c. The element at the index i is the cofficient of x^i.
+    returns: dict[int, tuple[int]] - The values of b, sorted, by value of c
     """
-    c = gens.rand_easy_num(negative=False) + 1
-    # Get a random value of b in a way that the calculated delta is negative
-    max_abs_b_value = 2 * floor(sqrt(c)) - 1
-    b = 0 if max_abs_b_value <= 0 else random.randint(
-        -1 * max_abs_b_value, max_abs_b_value)
+    low, up = gens.easy_num_interval(negative=False)
+    table = {}
+    for c in range(low + 1, up + 2):
+        max_abs_b_value = max(2 * floor(sqrt(c)) - 1, 0)
+        table[c] = tuple(range(-max_abs_b_value, max_abs_b_value + 1))
+
+    return table
 
-    return pols.parabola(1, b, c)
+# Values of b of the parabolas without zeroes, by value of c
+NO_ZEROES_PARABOLAS = _no_zeroes_parabolas()
 
-def pol_1(multiplicities: list[int] = None, grade: int = None, show_zeroes=False):
+def parabola_no_zeroes():
     """
-    Generate a polinomy with integer zeroes that are easy to solve. The grade of this polinomy is at least the sum of the multeplicities passed.
+    Generate a second grade polinomy without zeroes. The cofficients of this polinomy are all integer numbers, and a is 1. The parabola is drawn from `NO_ZEROES_PARABOLAS`: c is uniform, then b is uniform between the values valid for c
 
-    parameters:
-     - grade: int - Optional. Grade of the polinomy.
-     - multiplicities: list[int] - Optional. Number of multiplicities of single zeroes in the polinomy. They will be all zeroes easy to find. 
-        If no value is passed or the value `None` is passed, a polinomy with the number of zeroes equal the passed grade will be generated. For more information see `generate_zeroes(int)`
-     - show_zeroes: bool - `True` to print the zeroes of the generated polinomy to stdout
+    return: list - List of coefficients of polinomy of the form x^2 + bx + c. The element at the index i is the cofficient of x^i.
+    """
+    c = gens.rand_easy_num(negative=False) + 1
+    return [c, random.choice(NO_ZEROES_PARABOLAS[c]), 1]
 
-     returns: list - List of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+def _check_pol_1(multiplicities: list[int] = None, grade: int = None):
     """
+    Validate the parameters of `pol_1`
 
+    returns: tuple - The multiplicities of the zeroes and the grade of the part of the polinomy without zeroes
+    """
     if grade == None and multiplicities == None:
         raise ValueError(
             "Must pass at least grade or multiplicities of zeroes of the polinomy to generate")
@@ -128,10 +161,28 @@ def pol_1(multiplicities: list[int] = None, grade: int = None, show_zeroes=False
         raise ValueError(
             f"Can't generate polinomy that has grade {grade} and sum of multeplicities {sum_multeplicities}: Can't generate a polinomy without zeroes of grade {grade_without_zeroes}")
 
+    return multiplicities, grade_without_zeroes
+
+def pol_1(multiplicities: list[int] = None, grade: int = None, show_zeroes=False, compact=False):
+    """
+    Generate a polinomy with integer zeroes that are easy to solve. The grade of this polinomy is at least the sum of the multeplicities passed.
+
+    parameters:
+     - grade: int - Optional. Grade of the polinomy.
+     - multiplicities: list[int] - Optional. Number of multiplicities of single zeroes in the polinomy. They will be all zeroes easy to find. 
+        If no value is passed or the value `None` is passed, a polinomy with the number of zeroes equal the passed grade will be generated. For more information see `generate_zeroes(int)`
+     - show_zeroes: bool - `True` to print the zeroes of the generated polinomy to stdout
+     - compact: bool - See `pol_fz_multiplicities_base`
+
+     returns: list - List of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+    """
+
+    multiplicities, grade_without_zeroes = _check_pol_1(multiplicities, grade)
+
     zeroes_with_multiplicity = roots.generate_zeroes_with_multiplicity(
         multiplicities)
     coff_with_zeroes = pol_fz_multiplicities_base(
-        zeroes_with_multiplicity, highest_coff=1)
+        zeroes_with_multiplicity, highest_coff=1, compact=compact)
 
     # Generate 2nd grade polinomies without zeroes to increment the grade of the polinomy without adding zeroes
     coffs_without_zeroes = [parabola_no_zeroes() for _ in range(int(grade_without_zeroes / 2))]
@@ -149,8 +200,12 @@ def pol_1(multiplicities: list[int] = None, grade: int = None, show_zeroes=False
     return res
 
 
-def pol_2(min_grade: int = None, max_grade: int = None, min_zeroes: int = None, max_zeroes: int = None, min_multeplicity: int = None, max_multeplicity: int = None):
+def _check_pol_2(min_grade: int = None, max_grade: int = None, min_zeroes: int = None, max_zeroes: int = None, min_multeplicity: int = None, max_multeplicity: int = None):
+    """
+    Validate the parameters of `pol_2`, and fill the ones not passed
 
+    returns: tuple - min_grade, max_grade, min_zeroes, max_zeroes, min_multeplicity, max_multeplicity
+    """
     if min_grade == None or min_grade < 2:
         min_grade = 2
 
@@ -190,6 +245,25 @@ def pol_2(min_grade: int = None, max_grade: int = None, min_zeroes: int = None,
             max_multeplicity = max(min_multeplicity, 0 if min_zeroes == 0 else ceil(
                 max_grade / min_zeroes))
 
+    return min_grade, max_grade, min_zeroes, max_zeroes, min_multeplicity, max_multeplicity
+
+
+def pol_2(min_grade: int = None, max_grade: int = None, min_zeroes: int = None, max_zeroes: int = None, min_multeplicity: int = None, max_multeplicity: int = None, compact=False):
+    """
+    Generate a polinomy with a random grade, number of zeroes and multiplicities in the intervals passed. The grade not covered by the zeroes is covered by second grade factors without zeroes.
+
+    parameters:
+     - min_grade, max_grade: int - Optional. Interval of the grade
+     - min_zeroes, max_zeroes: int - Optional. Interval of the number of distinct zeroes
+     - min_multeplicity, max_multeplicity: int - Optional. Interval of the multiplicity of each zero
+     - compact: bool - See `pol_fz_multiplicities_base`
+
+     returns: list - List of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+    """
+
+    min_grade, max_grade, min_zeroes, max_zeroes, min_multeplicity, max_multeplicity = _check_pol_2(
+        min_grade, max_grade, min_zeroes, max_zeroes, min_multeplicity, max_multeplicity)
+
     zeroes_count = random.randint(min_zeroes, max_zeroes)
 
     grade_with_zeroes = 0
@@ -198,7 +272,7 @@ def pol_2(min_grade: int = None, max_grade: int = None, min_zeroes: int = None,
         multiplicities = roots.generate_multiplicities(
             zeroes_count, min_grade, max_grade, min_multeplicity, max_multeplicity)
         zeroes = roots.generate_zeroes_with_multiplicity(multiplicities)
-        pol_with_zeroes = pols.from_roots(zeroes)
+        pol_with_zeroes = pols.from_roots(zeroes, compact=compact)
         grade_with_zeroes = len(zeroes)
 
     grade = random.randint(max(grade_with_zeroes, min_grade), max_grade)
@@ -213,11 +287,12 @@ def pol_2(min_grade: int = None, max_grade: int = None, min_zeroes: int = None,
 
     if grade_without_zeroes > 0:
         second_grade_pols_without_zeroes = [
-            prbs.genpo_parabola_no_zeroes() for _ in range(int(grade_without_zeroes / 2))]
+            parabola_no_zeroes() for _ in range(int(grade_without_zeroes / 2))]
 
     if pol_with_zeroes == None:
         if second_grade_pols_without_zeroes != None:
-            return ops.multiply(*second_grade_pols_without_zeroes)
+            pol = ops.multiply(*second_grade_pols_without_zeroes)
+            return CompactPolynomial(pol) if compact else pol
         else:
             return None
 
@@ -229,3 +304,259 @@ def pol_2(min_grade: int = None, max_grade: int = None, min_zeroes: int = None,
     ops.apply_factor(pol, gens.rand_high_coff())
 
     return pol
+
+
+class PolynomialBatch:
+    """
+    Polynomies generated by the batch generators. The polinomy at index i is `coefficients[i]` multiplied by `high_coffs[i]`, so the coefficients are kept as integers.
+
+    fields:
+     - coefficients: list[list[int]] - Integer coefficients of the monic polynomies. The element at the index j of a row is the cofficient of x^j.
+     - high_coffs: list - The highest coefficient of each polinomy
+     - zeroes: list[list[int]] - Zeroes of each polinomy. Every zero is repeated as many times as its multiplicity
+    """
+    # A plain class instead of a dataclass, because importing dataclasses doubles the import time of genpo
+    __slots__ = ('coefficients', 'high_coffs', 'zeroes')
+
+    def __init__(self, coefficients: list = None, high_coffs: list = None, zeroes: list = None):
+        self.coefficients = [] if coefficients == None else coefficients
+        self.high_coffs = [] if high_coffs == None else high_coffs
+        self.zeroes = [] if zeroes == None else zeroes
+
+    def __repr__(self):
+        return f'PolynomialBatch(coefficients={self.coefficients!r}, high_coffs={self.high_coffs!r}, zeroes={self.zeroes!r})'
+
+    def __eq__(self, other):
+        if not isinstance(other, PolynomialBatch):
+            return NotImplemented
+        return (self.coefficients, self.high_coffs, self.zeroes) == (other.coefficients, other.high_coffs, other.zeroes)
+
+    def __len__(self):
+        return len(self.coefficients)
+
+    def __getitem__(self, i: int):
+        return self.polynomial(i)
+
+    def polynomial(self, i: int):
+        """
+        returns: list - List of coefficients of the polinomy at index i, like the one returned by the single polinomy generators
+        """
+        coff = self.coefficients[i][:]
+        ops.apply_factor(coff, self.high_coffs[i])
+        return coff
+
+    def compact_polynomial(self, i: int):
+        """
+        returns: CompactPolynomial - The polinomy at index i, without converting its coefficients to `Fraction`
+        """
+        high = Fraction(self.high_coffs[i])
+        return CompactPolynomial([v * high.numerator for v in self.coefficients[i]], high.denominator)
+
+
+def _batch_from_zeroes(zeroes: list, rng):
+    return PolynomialBatch(pols.from_roots_batch(zeroes), gens.rand_high_coff_batch(len(zeroes), rng), zeroes)
+
+def pol_fz_count_batch(grade: int, zeroes_count: int = None, n: int = 1, seed=None):
+    """
+    Generate `n` polynomies like `pol_fz_count`. The parameters are validated once and the random values are drawn in bulk.
+
+    parameters:
+     - grade, zeroes_count - See `pol_fz_count`
+     - n: int - Number of polynomies to generate
+     - seed - A `random.Random`, a NumPy `Generator` or a seed for a new `random.Random`. The same seed always generates the same batch
+
+    returns: PolynomialBatch - The generated polynomies
+    """
+    zeroes_count = _check_fz_count(grade, zeroes_count)
+    rng = gens.make_rng(seed)
+
+    zeroes = roots.generate_zeroes_batch(zeroes_count, n, rng)
+
+    # Span the zeroes to reach the grade, like rand_span
+    span = grade - zeroes_count
+    if span > 0:
+        indexes = gens.rand_int_batch(0, zeroes_count - 1, n * span, rng)
+        for i, row in enumerate(zeroes):
+            row.extend(row[j] for j in indexes[i * span:(i + 1) * span])
+
+    return _batch_from_zeroes(zeroes, rng)
+
+def _check_fz_multiplicities(multiplicities: list[int]):
+    """
+    Validate the parameters of `pol_fz_multiplicities_batch`
+    """
+    if len(multiplicities) < 1:
+        raise ValueError(
+            "length of multiplicities must be at least one. This function can't generate a polinomy without zeroes")
+
+    roots.raise_if_not_valid_multiplicities(multiplicities)
+
+def pol_fz_multiplicities_batch(multiplicities: list[int], n: int = 1, seed=None):
+    """
+    Generate `n` polynomies like `pol_fz_multiplicities`. See `pol_fz_count_batch` for the parameters `n` and `seed`
+
+    returns: PolynomialBatch - The generated polynomies
+    """
+    _check_fz_multiplicities(multiplicities)
+
+    rng = gens.make_rng(seed)
+    zeroes = roots.generate_zeroes_with_multiplicity_batch(multiplicities, n, rng)
+
+    return _batch_from_zeroes(zeroes, rng)
+
+def parabola_no_zeroes_batch(n: int, rng):
+    """
+    Generate `n` polynomies like `parabola_no_zeroes`, drawn from `rng`. See `genpo.random.values.make_rng()`
+
+    returns: list[list[int]] - The generated parabolas
+    """
+    low, up = gens.easy_num_interval(negative=False)
+    cs = [c + 1 for c in gens.rand_int_batch(low, up, n, rng)]
+    # A uniform value in [0, 1) for each parabola, scaled to the interval of valid b
+    bs = rng.random(n).tolist() if gens.is_numpy_rng(rng) else [rng.random() for _ in range(n)]
+
+    res = []
+    for c, b in zip(cs, bs):
+        values = NO_ZEROES_PARABOLAS[c]
+        res.append([c, values[floor(b * len(values))], 1])
+
+    return res
+
+def pol_1_batch(multiplicities: list[int] = None, grade: int = None, n: int = 1, seed=None):
+    """
+    Generate `n` polynomies like `pol_1`. See `pol_fz_count_batch` for the parameters `n` and `seed`
+
+    returns: PolynomialBatch - The generated polynomies. The zeroes don't include the ones of the second grade factors, because they aren't real
+    """
+    multiplicities, grade_without_zeroes = _check_pol_1(multiplicities, grade)
+    rng = gens.make_rng(seed)
+
+    zeroes = roots.generate_zeroes_with_multiplicity_batch(multiplicities, n, rng)
+    coffs = pols.from_roots_batch(zeroes)
+
+    parabolas_count = grade_without_zeroes // 2
+    if parabolas_count > 0:
+        parabolas = parabola_no_zeroes_batch(n * parabolas_count, rng)
+        coffs = [ops.multiply(coff, *parabolas[i * parabolas_count:(i + 1) * parabolas_count])
+                 for i, coff in enumerate(coffs)]
+
+    return PolynomialBatch(coffs, gens.rand_high_coff_batch(n, rng), zeroes)
+
+def pol_2_batch(min_grade: int = None, max_grade: int = None, min_zeroes: int = None, max_zeroes: int = None, min_multeplicity: int = None, max_multeplicity: int = None, n: int = 1, seed=None):
+    """
+    Generate `n` polynomies like `pol_2`. See `pol_fz_count_batch` for the parameters `n` and `seed`.
+    The grade and the multiplicities change from a polinomy to another, so they are drawn one polinomy at a time. Like `pol_2`, the highest coefficient is 1 if the polinomy has only zeroes or only second grade factors
+
+    returns: PolynomialBatch - The generated polynomies. The zeroes don't include the ones of the second grade factors, because they aren't real
+    """
+    min_grade, max_grade, min_zeroes, max_zeroes, min_multeplicity, max_multeplicity = _check_pol_2(
+        min_grade, max_grade, min_zeroes, max_zeroes, min_multeplicity, max_multeplicity)
+    rng = gens.make_rng(seed)
+
+    zeroes = []
+    parabolas_counts = []
+    for zeroes_count in gens.rand_int_batch(min_zeroes, max_zeroes, n, rng):
+        row = []
+        if zeroes_count > 0:
+            multiplicities = roots.generate_multiplicities(
+                zeroes_count, min_grade, max_grade, min_multeplicity, max_multeplicity, rng)
+            row = roots.generate_zeroes_with_multiplicity_batch(multiplicities, 1, rng)[0]
+
+        grade = gens.rand_int_batch(max(len(row), min_grade), max_grade, 1, rng)[0]
+        if (grade - len(row)) % 2 != 0:
+            grade -= 1
+
+        zeroes.append(row)
+        parabolas_counts.append((grade - len(row)) // 2)
+
+    coffs = pols.from_roots_batch(zeroes)
+    parabolas = parabola_no_zeroes_batch(sum(parabolas_counts), rng)
+    high_coffs = gens.rand_high_coff_batch(n, rng)
+
+    start = 0
+    for i, count in enumerate(parabolas_counts):
+        if count > 0:
+            coffs[i] = ops.multiply(coffs[i], *parabolas[start:start + count])
+            start += count
+        if count == 0 or len(zeroes[i]) == 0:
+            high_coffs[i] = 1
+
+    return PolynomialBatch(coffs, high_coffs, zeroes)
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+def _iter_batches(make_batch, count: int, chunk_size: int, seed):
+    """
+    Yield the polynomies of consecutive batches, each generated with `make_batch(n, rng)`. Only one batch at a time is kept in memory.
+    All batches have `chunk_size` polynomies, also the last one, so the first polynomies generated with a seed are always the same, whatever count is passed
+
+    returns: generator - Tuples (coefficients, zeroes)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    rng = gens.make_rng(seed)
+    chunks = count_from() if count == None else range(0, count, chunk_size)
+
+    for start in chunks:
+        batch = make_batch(chunk_size, rng)
+        n = chunk_size if count == None else min(chunk_size, count - start)
+        for i in range(n):
+            yield batch.polynomial(i), batch.zeroes[i]
+
+def iter_pol_fz_count(grade: int, zeroes_count: int = None, count: int = None, seed=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Lazily generate polynomies like `pol_fz_count`. The polynomies are generated in batches of `chunk_size` with `pol_fz_count_batch`, so the memory used doesn't depend on how many polynomies are consumed.
+
+    parameters:
+     - grade, zeroes_count - See `pol_fz_count`
+     - count: int - Number of polynomies to generate. If None the generator never ends
+     - seed - See `pol_fz_count_batch`. The same seed and chunk_size always generate the same polynomies
+     - chunk_size: int - Number of polynomies generated at a time
+
+    returns: generator - Tuples (coefficients, zeroes). The zeroes are repeated as many times as their multiplicity
+    """
+    _check_fz_count(grade, zeroes_count)
+    return _iter_batches(lambda n, rng: pol_fz_count_batch(grade, zeroes_count, n, rng), count, chunk_size, seed)
+
+def iter_pol_fz_multiplicities(multiplicities: list[int], count: int = None, seed=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Lazily generate polynomies like `pol_fz_multiplicities`. See `iter_pol_fz_count`
+
+    returns: generator - Tuples (coefficients, zeroes)
+    """
+    _check_fz_multiplicities(multiplicities)
+    return _iter_batches(lambda n, rng: pol_fz_multiplicities_batch(multiplicities, n, rng), count, chunk_size, seed)
+
+def iter_pol_1(multiplicities: list[int] = None, grade: int = None, count: int = None, seed=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Lazily generate polynomies like `pol_1`. See `iter_pol_fz_count`
+
+    returns: generator - Tuples (coefficients, zeroes)
+    """
+    _check_pol_1(multiplicities, grade)
+    return _iter_batches(lambda n, rng: pol_1_batch(multiplicities, grade, n, rng), count, chunk_size, seed)
+
+def dedupe(records, window: int = None):
+    """
+    Skip the records with coefficients already seen. Can be chained with the `iter_` generators and with `filter`. See `genpo.dedup` for indexes that can be persisted and that recognize the polynomies multiple of each other.
+
+    parameters:
+     - records: iterable - Tuples (coefficients, zeroes), like the ones returned by the `iter_` generators
+     - window: int - Optional. If passed only the coefficients of the last `window` unique records are remembered, so the memory used is bounded, but a duplicate of an older record is not skipped
+
+    returns: generator - The records with coefficients not seen before
+    """
+    seen = OrderedDict()
+
+    for record in records:
+        key = tuple(record[0])
+        if key in seen:
+            continue
+
+        seen[key] = None
+        if window != None and len(seen) > window:
+            seen.popitem(last=False)
+
+        yield record
@@ -3,8 +3,10 @@ Random generators for roots and multeplicities
 """ 
 
 import random
+from functools import lru_cache
 
 import genpo.random.values as gens
+from genpo._optional import numpy
 from genpo.roots import *
 
 
@@ -20,19 +22,13 @@ def generate_zeroes(n: int):
     if n < 0:
         raise ValueError("n can't be negative")
 
-    zeroes: set[int] = set()
-
-    # Generate a random zero choosing from an interval
+    # Choose the zeroes from an interval, without repetitions and without discarding values
     int_low, int_up = gens.easy_num_interval(min_choices=n)
 
-    while len(zeroes) < n:
-        zeroes = zeroes | {random.randint(int_low, int_up)
-                           for _ in range(n - len(zeroes))}
+    return random.sample(range(int_low, int_up + 1), n)
 
-    return list(zeroes)
-    
 
-def generate_multiplicities(zeroes: int = 1, min_grade: int = None, max_grade: int = None, min_multiplicity: int = None, max_multiplicity: int = None):
+def generate_multiplicities(zeroes: int = 1, min_grade: int = None, max_grade: int = None, min_multiplicity: int = None, max_multiplicity: int = None, rng=None):
     """
     Generate random multiplicities for a polinomy, using the constraints specified.
 
@@ -40,6 +36,7 @@ def generate_multiplicities(zeroes: int = 1, min_grade: int = None, max_grade: i
         zeroes: int - Number of zeroes to generate. An integer >= 1
         min_grade, max_grade: int - If one of the values or both are specified, the grade of the polinomy with these zeroes will be in the range specified by the values
         min_multiplicity, max_multiplicity: int - Must pass both values or no one. If not specified each zero will have multeplicity 1. min_multeplicitiy will be constrained to have minimum value of 1 and max_multiplicity to the have the minimum value of min_multiplicity
+        rng - Optional. The random generator, see `genpo.random.values.make_rng()`. If not passed the module `random` is used
     """
 
     if zeroes == None or zeroes < 1:
@@ -67,34 +64,78 @@ def generate_multiplicities(zeroes: int = 1, min_grade: int = None, max_grade: i
     else:
         min_multiplicity = max_multiplicity = 1
 
-    multiplicities = [random.randint(
-        min_multiplicity, max_multiplicity) for _ in range(zeroes)]
+    # Constrain the grade of the polinomy in the interval passed, and in the interval of the grades reachable with these multiplicities
+    lowest, highest = zeroes * min_multiplicity, zeroes * max_multiplicity
+    grade_low = lowest if min_grade == None else min(max(min_grade, lowest), highest)
+    grade_up = highest if max_grade == None else max(min(max_grade, highest), lowest)
+    grade_low = min(grade_low, grade_up)
 
-    if min_grade == None and max_grade == None:
-        return multiplicities
+    return sample_multiplicities(zeroes, min_multiplicity, max_multiplicity, grade_low, grade_up, rng)
 
-    total_sum = sum(multiplicities)
 
-    # Constrain the grade of the polinomy in the interval passed, if necessary
-    if max_grade != None and total_sum > max_grade:
-        diff = total_sum - max_grade
-        i = 0
-        while diff > 0 and i < zeroes:
-            if multiplicities[i] > min_multiplicity:
-                i_diff = min(multiplicities[i] - min_multiplicity, diff)
-                diff -= i_diff
-                multiplicities[i] = multiplicities[i] - i_diff
-            i += 1
-    else:
-        if min_grade != None and total_sum < min_grade:
-            diff = min_grade - total_sum
-            i = 0
-            while diff > 0 and i < zeroes:
-                if multiplicities[i] < max_multiplicity:
-                    i_diff = min(max_multiplicity - multiplicities[i], diff)
-                    diff -= i_diff
-                    multiplicities[i] = multiplicities[i] + i_diff
-                i += 1
+@lru_cache(maxsize=256)
+def _count_multiplicities(zeroes: int, span: int):
+    """
+    Count the lists of `zeroes` values in [0, span] by their sum.
+
+    returns: tuple[tuple[int]] - The element [k][s] is the number of lists of k values in [0, span] with sum s
+    """
+    counts = [(1,)]
+    for k in range(1, zeroes + 1):
+        prev = counts[-1]
+        row = [0] * (k * span + 1)
+        # Sum of prev[s - span], ..., prev[s], updated sliding the window
+        window = 0
+        for s in range(len(row)):
+            if s < len(prev):
+                window += prev[s]
+            if s - span - 1 >= 0:
+                window -= prev[s - span - 1]
+            row[s] = window
+        counts.append(tuple(row))
+
+    return tuple(counts)
+
+
+def sample_multiplicities(zeroes: int, min_multiplicity: int, max_multiplicity: int, min_grade: int, max_grade: int, rng=None):
+    """
+    Choose uniformly a list of multiplicities between all the lists of `zeroes` values in [min_multiplicity, max_multiplicity] with sum in [min_grade, max_grade].
+    The number of valid lists by their sum is computed once for every combination of zeroes and length of the interval of multiplicities, then only `zeroes` + 1 random values are drawn: no list is generated and discarded.
+    The values are drawn from rng, see `genpo.random.values.make_rng()`, or from the module `random` if it's not passed.
+
+    returns: list[int] - The multiplicities
+    raise: ValueError if there aren't lists that satisfy the constraints
+    """
+    randrange = random.randrange if rng == None else lambda stop: gens.rand_int_batch(0, stop - 1, 1, rng)[0]
+    span = max_multiplicity - min_multiplicity
+    counts = _count_multiplicities(zeroes, span)
+
+    # Work with the values shifted by min_multiplicity, in [0, span]
+    low = max(min_grade - zeroes * min_multiplicity, 0)
+    up = min(max_grade - zeroes * min_multiplicity, zeroes * span)
+    if low > up:
+        raise ValueError(
+            f"Can't generate {zeroes} multiplicities in [{min_multiplicity}, {max_multiplicity}] with sum in [{min_grade}, {max_grade}]")
+
+    # Choose the sum, weighted by the number of lists with that sum
+    totals = counts[zeroes]
+    target = randrange(sum(totals[low:up + 1]))
+    remaining = low
+    while target >= totals[remaining]:
+        target -= totals[remaining]
+        remaining += 1
+
+    # Choose the values one at time, weighted by the number of ways to complete the list
+    multiplicities = []
+    for k in range(zeroes - 1, -1, -1):
+        rest = counts[k]
+        target = randrange(counts[k + 1][remaining])
+        value = max(0, remaining - k * span)
+        while target >= rest[remaining - value]:
+            target -= rest[remaining - value]
+            value += 1
+        multiplicities.append(value + min_multiplicity)
+        remaining -= value
 
     return multiplicities
 
@@ -114,6 +155,42 @@ def generate_zeroes_with_multiplicity(multiplicities: list[int]):
     # Generate the zeroes and repete each one as many times as its multiplicity
     zeroes = []
     for zero, mul in zip(generate_zeroes(len(with_multiplicity)), with_multiplicity):
-        zeroes = zeroes + [zero] * mul
+        zeroes.extend([zero] * mul)
 
     return zeroes
+
+
+def generate_zeroes_batch(n: int, count: int, rng):
+    """
+    Generate `count` lists of `n` random distinct zeroes, drawn from `rng`. See `generate_zeroes()` and `genpo.random.values.make_rng()`
+
+    returns: list[list[int]] - The generated lists of zeroes
+    raise: ValueError if `n` is < 0
+    """
+
+    if n < 0:
+        raise ValueError("n can't be negative")
+
+    int_low, int_up = gens.easy_num_interval(min_choices=n)
+
+    if gens.is_numpy_rng(rng):
+        np = numpy()
+        interval = np.arange(int_low, int_up + 1)
+        return rng.permuted(np.tile(interval, (count, 1)), axis=1)[:, :n].tolist()
+
+    interval = range(int_low, int_up + 1)
+    return [rng.sample(interval, n) for _ in range(count)]
+
+
+def generate_zeroes_with_multiplicity_batch(multiplicities: list[int], count: int, rng):
+    """
+    Generate `count` lists of random zeroes with the multiplicities passed, drawn from `rng`. See `generate_zeroes_with_multiplicity()` and `genpo.random.values.make_rng()`
+
+    returns: list[list[int]] - The generated lists. Every zero is repeated in a list as many times as its multiplicity.
+    """
+
+    with_multiplicity = keep_valid_multiplicities(multiplicities)
+    raise_if_not_valid_multiplicities(multiplicities)
+
+    return [[zero for zero, mul in zip(zeroes, with_multiplicity) for _ in range(mul)]
+            for zeroes in generate_zeroes_batch(len(with_multiplicity), count, rng)]
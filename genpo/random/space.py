@@ -0,0 +1,238 @@
+"""
+    Exact counting, enumeration and sampling by index of the polynomials that the generators can return.
+
+    The polynomies of `pol_fz_count` and `pol_1` with some parameters are a finite set: the zeroes are drawn from an interval of easy numbers, the highest coefficient from `genpo.random.values.high_coffs` and the factors without zeroes from `genpo.random.polynomials.NO_ZEROES_PARABOLAS`. A space numbers all the distinct polynomies of a generator from 0 to `size - 1`, and builds the one with any index without enumerating the others:
+
+        space = FzCountSpace(4, 2)
+        space.size             # number of distinct polynomies
+        coff, zeroes = space[12345 % space.size]
+        for coff, zeroes in space.sample(1000, seed=1):  # 1000 distinct polynomies
+            ...
+        start, stop = space.split(8)[3]  # the part of the space of the 4th of 8 machines
+        for coff, zeroes in space.iter_range(start, stop):
+            ...
+
+    An index is splitted in the indexes of its parts in mixed radix, and the zeroes, the multiplicities and the parabolas are built from their indexes with the combinatorial number system, so building a polinomy takes a number of steps linear in its grade and in the length of the interval of the zeroes, that is about the grade too.
+"""
+
+import random
+from abc import ABC, abstractmethod
+from math import comb
+
+import genpo.operations as ops
+import genpo.polynomials as pols
+import genpo.random.roots as roots
+import genpo.random.values as gens
+from genpo.compact import INT64_MAX
+from genpo.random.polynomials import NO_ZEROES_PARABOLAS, _check_fz_count, _check_pol_1
+
+# The parabolas without zeroes, numbered
+PARABOLAS = [[c, b, 1] for c, bs in NO_ZEROES_PARABOLAS.items() for b in bs]
+
+
+def unrank_combination(index: int, n: int, k: int):
+    """
+    The combination of k values in [0, n) with the index passed, in lexicographic order
+
+    returns: list[int] - The values, ascending
+    """
+    res = []
+    x = 0
+    while k > 0:
+        count = comb(n - x - 1, k - 1)
+        if index < count:
+            res.append(x)
+            k -= 1
+        else:
+            index -= count
+        x += 1
+
+    return res
+
+
+def unrank_multiset(index: int, n: int, k: int):
+    """
+    The multiset of k values in [0, n) with the index passed, mapping it to a combination of k values in [0, n + k - 1)
+
+    returns: list[int] - The values, not descending
+    """
+    return [x - i for i, x in enumerate(unrank_combination(index, n + k - 1, k))]
+
+
+def unrank_composition(index: int, total: int, parts: int):
+    """
+    The list of `parts` values >= 1 with sum `total` with the index passed, mapping it to the combination of its parts - 1 cuts in [1, total)
+
+    returns: list[int] - The values
+    """
+    cuts = [c + 1 for c in unrank_combination(index, total - 1, parts - 1)] + [total]
+    return [cut - prev for prev, cut in zip([0] + cuts, cuts)]
+
+
+def _sample_big(size: int, n: int, rng: random.Random):
+    """
+    Draw n distinct indexes in [0, size) with the algorithm of Floyd, that draws n values and keeps only the n chosen, for any size
+
+    returns: list[int] - The indexes, in random order
+    """
+    chosen = set()
+    for j in range(size - n, size):
+        index = rng.randrange(j + 1)
+        chosen.add(j if index in chosen else index)
+
+    res = list(chosen)
+    rng.shuffle(res)
+    return res
+
+
+class Space(ABC):
+    """
+    Base class of the spaces of polynomies. The subclasses set `size` and implement `parts(index)`
+    """
+    size = 0
+
+    @abstractmethod
+    def parts(self, index: int):
+        """
+        returns: tuple - The zeroes, every one repeated as many times as its multiplicity, the parabolas without zeroes and the highest coefficient of the polinomy with the index passed
+        """
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index: int):
+        """
+        returns: tuple - The coefficients and the zeroes of the polinomy with the index passed, like the records of the `iter_` generators of `genpo.random.polynomials`
+        raise: IndexError if the index is not in [0, size)
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Index {index} out of a space of {self.size} polynomies")
+
+        zeroes, parabolas, high_coff = self.parts(index)
+        coff = pols.from_roots(zeroes)
+        if len(parabolas) > 0:
+            coff = ops.multiply(coff, *parabolas)
+        ops.apply_factor(coff, high_coff)
+
+        return coff, zeroes
+
+    def __iter__(self):
+        return self.iter_range(0, self.size)
+
+    def iter_range(self, start: int, stop: int):
+        """
+        Lazily enumerate the polynomies with index in [start, stop)
+
+        returns: generator - The records (coefficients, zeroes)
+        """
+        for index in range(max(start, 0), min(stop, self.size)):
+            yield self[index]
+
+    def split(self, parts: int):
+        """
+        Split the indexes of the space in ranges of the same size, to enumerate the space in many processes or machines
+
+        returns: list[tuple] - The start and the stop of every range
+        """
+        bounds = [self.size * i // parts for i in range(parts + 1)]
+        return list(zip(bounds, bounds[1:]))
+
+    def sample(self, n: int, seed=None):
+        """
+        Draw n distinct polynomies uniformly, without repetitions and without discarding any
+
+        parameters:
+            - n: int - Number of polynomies. Can't be more than `size`
+            - seed - Seed of the random indexes. See `genpo.random.values.make_rng()`
+
+        returns: generator - The records (coefficients, zeroes)
+        raise: ValueError if n is greater than the size of the space
+        """
+        if n > self.size:
+            raise ValueError(f"Can't draw {n} distinct polynomies from a space of {self.size}")
+
+        rng = gens.make_rng(seed)
+        if self.size > INT64_MAX:
+            # NumPy and random.sample draw only indexes of 64 bits
+            if gens.is_numpy_rng(rng):
+                rng = random.Random(int(rng.integers(INT64_MAX)))
+            indexes = _sample_big(self.size, n, rng)
+        elif gens.is_numpy_rng(rng):
+            indexes = rng.choice(self.size, n, replace=False).tolist()
+        else:
+            indexes = rng.sample(range(self.size), n)
+
+        return (self[index] for index in indexes)
+
+
+class FzCountSpace(Space):
+    """
+    The polynomies generated by `pol_fz_count` with the parameters passed: a set of `zeroes_count` easy zeroes, their multiplicities, at least 1 and with sum `grade`, and a highest coefficient
+    """
+
+    def __init__(self, grade: int, zeroes_count: int = None):
+        self.grade = grade
+        self.zeroes_count = _check_fz_count(grade, zeroes_count)
+        self.low, up = gens.easy_num_interval(min_choices=self.zeroes_count)
+        self.values = up - self.low + 1
+
+        self.zeroes_size = comb(self.values, self.zeroes_count)
+        self.multiplicities_size = comb(grade - 1, self.zeroes_count - 1)
+        self.size = self.zeroes_size * self.multiplicities_size * len(gens.high_coffs)
+
+    def parts(self, index: int):
+        index, high = divmod(index, len(gens.high_coffs))
+        index, multiplicities = divmod(index, self.multiplicities_size)
+
+        values = unrank_combination(index, self.values, self.zeroes_count)
+        zeroes = []
+        for value, mul in zip(values, unrank_composition(multiplicities, self.grade, self.zeroes_count)):
+            zeroes.extend([value + self.low] * mul)
+
+        return zeroes, [], gens.high_coffs[high]
+
+
+class Pol1Space(Space):
+    """
+    The polynomies generated by `pol_1` with the parameters passed: easy zeroes with the multiplicities passed, a multiset of parabolas without zeroes and a highest coefficient. The zeroes with the same multiplicity are a set, because swapping them gives the same polinomy
+    """
+
+    def __init__(self, multiplicities: list[int] = None, grade: int = None):
+        multiplicities, grade_without_zeroes = _check_pol_1(multiplicities, grade)
+        multiplicities = roots.keep_valid_multiplicities(multiplicities)
+
+        self.low, up = gens.easy_num_interval(min_choices=len(multiplicities))
+        self.values = up - self.low + 1
+        self.parabolas_count = grade_without_zeroes // 2
+
+        # The zeroes are chosen one group of the same multiplicity at time, between the values not chosen yet
+        self.groups = []
+        available = self.values
+        self.zeroes_size = 1
+        for mul in sorted(set(multiplicities)):
+            count = multiplicities.count(mul)
+            self.groups.append((mul, count, available))
+            self.zeroes_size *= comb(available, count)
+            available -= count
+
+        self.parabolas_size = comb(len(PARABOLAS) + self.parabolas_count - 1, self.parabolas_count)
+        self.size = self.zeroes_size * self.parabolas_size * len(gens.high_coffs)
+
+    def parts(self, index: int):
+        index, high = divmod(index, len(gens.high_coffs))
+        index, parabolas = divmod(index, self.parabolas_size)
+
+        available = list(range(self.low, self.low + self.values))
+        zeroes = []
+        for mul, count, n in self.groups:
+            index, group = divmod(index, comb(n, count))
+            chosen = unrank_combination(group, n, count)
+            for i in chosen:
+                zeroes.extend([available[i]] * mul)
+            for i in reversed(chosen):
+                del available[i]
+
+        zeroes.sort()
+        return zeroes, [list(PARABOLAS[i]) for i in unrank_multiset(parabolas, len(PARABOLAS), self.parabolas_count)], gens.high_coffs[high]
@@ -4,6 +4,40 @@ import random
 from fractions import Fraction
 from math import ceil
 
+from genpo._optional import numpy, numpy_if_imported
+
+
+def make_rng(seed=None):
+    """
+    Return the random number generator to use for bulk draws.
+
+    parameter: seed - A `random.Random` or a NumPy `Generator` are returned as they are. Any other value, `None` included, is used as seed of a new `random.Random`
+
+    returns: random.Random | numpy.random.Generator - The random generator
+    """
+    if isinstance(seed, random.Random) or is_numpy_rng(seed):
+        return seed
+
+    return random.Random(seed)
+
+
+def is_numpy_rng(rng):
+    """True if rng is a NumPy `Generator`"""
+    np = numpy_if_imported()
+    return np is not None and isinstance(rng, np.random.Generator)
+
+
+def rand_int_batch(low: int, up: int, n: int, rng):
+    """
+    Generate `n` random integers in the interval [low, up], drawn from `rng`. See `make_rng()`
+
+    returns: list[int] - The generated values
+    """
+    if is_numpy_rng(rng):
+        return rng.integers(low, up, size=n, endpoint=True).tolist()
+
+    return [rng.randint(low, up) for _ in range(n)]
+
 
 def rand_bool():
     """Random bool value"""
@@ -84,3 +118,21 @@ def rand_high_coff():
     abs_val = 1 if rand_bool() else rand_simple_fraction()
 
     return sign * abs_val
+
+
+high_coffs = [1, -1] + fractions + [-f for f in fractions]
+high_coffs_weights = [3, 3] + [1] * (2 * len(fractions))
+
+def rand_high_coff_batch(n: int, rng):
+    """
+    Generate `n` highest coefficients of polynomies with the same probabilities of `rand_high_coff()`, drawn from `rng`. See `make_rng()`
+
+    returns: list - The generated coefficients
+    """
+    if is_numpy_rng(rng):
+        np = numpy()
+        weights = np.array(high_coffs_weights, dtype=np.float64)
+        indexes = rng.choice(len(high_coffs), size=n, p=weights / weights.sum())
+        return [high_coffs[i] for i in indexes.tolist()]
+
+    return rng.choices(high_coffs, weights=high_coffs_weights, k=n)
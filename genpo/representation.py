@@ -1,5 +1,11 @@
-"""String representations of polynomials"""
-from functools import reduce
+"""
+    String representations of polynomials.
+
+    `coff_str` and `coff_str_monotone` are thought to print polynomials in the terminal. The writers `write_plain`, `write_latex` and `write_mathml` write a polinomy in standard form, highest grade first, to a file-like object, piece by piece without building the whole string. `write_batch` writes a stream of polynomials with one of them.
+"""
+import io
+
+from genpo.compact import as_list
 
 def coff_str_monotone(coff: list, min_grade: int = None):
     """
@@ -8,6 +14,8 @@ def coff_str_monotone(coff: list, min_grade: int = None):
     paramater: list - The list of coefficients of the polinomy.  The element at the index i is the cofficient of x^i.
     """
 
+    coff = as_list(coff)
+
     if min_grade != None:
         coff_len = len(coff)
 
@@ -28,6 +36,8 @@ def coff_str(coff: list):
     paramater: list - The list of coefficients of the polinomy.  The element at the index i is the cofficient of x^i.
     """
 
+    coff = as_list(coff)
+
     if len(coff) < 1:
         raise ValueError("Length of coefficients list must be at least one")
 
@@ -41,4 +51,135 @@ def coff_str(coff: list):
         coff_pretty = ['0']
 
     coff_pretty.reverse()
-    return reduce(lambda a1, a2: a1 + ' + ' + a2, coff_pretty)
+    return ' + '.join(coff_pretty)
+
+
+def _terms(coff):
+    """
+    The terms of the polinomy different from 0, from the highest grade
+
+    returns: generator - Tuples with the sign to write before the term, the numerator and the denominator of the absolute value of the coefficient, and the grade of the term. The sign of the first term is '' or '-', the one of the others ' + ' or ' - '
+    """
+    coff = as_list(coff)
+    first = True
+    for pow in range(len(coff) - 1, -1, -1):
+        val = coff[pow]
+        if val == 0:
+            continue
+
+        # The floats are written as they are, because as fractions they have huge denominators
+        num, den = (val, 1) if isinstance(val, (int, float)) else (val.numerator, val.denominator)
+        if num < 0:
+            sign = '-' if first else ' - '
+            num = -num
+        else:
+            sign = '' if first else ' + '
+        first = False
+        yield sign, num, den, pow
+
+
+def write_plain(coff: list, file, var: str = 'x'):
+    """
+    Write the polinomy as text, like `-3/4x^2 + x - 2`
+
+    parameters:
+        - coff: list - The list of coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+        - file - A file-like object open in text mode
+        - var: str - The name of the variable
+    """
+    write = file.write
+    empty = True
+    for sign, num, den, pow in _terms(coff):
+        empty = False
+        value = '' if num == 1 and den == 1 and pow > 0 else f'{num}' if den == 1 else f'{num}/{den}'
+        power = '' if pow == 0 else var if pow == 1 else f'{var}^{pow}'
+        write(f'{sign}{value}{power}')
+
+    if empty:
+        write('0')
+
+
+def write_latex(coff: list, file, var: str = 'x'):
+    """
+    Write the polinomy as LaTeX math, like `-\\frac{3}{4}x^{2} + x - 2`, without the delimiters of the math mode. See `write_plain` for the parameters
+    """
+    write = file.write
+    empty = True
+    for sign, num, den, pow in _terms(coff):
+        empty = False
+        value = '' if num == 1 and den == 1 and pow > 0 else f'{num}' if den == 1 else f'\\frac{{{num}}}{{{den}}}'
+        power = '' if pow == 0 else var if pow == 1 else f'{var}^{{{pow}}}'
+        write(f'{sign}{value}{power}')
+
+    if empty:
+        write('0')
+
+
+# MathML of the signs of the terms
+_MATHML_SIGNS = {'': '', '-': '<mo>-</mo>', ' - ': '<mo>-</mo>', ' + ': '<mo>+</mo>'}
+
+
+def write_mathml(coff: list, file, var: str = 'x'):
+    """
+    Write the polinomy as a MathML `<math>` element. See `write_plain` for the parameters
+    """
+    write = file.write
+    write('<math><mrow>')
+
+    empty = True
+    for sign, num, den, pow in _terms(coff):
+        empty = False
+        if num == 1 and den == 1 and pow > 0:
+            value = ''
+        else:
+            value = f'<mn>{num}</mn>' if den == 1 else f'<mfrac><mn>{num}</mn><mn>{den}</mn></mfrac>'
+            if pow > 0:
+                # Invisible times between the coefficient and the variable
+                value += '<mo>&#x2062;</mo>'
+        power = '' if pow == 0 else f'<mi>{var}</mi>' if pow == 1 else f'<msup><mi>{var}</mi><mn>{pow}</mn></msup>'
+        write(f'{_MATHML_SIGNS[sign]}{value}{power}')
+
+    if empty:
+        write('<mn>0</mn>')
+    write('</mrow></math>')
+
+
+# The writers, by name of the format
+FORMATS = {
+    'plain': write_plain,
+    'latex': write_latex,
+    'mathml': write_mathml,
+}
+
+
+def render(coff: list, format: str = 'plain', var: str = 'x'):
+    """
+    returns: str - The polinomy written in the format, one of the keys of `FORMATS`. See `write_plain`
+    """
+    buffer = io.StringIO()
+    FORMATS[format](coff, buffer, var)
+    return buffer.getvalue()
+
+
+def write_batch(coffs, file, format: str = 'plain', separator: str = '\n', var: str = 'x'):
+    """
+    Write many polynomies to a file-like object, every one followed by the separator
+
+    parameters:
+        - coffs - Any iterable of lists of coefficients, like a `genpo.random.polynomials.PolynomialBatch` or a lazy generator
+        - file - A file-like object open in text mode
+        - format: str - One of the keys of `FORMATS`
+        - separator: str - Written after every polinomy
+        - var: str - The name of the variable
+
+    returns: int - The number of polynomies written
+    """
+    writer = FORMATS[format]
+    write = file.write
+    count = 0
+    for coff in coffs:
+        writer(coff, file, var)
+        write(separator)
+        count += 1
+
+    return count
@@ -0,0 +1,339 @@
+"""
+    Asyncio server that generates random polynomials for clients on a socket, with a line-delimited JSON protocol.
+
+    Every request is a line with a JSON object:
+
+        {"id": 1, "generator": "pol_fz_count", "params": {"grade": 4}, "count": 100, "seed": 42}
+
+    `generator` is one of the keys of `genpo.parallel.GENERATORS`, `params` are passed to it, `count` defaults to 1 and `seed`, an integer or a string, is optional. The requests of a connection are served concurrently, and the responses of a request are streamed as its chunks of polynomials are generated, one line for each chunk:
+
+        {"id": 1, "polynomials": [[-4, 0, 1], ...], "done": false}
+        {"id": 1, "polynomials": [...], "done": true}
+        {"id": 2, "error": "...", "done": true}
+
+    The integer coefficients are written as JSON integers, also when they are `Fraction` with denominator 1, and the other ones as the pair [numerator, denominator], like [3, 4] for 3/4. The requests are splitted in chunks seeded like `genpo.parallel.generate()`, so with the same seed and chunk size a request returns the same polynomials of a parallel job. The chunks of concurrent requests are grouped in batches generated by a single task of a process pool, so many small requests don't pay the cost of a task each. The queue of chunks to generate and the requests pending for every connection are bounded: when they are full the server stops reading from the clients.
+
+    Run the server with:
+
+        python -m genpo.service --port 7878
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+from genpo.parallel import GENERATORS, DEFAULT_CHUNK_SIZE, chunk_seeds, generate_chunk
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 7878
+# Max number of polynomies of a batch generated by a single task of the pool
+DEFAULT_BATCH_SIZE = 1000
+# Max time to wait for other chunks to join a batch, in seconds
+DEFAULT_BATCH_DELAY = 0.002
+# Max number of chunks waiting to be generated
+DEFAULT_QUEUE_SIZE = 1024
+# Max number of requests served at the same time for every connection
+DEFAULT_MAX_PENDING = 64
+# Max number of chunks of a request pending at the same time
+REQUEST_WINDOW = 4
+
+
+def _encode_coefficient(val):
+    """The JSON value of a coefficient that isn't an int: an int if it's integer, otherwise the pair [numerator, denominator]"""
+    if isinstance(val, Fraction):
+        return val.numerator if val.denominator == 1 else [val.numerator, val.denominator]
+    raise TypeError(f"Can't write a coefficient of type {type(val).__name__}")
+
+
+def _decode_coefficient(val):
+    """The coefficient written by `_encode_coefficient`"""
+    return Fraction(*val) if isinstance(val, list) else val
+
+
+def generate_batch(jobs: list):
+    """
+    Generate the chunks of a batch. Executed in the worker processes
+
+    parameter: list[tuple] - The generator, the params, the count and the seed of every chunk. See `genpo.parallel.generate_chunk()`
+
+    returns: list[tuple] - For every chunk, True and the JSON of the polynomies generated, or False and the error raised by the generator. An error fails only its chunk, not the other chunks of the batch, that can be of other clients
+    """
+    res = []
+    for generator, params, count, seed in jobs:
+        try:
+            res.append((True, json.dumps(generate_chunk(generator, params, count, seed), default=_encode_coefficient)))
+        except (ValueError, TypeError) as e:
+            res.append((False, str(e)))
+        except Exception as e:
+            res.append((False, f'Generation failed: {type(e).__name__}: {e}'))
+
+    return res
+
+
+class GenerationService:
+    """
+    The server. Start it with `start()` inside a running event loop, or run it with `serve_forever()`
+
+    parameters:
+        - executor - Optional. The executor of the batches. If not passed a `ProcessPoolExecutor` is created
+        - max_workers: int - Number of worker processes of the executor created, and max number of batches generated at the same time
+        - chunk_size: int - Max number of polynomies of a chunk of a request
+        - batch_size: int - Max number of polynomies of a batch
+        - batch_delay: float - Max seconds to wait for other chunks before generating a batch that isn't full
+        - queue_size: int - Max number of chunks waiting to be generated
+        - max_pending: int - Max number of requests of a connection served at the same time
+    """
+
+    def __init__(self, executor=None, max_workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE, batch_size: int = DEFAULT_BATCH_SIZE,
+                 batch_delay: float = DEFAULT_BATCH_DELAY, queue_size: int = DEFAULT_QUEUE_SIZE, max_pending: int = DEFAULT_MAX_PENDING):
+        self._own_executor = executor == None
+        self.executor = ProcessPoolExecutor(max_workers=max_workers) if self._own_executor else executor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.queue_size = queue_size
+        self.max_pending = max_pending
+        self._queue = None
+        self._server = None
+        self._batcher = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """
+        Start listening. Pass port 0 to use a free port
+
+        returns: tuple - The host and the port the server is listening on
+        """
+        self._queue = asyncio.Queue(self.queue_size)
+        self._batcher = asyncio.create_task(self._batch_chunks())
+        self._server = await asyncio.start_server(self._serve_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        """Stop listening and stop generating. The executor is shut down if it was created by the service"""
+        if self._server != None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher != None:
+            self._batcher.cancel()
+        if self._own_executor:
+            self.executor.shutdown(cancel_futures=True)
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        await self.start(host, port)
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _batch_chunks(self):
+        """
+        Take the chunks from the queue and group them in batches, until a batch has `batch_size` polynomies or `batch_delay` seconds are passed. At most `max_workers` batches are generated at the same time
+        """
+        loop = asyncio.get_running_loop()
+        running = asyncio.Semaphore(self.max_workers)
+        tasks = set()
+
+        while True:
+            batch = [await self._queue.get()]
+            size = batch[0][0][2]
+            deadline = loop.time() + self.batch_delay
+
+            while size < self.batch_size:
+                try:
+                    chunk = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        chunk = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+                batch.append(chunk)
+                size += chunk[0][2]
+
+            await running.acquire()
+            task = asyncio.create_task(self._generate(batch, running))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    async def _generate(self, batch: list, running: asyncio.Semaphore):
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, generate_batch, [job for job, _ in batch])
+        except Exception as e:
+            results = [(False, f'Generation failed: {e}')] * len(batch)
+        finally:
+            running.release()
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        pending = asyncio.Semaphore(self.max_pending)
+        tasks = set()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip() == b'':
+                    continue
+
+                # Don't read other requests while too many are served
+                await pending.acquire()
+                task = asyncio.create_task(self._serve_request(line, writer, pending))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if len(tasks) > 0:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError, asyncio.CancelledError):
+            # The connection is closed by the client or by the server shutting down
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _serve_request(self, line: bytes, writer: asyncio.StreamWriter, pending: asyncio.Semaphore):
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+                request_id = request.get('id')
+                generator, params, count, seed = _parse_request(request)
+            except (ValueError, TypeError, AttributeError) as e:
+                await _write(writer, {'id': request_id, 'error': f'Invalid request: {e}', 'done': True})
+                return
+
+            sizes = [self.chunk_size] * (count // self.chunk_size)
+            if count % self.chunk_size != 0:
+                sizes.append(count % self.chunk_size)
+
+            if len(sizes) == 0:
+                await _write(writer, {'id': request_id, 'polynomials': [], 'done': True})
+                return
+
+            if seed == None:
+                seed = random.getrandbits(64)
+
+            # Keep a window of chunks queued, and write them in order as they are generated
+            loop = asyncio.get_running_loop()
+            prefix = f'{{"id": {json.dumps(request_id)}, "polynomials": '
+            futures = deque()
+
+            for size, chunk_seed in zip(sizes, chunk_seeds(seed, len(sizes))):
+                future = loop.create_future()
+                await self._queue.put(((generator, params, size, chunk_seed), future))
+                futures.append(future)
+
+                if len(futures) >= REQUEST_WINDOW and not await _write_chunk(writer, request_id, prefix, futures.popleft(), False):
+                    return
+
+            while len(futures) > 0:
+                if not await _write_chunk(writer, request_id, prefix, futures.popleft(), len(futures) == 0):
+                    return
+        except (ConnectionError, asyncio.CancelledError):
+            raise
+        except Exception as e:
+            # Never leave the client waiting for a response that won't come
+            await _write(writer, {'id': request_id, 'error': f'Request failed: {type(e).__name__}: {e}', 'done': True})
+        finally:
+            pending.release()
+
+
+def _parse_request(request: dict):
+    """
+    returns: tuple - The generator, the params, the count and the seed of the request
+    raise: ValueError if the request is not valid
+    """
+    generator = request['generator'] if 'generator' in request else None
+    if generator not in GENERATORS:
+        raise ValueError(f"Unknown generator {generator}. Must be one of {', '.join(GENERATORS)}")
+
+    params = request.get('params', {})
+    if not isinstance(params, dict):
+        raise ValueError("params must be an object")
+
+    count = request.get('count', 1)
+    if type(count) is not int or count < 0:
+        raise ValueError("count must be an integer >= 0")
+
+    seed = request.get('seed')
+    if seed != None and not isinstance(seed, (int, str)):
+        raise ValueError("seed must be an integer or a string")
+
+    return generator, params, count, seed
+
+
+async def _write_chunk(writer: asyncio.StreamWriter, request_id, prefix: str, future: asyncio.Future, last: bool):
+    """
+    Wait for a chunk and write its response, or the error of the request
+
+    returns: bool - False if the chunk failed
+    """
+    ok, result = await future
+    if not ok:
+        await _write(writer, {'id': request_id, 'error': result, 'done': True})
+        return False
+
+    writer.write(f'{prefix}{result}, "done": {"true" if last else "false"}}}\n'.encode())
+    await writer.drain()
+    return True
+
+
+async def _write(writer: asyncio.StreamWriter, response: dict):
+    writer.write(json.dumps(response).encode() + b'\n')
+    await writer.drain()
+
+
+async def request(generator: str, count: int = 1, seed=None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, **params):
+    """
+    Simple client: send a single request to a server and yield the polynomies of the response as they arrive
+
+    returns: async generator - The coefficients of the polynomies, int or Fraction
+    raise: ValueError if the server responds with an error
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(json.dumps({'id': 0, 'generator': generator, 'params': params, 'count': count, 'seed': seed}).encode() + b'\n')
+        await writer.drain()
+
+        while True:
+            response = json.loads(await reader.readline())
+            if 'error' in response:
+                raise ValueError(response['error'])
+            for pol in response['polynomials']:
+                yield pol if pol == None else [_decode_coefficient(val) for val in pol]
+            if response['done']:
+                break
+    finally:
+        writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server of random polynomials, with a line-delimited JSON protocol")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes (default: number of processors)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="max polynomials of a response line")
+    args = parser.parse_args(argv)
+
+    service = GenerationService(max_workers=args.workers, chunk_size=args.chunk_size)
+    try:
+        asyncio.run(service.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+"""
+    Batches of generated polynomials in shared memory, to pass them to other processes without pickling their coefficients.
+
+    `export_batch` copies a `genpo.random.polynomials.PolynomialBatch` in a block of `multiprocessing.shared_memory`, with the same columns of a block of `genpo.store`:
+     - the offsets of the coefficients of every polinomy
+     - the integer numerators of the coefficients, as 64 bits integers
+     - the common denominator of every polinomy
+     - the offsets of the zeroes of every polinomy and the zeroes, every one repeated as many times as its multiplicity
+
+    Another process attaches to the block by its name and reads the columns in place. A `SharedBatch` is pickled as the name of its block, so it can be passed to a `multiprocessing.Pool` or put in a queue in constant time:
+
+        shared = export_batch(genpo.pol_fz_count_batch(4, n=100000, seed=1))
+        pool.map(render, [(shared, start, start + 1000) for start in range(0, 100000, 1000)])
+        shared.unlink()  # when all the readers are done
+
+    The block is freed by the process that created it with `unlink()`. The integers are in the byte order of the machine, because the block never leaves it.
+"""
+
+import multiprocessing
+import os
+import struct
+import sys
+from array import array
+from fractions import Fraction
+from multiprocessing import resource_tracker, shared_memory
+
+from genpo._optional import numpy
+from genpo.compact import INT64_MAX, INT64_MIN, CompactPolynomial
+
+MAGIC = b'GENPOSHM'
+VERSION = 1
+# Magic, version, reserved, number of polynomies, number of numerators, number of zeroes
+HEADER = struct.Struct('=8sIIQQQ')
+
+# The names of the blocks exported by this process
+_exported = set()
+
+
+def _attach_memory(name: str):
+    """
+    Attach to an existing block without tracking it, so it isn't freed when a reader process exits: only the creator frees it
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    memory = shared_memory.SharedMemory(name=name)
+    # Before Python 3.13 attaching registers the block in the resource tracker, that frees it at the exit of the processes using it. The processes started by multiprocessing share the tracker of their parent, where the block is already registered by its creator, so only a tracker of this process must forget it
+    own_tracker = multiprocessing.parent_process() is None and name not in _exported
+    if own_tracker and os.name == 'posix':
+        resource_tracker.unregister('/' + memory.name, 'shared_memory')
+
+    return memory
+
+
+def _sections(count: int, numerators: int, zeroes: int):
+    """
+    returns: list[tuple] - The name, the start in bytes, the length and the format of every column. Every column is 8 bytes integers, so they are all aligned
+    """
+    res = []
+    pos = HEADER.size + (-HEADER.size % 8)
+    for name, length, fmt in (('coff_offsets', count + 1, 'Q'), ('numerators', numerators, 'q'), ('denominators', count, 'q'),
+                              ('zero_offsets', count + 1, 'Q'), ('zeroes', zeroes, 'q')):
+        res.append((name, pos, length, fmt))
+        pos += 8 * length
+
+    return res
+
+
+def export_batch(batch, name: str = None):
+    """
+    Copy a batch in a new block of shared memory.
+
+    parameters:
+        - batch: PolynomialBatch - The polynomies, from the batch generators of `genpo.random.polynomials`
+        - name: str - Optional. The name of the block. If not passed a unique name is chosen
+
+    returns: SharedBatch - The batch in shared memory. Call `unlink()` to free it
+    raise: ValueError if a numerator or a zero doesn't fit in 64 bits
+    """
+    coff_offsets = array('Q', [0])
+    numerators = array('q')
+    denominators = array('q')
+    zero_offsets = array('Q', [0])
+    zeroes = array('q')
+
+    # There are only a few distinct highest coefficients
+    fractions = {}
+    try:
+        for row, high, row_zeroes in zip(batch.coefficients, batch.high_coffs, batch.zeroes):
+            if high not in fractions:
+                high_fraction = Fraction(high)
+                fractions[high] = (high_fraction.numerator, high_fraction.denominator)
+            num, den = fractions[high]
+
+            # The rows are monic, so the numerators and the denominator are already coprime
+            numerators.extend(row if num == 1 else [v * num for v in row])
+            coff_offsets.append(len(numerators))
+            denominators.append(den)
+            zeroes.extend(row_zeroes)
+            zero_offsets.append(len(zeroes))
+    except OverflowError:
+        raise ValueError(f"The numerators and the zeroes must fit in 64 bits, between {INT64_MIN} and {INT64_MAX}")
+
+    columns = {'coff_offsets': coff_offsets, 'numerators': numerators, 'denominators': denominators,
+               'zero_offsets': zero_offsets, 'zeroes': zeroes}
+    sections = _sections(len(denominators), len(numerators), len(zeroes))
+    _, last_start, last_length, _ = sections[-1]
+
+    memory = shared_memory.SharedMemory(name=name, create=True, size=last_start + 8 * last_length)
+    _exported.add(memory.name)
+    HEADER.pack_into(memory.buf, 0, MAGIC, VERSION, 0, len(denominators), len(numerators), len(zeroes))
+    for column, start, length, _ in sections:
+        memory.buf[start:start + 8 * length] = memoryview(columns[column]).cast('B')
+
+    return SharedBatch(memory)
+
+
+def attach(name: str):
+    """
+    Attach to a batch exported by another process with `export_batch`
+
+    returns: SharedBatch - The batch, read in place
+    raise: FileNotFoundError if there is no block with the name, ValueError if the block is not a batch
+    """
+    return SharedBatch(_attach_memory(name))
+
+
+class SharedBatch:
+    """
+    View of a batch in shared memory. The polinomy at index i is read with `shared[i]`, as a tuple (coefficients, zeroes) like the records of the `iter_` generators of `genpo.random.polynomials`.
+    Can be used as a context manager, that closes the view. Create it with `export_batch` or `attach`
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory):
+        self.memory = memory
+        self.name = memory.name
+
+        if memory.size < HEADER.size:
+            raise ValueError(f"The shared memory {self.name} is not a batch of polynomies")
+        magic, version, _, self.count, numerators, zeroes = HEADER.unpack_from(memory.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"The shared memory {self.name} is not a batch of polynomies")
+        if version != VERSION:
+            raise ValueError(f"Version {version} of the shared batch is not supported")
+
+        self._views = {}
+        for column, start, length, fmt in _sections(self.count, numerators, zeroes):
+            self._views[column] = memory.buf[start:start + 8 * length].cast(fmt)
+
+        self.coff_offsets = self._views['coff_offsets']
+        self.numerators = self._views['numerators']
+        self.denominators = self._views['denominators']
+        self.zero_offsets = self._views['zero_offsets']
+        self.zeroes_column = self._views['zeroes']
+
+    def __reduce__(self):
+        # Only the name crosses the process boundary: the receiver attaches to the same block
+        return attach, (self.name,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Detach from the block. The arrays returned by `arrays()` can't be used anymore"""
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        self.memory.close()
+
+    def __del__(self):
+        # Release the views before the block is closed by the garbage collector, like in the processes that never call close()
+        try:
+            self.close()
+        except (AttributeError, BufferError):
+            # Not initialized, or NumPy arrays of the columns still exist
+            pass
+
+    def unlink(self):
+        """
+        Close the view and free the block. Call it once, in the process that exported the batch, after all the readers are done
+
+        raise: BufferError if NumPy arrays of `arrays()` still exist. The block is freed anyway
+        """
+        try:
+            self.close()
+        finally:
+            self.memory.unlink()
+            _exported.discard(self.name)
+
+    def __len__(self):
+        return self.count
+
+    def _check(self, i: int):
+        if i < 0:
+            i += self.count
+        if i < 0 or i >= self.count:
+            raise IndexError(f"index {i} out of range of the batch of {self.count} polynomies")
+        return i
+
+    def polynomial(self, i: int):
+        """
+        returns: CompactPolynomial - The polinomy at index i
+        """
+        i = self._check(i)
+        return CompactPolynomial(self.numerators[self.coff_offsets[i]:self.coff_offsets[i + 1]], self.denominators[i])
+
+    def zeroes(self, i: int):
+        """
+        returns: list[int] - The zeroes of the polinomy at index i. Every zero is repeated as many times as its multiplicity
+        """
+        i = self._check(i)
+        return self.zeroes_column[self.zero_offsets[i]:self.zero_offsets[i + 1]].tolist()
+
+    def __getitem__(self, i: int):
+        return self.polynomial(i).to_list(), self.zeroes(i)
+
+    def __iter__(self):
+        return (self[i] for i in range(self.count))
+
+    def arrays(self):
+        """
+        The columns of the batch, without copies.
+
+        returns: tuple - The offsets of the coefficients of every polinomy in the numerators (`len + 1` values), the numerators, the denominators, the offsets of the zeroes and the zeroes.
+            NumPy arrays if NumPy is installed, otherwise memoryviews
+        """
+        np = numpy()
+        columns = (self.coff_offsets, self.numerators, self.denominators, self.zero_offsets, self.zeroes_column)
+        return tuple(np.asarray(view) for view in columns) if np != None else columns
@@ -0,0 +1,385 @@
+"""
+    Binary storage of banks of generated polynomials.
+
+    A bank file is a header followed by blocks, one for every batch written. Every block stores its polynomies by columns, so they can be read without parsing:
+     - the generator parameters and seed of the batch, as JSON
+     - the offsets of the coefficients of every polinomy
+     - the integer numerators of the coefficients, as 64 bits integers or, if they don't fit, as varints
+     - the common denominator of every polinomy
+     - the offsets of the roots of every polinomy, the roots and their multiplicities
+
+    `BankWriter` only appends blocks to the file, and `BankReader` maps the file in memory with `mmap`, so a polinomy or a slice of polynomies can be read without loading the whole bank.
+    All the integers are written in little endian byte order.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from fractions import Fraction
+
+from genpo._optional import numpy
+from genpo.compact import INT64_MAX, INT64_MIN, CompactPolynomial
+
+MAGIC = b'GENPOBNK'
+VERSION = 1
+# Magic, version, reserved
+FILE_HEADER = struct.Struct('<8sII')
+
+BLOCK_MAGIC = b'GPBK'
+# Magic, number of polynomies, encoding of the numerators, length of the parameters, length of the body, reserved
+BLOCK_HEADER = struct.Struct('<4sIIIQQ')
+
+ENCODING_INT64 = 0
+ENCODING_VARINT = 1
+
+if sys.byteorder != 'little':
+    raise ImportError("genpo.store supports only little endian machines")
+
+
+def _pad(length: int):
+    """Bytes to add to a section of length bytes to align the next one to 8 bytes"""
+    return -length % 8
+
+
+def _encode_varints(ints, out: bytearray):
+    """
+    Append the integers to out as zigzag varints: 7 bits for every byte, the high bit set if more bytes follow
+    """
+    for v in ints:
+        v = 2 * v if v >= 0 else -2 * v - 1
+        while v >= 0x80:
+            out.append((v & 0x7f) | 0x80)
+            v >>= 7
+        out.append(v)
+
+
+def _decode_varints(data, start: int, stop: int):
+    """
+    Decode the zigzag varints in the bytes of data from start to stop
+
+    returns: list[int] - The integers decoded
+    """
+    res = []
+    pos = start
+    while pos < stop:
+        v = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            v |= (byte & 0x7f) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        res.append(v >> 1 if v & 1 == 0 else -(v >> 1) - 1)
+
+    return res
+
+
+def _fits_int64(ints: list):
+    return len(ints) == 0 or (min(ints) >= INT64_MIN and max(ints) <= INT64_MAX)
+
+
+def _split_zeroes(zeroes: list):
+    """
+    returns: tuple - The distinct zeroes, in order of first appearance, and their multiplicities
+    """
+    counter = dict.fromkeys(zeroes, 0)
+    for zero in zeroes:
+        counter[zero] += 1
+    return list(counter), list(counter.values())
+
+
+class BankWriter:
+    """
+    Append only writer of a bank of polynomies. Every call to `write_batch` or `write_records` adds a block to the file.
+    Can be used as a context manager.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(FILE_HEADER.pack(MAGIC, VERSION, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.file.close()
+
+    def write_batch(self, batch, generator: str = None, params: dict = None, seed=None):
+        """
+        Write a `genpo.random.polynomials.PolynomialBatch` in a new block.
+
+        parameters:
+            - batch: PolynomialBatch - The polynomies to write
+            - generator: str - Optional. Name of the generator of the batch
+            - params: dict - Optional. Parameters passed to the generator. Must be serializable as JSON
+            - seed - Optional. The seed of the batch. Must be serializable as JSON
+        """
+        numerators = []
+        denominators = []
+        # There are only a few distinct highest coefficients
+        fractions = {}
+        for row, high in zip(batch.coefficients, batch.high_coffs):
+            if high not in fractions:
+                high_fraction = Fraction(high)
+                fractions[high] = (high_fraction.numerator, high_fraction.denominator)
+            num, den = fractions[high]
+
+            # The rows are monic, so the numerators and the denominator are already coprime
+            numerators.append(row if num == 1 else [v * num for v in row])
+            denominators.append(den)
+
+        self._write_block(numerators, denominators, batch.zeroes, generator, params, seed)
+
+    def write_records(self, records, generator: str = None, params: dict = None, seed=None):
+        """
+        Write the records in a new block.
+
+        parameters:
+            - records: iterable - Tuples (coefficients, zeroes), like the ones of the `iter_` generators of `genpo.random.polynomials`. Every zero is repeated as many times as its multiplicity
+            - generator, params, seed - See `write_batch`
+        """
+        numerators = []
+        denominators = []
+        zeroes_lists = []
+        for coff, zeroes in records:
+            compact = CompactPolynomial.from_coefficients(coff)
+            numerators.append(list(compact.numerators))
+            denominators.append(compact.denominator)
+            zeroes_lists.append(zeroes)
+
+        self._write_block(numerators, denominators, zeroes_lists, generator, params, seed)
+
+    def _write_block(self, numerators: list, denominators: list, zeroes_lists: list, generator, params, seed):
+        count = len(numerators)
+        meta = json.dumps({'generator': generator, 'params': params, 'seed': seed}).encode()
+
+        flat = [v for row in numerators for v in row]
+        encoding = ENCODING_INT64 if _fits_int64(flat) and _fits_int64(denominators) else ENCODING_VARINT
+
+        body = bytearray(meta)
+        body += bytes(_pad(len(body)))
+
+        coff_offsets = array('Q', [0])
+        if encoding == ENCODING_INT64:
+            for row in numerators:
+                coff_offsets.append(coff_offsets[-1] + len(row))
+            body += coff_offsets.tobytes()
+            body += array('q', flat).tobytes()
+            body += array('q', denominators).tobytes()
+        else:
+            # Every polinomy is the varints of its denominator followed by its numerators, and the offsets are in bytes
+            data = bytearray()
+            for row, den in zip(numerators, denominators):
+                _encode_varints([den], data)
+                _encode_varints(row, data)
+                coff_offsets.append(len(data))
+            body += coff_offsets.tobytes()
+            body += data
+            body += bytes(_pad(len(data)))
+
+        zero_offsets = array('Q', [0])
+        roots = array('q')
+        multiplicities = array('q')
+        for zeroes in zeroes_lists:
+            distinct, muls = _split_zeroes(zeroes)
+            roots.extend(distinct)
+            multiplicities.extend(muls)
+            zero_offsets.append(len(roots))
+
+        body += zero_offsets.tobytes()
+        body += roots.tobytes()
+        body += multiplicities.tobytes()
+
+        self.file.write(BLOCK_HEADER.pack(BLOCK_MAGIC, count, encoding, len(meta), len(body), 0))
+        self.file.write(body)
+
+
+class _Block:
+    """Position of the columns of a block in the mapped file"""
+
+    __slots__ = ('start', 'count', 'encoding', 'meta', 'coff_offsets', 'numerators', 'denominators', 'zero_offsets', 'roots', 'multiplicities')
+
+    def views(self):
+        return (self.coff_offsets, self.numerators, self.denominators, self.zero_offsets, self.roots, self.multiplicities)
+
+
+class BankReader:
+    """
+    Reader of a bank of polynomies written by `BankWriter`. The file is mapped in memory, and only the headers of the blocks are read when it's opened.
+    The polinomy at index i is read with `reader[i]`, as a tuple (coefficients, zeroes) like the records of the `iter_` generators of `genpo.random.polynomials`.
+    Can be used as a context manager.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        size = os.fstat(self.file.fileno()).st_size
+        if size < FILE_HEADER.size:
+            raise ValueError(f"{path} is not a bank of polynomies")
+
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        data = memoryview(self.map)
+
+        magic, version, _ = FILE_HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a bank of polynomies")
+        if version != VERSION:
+            raise ValueError(f"Version {version} of the bank is not supported")
+
+        self.blocks: list[_Block] = []
+        self.starts: list[int] = []
+        self.count = 0
+
+        pos = FILE_HEADER.size
+        while pos + BLOCK_HEADER.size <= size:
+            magic, count, encoding, meta_len, body_len, _ = BLOCK_HEADER.unpack_from(data, pos)
+            if magic != BLOCK_MAGIC or pos + BLOCK_HEADER.size + body_len > size:
+                # A block not written completely, for example after a crash of the writer
+                break
+
+            pos += BLOCK_HEADER.size
+            self.blocks.append(self._read_block(data, pos, count, encoding, meta_len, body_len))
+            self.starts.append(self.count)
+            self.count += count
+            pos += body_len
+
+    def _read_block(self, data, pos: int, count: int, encoding: int, meta_len: int, body_len: int):
+        block = _Block()
+        block.start = pos
+        block.count = count
+        block.encoding = encoding
+        block.meta = json.loads(bytes(data[pos:pos + meta_len]))
+
+        def take(length: int, fmt: str):
+            nonlocal pos
+            view = data[pos:pos + length].cast(fmt)
+            pos += length + _pad(length)
+            return view
+
+        pos += meta_len + _pad(meta_len)
+        block.coff_offsets = take(8 * (count + 1), 'Q')
+        if encoding == ENCODING_INT64:
+            block.numerators = take(8 * block.coff_offsets[count], 'q')
+            block.denominators = take(8 * count, 'q')
+        else:
+            block.numerators = take(block.coff_offsets[count], 'B')
+            block.denominators = None
+
+        block.zero_offsets = take(8 * (count + 1), 'Q')
+        zeroes_len = 8 * block.zero_offsets[count]
+        block.roots = take(zeroes_len, 'q')
+        block.multiplicities = take(zeroes_len, 'q')
+        return block
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Close the file. The arrays returned by `slice_arrays` without copies keep the memory map open, so they can still be used: the file is unmapped when the last of them is freed
+        """
+        for block in self.blocks:
+            for view in block.views():
+                if view != None:
+                    view.release()
+        self.blocks = []
+        try:
+            self.map.close()
+        except BufferError:
+            # Arrays of slice_arrays still export the map: it's closed when they are freed
+            pass
+        self.file.close()
+
+    def __len__(self):
+        return self.count
+
+    def _locate(self, i: int):
+        if i < 0:
+            i += self.count
+        if i < 0 or i >= self.count:
+            raise IndexError(f"index {i} out of range of the bank of {self.count} polynomies")
+
+        b = bisect_right(self.starts, i) - 1
+        return self.blocks[b], i - self.starts[b]
+
+    def polynomial(self, i: int):
+        """
+        returns: CompactPolynomial - The polinomy at index i
+        """
+        block, j = self._locate(i)
+        start, stop = block.coff_offsets[j], block.coff_offsets[j + 1]
+
+        if block.encoding == ENCODING_INT64:
+            return CompactPolynomial(block.numerators[start:stop], block.denominators[j])
+
+        # The varint of the denominator is followed by the ones of the numerators
+        values = _decode_varints(block.numerators, start, stop)
+        return CompactPolynomial(values[1:], values[0])
+
+    def roots(self, i: int):
+        """
+        returns: tuple - The distinct zeroes of the polinomy at index i and their multiplicities
+        """
+        block, j = self._locate(i)
+        start, stop = block.zero_offsets[j], block.zero_offsets[j + 1]
+        return block.roots[start:stop].tolist(), block.multiplicities[start:stop].tolist()
+
+    def params(self, i: int):
+        """
+        returns: dict - The generator, params and seed of the batch that contains the polinomy at index i
+        """
+        return self._locate(i)[0].meta
+
+    def __getitem__(self, i: int):
+        roots, multiplicities = self.roots(i)
+        zeroes = [r for r, mul in zip(roots, multiplicities) for _ in range(mul)]
+        return self.polynomial(i).to_list(), zeroes
+
+    def __iter__(self):
+        return (self[i] for i in range(self.count))
+
+    def slice_arrays(self, start: int, stop: int):
+        """
+        Read the polynomies from index start to stop (excluded) as arrays. If they are all in the same block and their numerators are 64 bits integers, the numerators are not copied.
+
+        returns: tuple - The offsets of the coefficients of every polinomy in the numerators (stop - start + 1 values), the numerators and the denominators.
+            NumPy arrays if NumPy is installed, otherwise memoryviews or arrays
+        raise: ValueError if the numerators of a polinomy don't fit in 64 bits
+        """
+        if start < 0 or stop > self.count or start > stop:
+            raise IndexError(f"slice {start}:{stop} out of range of the bank of {self.count} polynomies")
+
+        np = numpy()
+        convert = (lambda v: np.asarray(v)) if np != None else (lambda v: v)
+
+        if start < stop:
+            block, j = self._locate(start)
+            if j + stop - start <= block.count and block.encoding == ENCODING_INT64:
+                first = block.coff_offsets[j]
+                offsets = array('q', (v - first for v in block.coff_offsets[j:j + stop - start + 1]))
+                numerators = block.numerators[first:block.coff_offsets[j + stop - start]]
+                return convert(offsets), convert(numerators), convert(block.denominators[j:j + stop - start])
+
+        offsets = array('q', [0])
+        numerators = array('q')
+        denominators = array('q')
+        for i in range(start, stop):
+            pol = self.polynomial(i)
+            if not isinstance(pol.numerators, array):
+                raise ValueError(f"The numerators of the polinomy {i} don't fit in 64 bits")
+            numerators.extend(pol.numerators)
+            denominators.append(pol.denominator)
+            offsets.append(len(numerators))
+
+        return convert(offsets), convert(numerators), convert(denominators)
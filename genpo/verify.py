@@ -0,0 +1,197 @@
+"""
+    Verification of generated polynomials: recovery of their rational roots and multiplicities from the coefficients, and checks that a polinomy has exactly the roots it was generated with.
+
+    The roots are searched between the rational root candidates p/q, where p divides the constant coefficient and q divides the highest one, that are inside the interval of easy numbers used by the generators (see `genpo.random.values.easy_num_interval()`).
+"""
+
+from collections import Counter
+from fractions import Fraction
+from math import gcd
+
+import genpo.operations as ops
+from genpo.compact import CompactPolynomial
+from genpo.random.values import easy_num_interval
+
+
+def _integer_coefficients(coff):
+    """
+    Scale the coefficients of the polinomy to coprime integers, that have the same roots
+
+    returns: tuple - The integer coefficients, and the denominator they were scaled by
+    raise: ValueError if all the coefficients are 0
+    """
+    if isinstance(coff, list) and all(type(val) is int for val in coff):
+        nums, den = coff, 1
+    else:
+        compact = CompactPolynomial.from_coefficients(coff)
+        nums, den = list(compact.numerators), compact.denominator
+
+    high = len(nums)
+    while high > 0 and nums[high - 1] == 0:
+        high -= 1
+
+    if high == 0:
+        raise ValueError("The polinomy is 0: every value is a root")
+
+    return nums[:high], den
+
+
+def _divisors(n: int):
+    n = abs(n)
+    return [d for d in range(1, n + 1) if n % d == 0]
+
+
+def root_candidates(coff: list, interval: tuple = None):
+    """
+    Rational root candidates of a polinomy with integer coefficients and a constant coefficient different from 0, inside the interval
+
+    parameters:
+        - coff: list - The integer coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+        - interval: tuple - The lower and upper bound of the candidates
+
+    returns: list - The candidates, integers first
+    """
+    low, up = interval
+    a0, an = coff[0], coff[-1]
+
+    candidates = [r for r in range(low, up + 1) if r != 0 and a0 % r == 0]
+
+    for q in _divisors(an)[1:]:
+        candidates.extend(Fraction(p, q) for p in range(low * q, up * q + 1)
+                          if p != 0 and gcd(p, q) == 1 and a0 % p == 0)
+
+    return candidates
+
+
+def find_roots(coff: list, interval: tuple = None):
+    """
+    Find the rational roots of a polinomy inside an interval, with their multiplicities. The root 0 is always found.
+    For each candidate root r the polinomy is divided by (x - r) with the synthetic division while r is a root. When the derivative in r isn't 0, r is a simple root of what remains, so no other division is tried.
+
+    parameters:
+        - coff: list - List of int or Fraction coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+        - interval: tuple - Optional. The lower and upper bound of the roots to find. If not passed, the interval of easy numbers with at least as many values as the degree of the polinomy, that includes all the zeroes of the polinomies generated by `genpo.random.polynomials`
+
+    returns: tuple - The list of roots, every one repeated as many times as its multiplicity and sorted, and the coefficients of the polinomy divided by all the roots found
+    raise: ValueError if all the coefficients are 0
+    """
+    nums, den = _integer_coefficients(coff)
+
+    if interval == None:
+        interval = easy_num_interval(min_choices=len(nums) - 1)
+
+    # The root 0 is found without divisions, and it's removed so the constant coefficient isn't 0
+    zeroes_count = 0
+    while nums[zeroes_count] == 0:
+        zeroes_count += 1
+
+    zeroes = [0] * zeroes_count
+    rest = nums[zeroes_count:]
+
+    if len(rest) > 1:
+        for r in root_candidates(rest, interval):
+            while len(rest) > 1:
+                value, derivative = ops.horner_evaluate(rest, r)
+                if value != 0:
+                    break
+
+                rest, _ = ops.synthetic_division(rest, r)
+                zeroes.append(r)
+                if derivative != 0:
+                    break
+
+    zeroes.sort()
+    if den != 1:
+        ops.apply_factor(rest, Fraction(1, den))
+
+    return zeroes, rest
+
+
+def has_roots(coff: list, zeroes: list, full: bool = False):
+    """
+    Check that the polinomy has the zeroes passed, with exactly their multiplicities.
+
+    parameters:
+        - coff: list - List of int or Fraction coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+        - zeroes: list - The zeroes, every one repeated as many times as its multiplicity
+        - full: bool - True to check also that the polinomy has no other roots, that is the sum of the multiplicities is its degree
+
+    returns: bool - True if the polinomy has the zeroes with the multiplicities passed
+    """
+    nums, _ = _integer_coefficients(coff)
+
+    if full and len(nums) - 1 != len(zeroes):
+        return False
+
+    for r, multiplicity in Counter(zeroes).items():
+        for _ in range(multiplicity):
+            quotient, rem = ops.synthetic_division(nums, r)
+            if rem != 0:
+                return False
+            nums = quotient
+
+        # The multiplicity is higher than the one expected
+        if len(nums) > 1 and ops.horner_evaluate(nums, r)[0] == 0:
+            return False
+
+    return True
+
+
+def root_multiplicities(coff: list, zeroes: list):
+    """
+    The multiplicity of every value as root of the polinomy, from its square-free decomposition (see `genpo.operations.square_free()`): a value is a root with multiplicity i if it's a root of the factor of multiplicity i. So every value is evaluated only in the square-free factors, without dividing the polinomy once for every multiplicity.
+
+    parameters:
+        - coff: list - List of int or Fraction coefficients of the polinomy. The element at the index i is the cofficient of x^i.
+        - zeroes: list - The values
+
+    returns: dict - The multiplicity of every distinct value, 0 if it isn't a root
+    raise: ValueError if all the coefficients are 0
+    """
+    factors = ops.square_free(coff)
+    res = {}
+    for zero in zeroes:
+        if zero not in res:
+            res[zero] = next((multiplicity for factor, multiplicity in factors
+                              if ops.horner_evaluate(factor, zero)[0] == 0), 0)
+
+    return res
+
+
+def _rows(coffs, zeroes_lists):
+    """
+    The coefficients and the zeroes of a `genpo.random.polynomials.PolynomialBatch` or of lists. The integer coefficients of a batch are used, because they have the same roots of the polynomies
+    """
+    if hasattr(coffs, 'high_coffs'):
+        return coffs.coefficients, coffs.zeroes if zeroes_lists == None else zeroes_lists
+
+    return coffs, zeroes_lists
+
+
+def find_roots_batch(coffs, interval: tuple = None):
+    """
+    Find the roots of many polynomies. See `find_roots`
+
+    parameters:
+        - coffs - A list of lists of coefficients, or a `genpo.random.polynomials.PolynomialBatch`
+        - interval: tuple - See `find_roots`
+
+    returns: list[list] - The roots of every polinomy, every one repeated as many times as its multiplicity
+    """
+    coffs, _ = _rows(coffs, None)
+    return [find_roots(coff, interval)[0] for coff in coffs]
+
+
+def verify_batch(coffs, zeroes_lists: list = None, full: bool = False):
+    """
+    Check many polynomies with `has_roots`.
+
+    parameters:
+        - coffs - A list of lists of coefficients, or a `genpo.random.polynomials.PolynomialBatch`
+        - zeroes_lists: list[list] - The zeroes of every polinomy. Optional if coffs is a batch
+        - full: bool - See `has_roots`
+
+    returns: list[int] - The indexes of the polynomies that don't have the zeroes expected
+    """
+    coffs, zeroes_lists = _rows(coffs, zeroes_lists)
+    return [i for i, (coff, zeroes) in enumerate(zip(coffs, zeroes_lists)) if not has_roots(coff, zeroes, full)]
@@ -0,0 +1,24 @@
+import sys
+
+from setuptools import Extension, find_packages, setup
+
+# The compiled kernels are optional: if the extension can't be built, genpo uses the python code, with the same results
+extra_compile_args = [] if sys.platform.startswith('win') else ['-O2', '-ffp-contract=off']
+
+setup(
+    name='genpo',
+    description='Generate random polynomials that are simple to solve by hand',
+    packages=find_packages(include=['genpo', 'genpo.*']),
+    ext_modules=[
+        Extension('genpo._speedups', ['genpo/_speedups.c'], extra_compile_args=extra_compile_args, optional=True),
+    ],
+    python_requires='>=3.9',
+    extras_require={
+        'numpy': ['numpy'],
+    },
+    entry_points={
+        'console_scripts': [
+            'genpo = genpo.cli:main',
+        ],
+    },
+)
@@ -0,0 +1,85 @@
+import unittest
+from fractions import Fraction
+
+import genpo.polynomials as pols
+from genpo.builder import PolynomialBuilder
+from genpo.compact import CompactPolynomial
+
+
+def expected(zeroes, high_coff=1):
+    return [v * high_coff for v in pols.from_roots(sorted(zeroes))]
+
+
+class TestPolynomialBuilder(unittest.TestCase):
+
+    def test_edits(self):
+        builder = PolynomialBuilder([1, 1, -2], high_coff=3)
+        self.assertEqual(builder.coefficients(), expected([1, 1, -2], 3))
+
+        builder.add_root(Fraction(1, 2), 2)
+        builder.remove_root(1)
+        builder.move_root(-2, 4)
+        builder.set_multiplicity(5, 1)
+        builder.set_high_coff(-1)
+
+        zeroes = [1, Fraction(1, 2), Fraction(1, 2), 4, 5]
+        self.assertEqual(builder.zeroes, sorted(zeroes))
+        self.assertEqual(builder.grade, 5)
+        self.assertEqual(builder.multiplicity(Fraction(1, 2)), 2)
+        self.assertEqual(builder.coefficients(), expected(zeroes, -1))
+        self.assertIsInstance(builder.coefficients(compact=True), CompactPolynomial)
+        self.assertEqual(builder.coefficients(compact=True).to_list(), expected(zeroes, -1))
+
+    def test_undo_redo(self):
+        builder = PolynomialBuilder([2], high_coff=2)
+        states = [(builder.zeroes, builder.coefficients())]
+        for edit in (lambda: builder.add_root(-1, 3), lambda: builder.move_root(2, 7), lambda: builder.set_high_coff(5),
+                     lambda: builder.set_multiplicity(-1, 1)):
+            edit()
+            states.append((builder.zeroes, builder.coefficients()))
+
+        for state in reversed(states[:-1]):
+            self.assertTrue(builder.undo())
+            self.assertEqual((builder.zeroes, builder.coefficients()), state)
+        self.assertFalse(builder.undo())
+        self.assertFalse(builder.can_undo())
+
+        for state in states[1:]:
+            self.assertTrue(builder.redo())
+            self.assertEqual((builder.zeroes, builder.coefficients()), state)
+        self.assertFalse(builder.redo())
+
+    def test_edit_clears_redo(self):
+        builder = PolynomialBuilder([1, 2])
+        builder.add_root(3)
+        builder.undo()
+        self.assertTrue(builder.can_redo())
+        builder.add_root(4)
+        self.assertFalse(builder.can_redo())
+        self.assertEqual(builder.coefficients(), expected([1, 2, 4]))
+
+    def test_max_history(self):
+        builder = PolynomialBuilder(max_history=2)
+        for zero in range(4):
+            builder.add_root(zero)
+        self.assertTrue(builder.undo())
+        self.assertTrue(builder.undo())
+        self.assertFalse(builder.undo())
+        self.assertEqual(builder.coefficients(), expected([0, 1]))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            PolynomialBuilder([1], high_coff=0)
+
+        builder = PolynomialBuilder([1])
+        for edit in (lambda: builder.remove_root(1, 2), lambda: builder.remove_root(3), lambda: builder.move_root(3, 4),
+                     lambda: builder.add_root(2, 0), lambda: builder.set_multiplicity(1, -1), lambda: builder.set_high_coff(0)):
+            with self.assertRaises(ValueError):
+                edit()
+        # The rejected edits don't change the polinomy nor the history
+        self.assertEqual(builder.coefficients(), [-1, 1])
+        self.assertFalse(builder.can_undo())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import contextlib
+import io
+import unittest
+
+import genpo.cli as cli
+
+
+def run(argv):
+    """returns: tuple - The exit code, the output and the errors of `genpo argv`"""
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            code = cli.main(argv)
+        except SystemExit as e:
+            code = e.code
+    return code, out.getvalue(), err.getvalue()
+
+
+class TestCli(unittest.TestCase):
+
+    def test_compact(self):
+        code, out, _ = run(['-n', '5', '--seed', '1', '--format', 'compact', '--zeroes', 'fz-count', '3'])
+        self.assertEqual(code, 0)
+        lines = out.splitlines()
+        self.assertEqual(len(lines), 5)
+        for line in lines:
+            coff, zeroes = line.split('\t')
+            self.assertEqual(len(coff.split('/')[0].split(',')), 4)
+            self.assertEqual(len(zeroes.split(',')), 3)
+
+    def test_seed(self):
+        argv = ['-n', '20', '--seed', '3', 'pol-1', '--multiplicities', '1', '1', '--grade', '4']
+        self.assertEqual(run(argv), run(argv))
+
+    def test_formats(self):
+        for fmt in cli.FORMATS:
+            with self.subTest(fmt=fmt):
+                code, out, _ = run(['-n', '3', '--seed', '1', '--format', fmt, 'fz-multiplicities', '2', '1'])
+                self.assertEqual(code, 0)
+                self.assertEqual(len(out.splitlines()), 3)
+
+    def test_pol_2(self):
+        code, out, _ = run(['-n', '4', '--seed', '1', 'pol-2', '--min-grade', '2', '--max-grade', '4'])
+        self.assertEqual(code, 0)
+        self.assertEqual(len(out.splitlines()), 4)
+
+    def test_pol_2_zeroes(self):
+        code, out, err = run(['--zeroes', 'pol-2'])
+        self.assertEqual(code, 2)
+        self.assertEqual(out, '')
+        self.assertIn('--zeroes', err)
+
+    def test_errors(self):
+        self.assertEqual(run(['-n', '-1', 'fz-count', '3'])[0], 2)
+        self.assertEqual(run(['fz-count', '3', '--zeroes-count', '5'])[0], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
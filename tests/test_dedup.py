@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from fractions import Fraction
+
+import genpo.dedup as dedup
+import genpo.random.polynomials as genpo
+from genpo.compact import CompactPolynomial
+
+
+class TestCanonical(unittest.TestCase):
+
+    def test_scale_invariant(self):
+        self.assertEqual(dedup.canonical([2, -4, 6]), (1, -2, 3))
+        self.assertEqual(dedup.canonical([Fraction(-1, 2), 1, Fraction(-3, 2)]), (1, -2, 3))
+        self.assertEqual(dedup.canonical(CompactPolynomial([1, -2, 3], 7)), (1, -2, 3))
+        self.assertEqual(dedup.canonical([1, 2, 0, 0]), (1, 2))
+        self.assertEqual(dedup.canonical([0, 0]), ())
+
+    def test_not_scale_invariant(self):
+        self.assertEqual(dedup.canonical([Fraction(1, 2), 1], scale_invariant=False), (2, 1, 2))
+        self.assertNotEqual(dedup.canonical_hash([1, 2], False), dedup.canonical_hash([2, 4], False))
+        self.assertEqual(dedup.canonical_hash([1, 2]), dedup.canonical_hash([2, 4]))
+
+
+class TestIndexes(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def check_index(self, index):
+        self.assertTrue(index.add([1, 2, 3]))
+        self.assertFalse(index.add([2, 4, 6]))
+        self.assertTrue(index.add([1, 2, 4]))
+        self.assertIn([Fraction(1, 3), Fraction(2, 3), 1], index)
+        self.assertNotIn([5, 1], index)
+        stats = index.stats()
+        self.assertEqual((stats['size'], stats['checked'], stats['duplicates']), (2, 3, 1))
+
+        index.save(self.path)
+        loaded = dedup.load_index(self.path)
+        self.assertIs(type(loaded), type(index))
+        self.assertEqual(len(loaded), 2)
+        self.assertIn([1, 2, 3], loaded)
+        self.assertNotIn([5, 1], loaded)
+        self.assertEqual(loaded.stats()['checked'], 0)
+
+    def test_set_index(self):
+        self.check_index(dedup.SetIndex())
+
+    def test_bloom_index(self):
+        index = dedup.BloomIndex(capacity=1000)
+        self.check_index(index)
+        loaded = dedup.load_index(self.path)
+        self.assertEqual((loaded.bits, loaded.hashes), (index.bits, index.hashes))
+
+    def test_load_invalid(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not an index')
+        with self.assertRaises(ValueError):
+            dedup.load_index(self.path)
+
+    def test_partial_subclass(self):
+        class PartialIndex(dedup.DedupIndex):
+            def add_hash(self, key):
+                return True
+
+        with self.assertRaises(TypeError):
+            PartialIndex()
+
+
+class TestUnique(unittest.TestCase):
+
+    def test_generate_unique(self):
+        index = dedup.SetIndex()
+        coffs = list(dedup.generate_unique(genpo.pol_fz_count, 20, index, grade=2))
+        self.assertEqual(len({dedup.canonical(coff) for coff in coffs}), 20)
+        self.assertEqual(len(index), 20)
+
+    def test_exhausted(self):
+        # There are only a few distinct monic polynomies of grade 1
+        with self.assertRaises(ValueError):
+            list(dedup.generate_unique(genpo.pol_fz_count, 1000, max_rejections=200, grade=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
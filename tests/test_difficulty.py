@@ -0,0 +1,94 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+from unittest import mock
+
+import genpo.operations as ops
+import genpo.random.difficulty as difficulty
+import genpo.random.values as gens
+
+
+class TestDifficulty(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {'GENPO_CACHE_DIR': self.dir.name})
+        self.env.start()
+        difficulty._indexes.clear()
+
+    def tearDown(self):
+        difficulty._indexes.clear()
+        self.env.stop()
+        self.dir.cleanup()
+
+    def test_configurations(self):
+        for grade, multiplicities, parabolas, _ in difficulty.configurations(6):
+            self.assertEqual(sum(multiplicities) + 2 * parabolas, grade)
+            self.assertTrue(all(m >= 1 for m in multiplicities))
+
+    def test_index(self):
+        index = difficulty.build_index()
+        self.assertEqual(sorted(index), list(range(1, difficulty.DEFAULT_LEVELS + 1)))
+        self.assertTrue(all(len(configs) > 0 for configs in index.values()))
+
+        scores = [[difficulty.score(*config) for config in index[level]] for level in sorted(index)]
+        for easier, harder in zip(scores, scores[1:]):
+            self.assertLess(max(easier), min(harder))
+
+        with self.assertRaises(ValueError):
+            difficulty.build_index(max_grade=2, levels=50)
+
+    def test_cache(self):
+        index = difficulty.load_index()
+        files = os.listdir(self.dir.name)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].endswith('.json'))
+
+        difficulty._indexes.clear()
+        with mock.patch.object(difficulty, 'build_index') as build:
+            self.assertEqual(difficulty.load_index(), index)
+            build.assert_not_called()
+
+    def test_failed_write_removes_the_temporary_file(self):
+        with mock.patch.object(json, 'dump', side_effect=OSError("disk full")):
+            difficulty.load_index()
+        self.assertEqual(os.listdir(self.dir.name), [])
+
+        with mock.patch.object(json, 'dump', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                difficulty._write_index(os.path.join(self.dir.name, 'index.json'), {1: []})
+        self.assertEqual(os.listdir(self.dir.name), [])
+
+    def test_generate(self):
+        index = difficulty.load_index()
+        for level in (1, 5, difficulty.DEFAULT_LEVELS):
+            batch = difficulty.generate_by_difficulty(level, n=30, seed=level)
+            self.assertEqual(batch, difficulty.generate_by_difficulty(level, n=30, seed=level))
+            configs = {(grade, parabolas) for grade, _, parabolas, _ in index[level]}
+            for i in range(30):
+                coff = batch.polynomial(i)
+                grade = len(coff) - 1
+                parabolas = (grade - len(batch.zeroes[i])) // 2
+                self.assertIn((grade, parabolas), configs)
+                for zero in set(batch.zeroes[i]):
+                    self.assertEqual(ops.horner_evaluate(coff, zero)[0], 0)
+
+        with self.assertRaises(ValueError):
+            difficulty.generate_by_difficulty(0)
+
+    def test_draw_order(self):
+        # The polinomy i has the configuration of the draw i
+        configs = difficulty.load_index()[7]
+        choices = gens.rand_int_batch(0, len(configs) - 1, 40, random.Random(3))
+        batch = difficulty.generate_by_difficulty(7, n=40, seed=3)
+        for i, choice in enumerate(choices):
+            grade, multiplicities, _, _ = configs[choice]
+            self.assertEqual(len(batch.coefficients[i]) - 1, grade)
+            self.assertEqual(sorted(Counter(batch.zeroes[i]).values()), sorted(multiplicities))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import io
+import random
+import unittest
+
+import genpo.instrument as instrument
+import genpo.operations as ops
+import genpo.parallel as parallel
+import genpo.random.polynomials as genpo
+import genpo.random.roots as roots
+
+
+class TestInstrument(unittest.TestCase):
+
+    def setUp(self):
+        instrument.reset()
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+
+    def test_restore(self):
+        multiply = ops.multiply
+        with instrument.instrumented():
+            self.assertIsNot(ops.multiply, multiply)
+        self.assertIs(ops.multiply, multiply)
+
+    def test_generators(self):
+        generators = dict(parallel.GENERATORS)
+        with instrument.instrumented():
+            self.assertIs(parallel.GENERATORS['pol_2'], genpo.pol_2)
+            parallel.generate_chunk('pol_fz_count', {'grade': 3}, 4, 1)
+            # The new wrappers of reset() replace the generators too
+            instrument.reset()
+            self.assertIs(parallel.GENERATORS['pol_1'], genpo.pol_1)
+            parallel.generate_chunk('pol_1', {'grade': 2}, 3, 1)
+        self.assertEqual(parallel.GENERATORS, generators)
+
+        stats = instrument.snapshot()
+        self.assertEqual(stats['genpo.random.polynomials.pol_1']['calls'], 3)
+        self.assertNotIn('genpo.random.polynomials.pol_fz_count', stats)
+
+    def test_pol_2_batch(self):
+        with instrument.instrumented():
+            genpo.pol_2_batch(3, 5, n=2, seed=1)
+        self.assertEqual(instrument.snapshot()['genpo.random.polynomials.pol_2_batch']['calls'], 1)
+
+    def test_polynomial_stages(self):
+        random.seed(1)
+        with instrument.instrumented():
+            genpo.pol_fz_count(4)
+        stats = instrument.snapshot()
+        self.assertEqual(stats['genpo.random.polynomials.pol_fz_count']['degree_histogram'], {4: 1})
+        self.assertEqual(stats['genpo.random.polynomials.pol_fz_count']['calls'], 1)
+
+    def test_other_stages(self):
+        # The lists of zeroes and the values of the evaluations are not polynomies
+        with instrument.instrumented():
+            roots.generate_zeroes(5)
+            ops.evaluate_many([1, 2, 3], [0, 1, 2, 3])
+            ops.horner_evaluate([1, 2, 3], 2)
+        stats = instrument.snapshot()
+        for name in ('genpo.random.roots.generate_zeroes', 'genpo.operations.evaluate_many', 'genpo.operations.horner_evaluate'):
+            self.assertEqual(stats[name]['calls'], 1)
+            self.assertEqual(stats[name]['degree_histogram'], {})
+            self.assertEqual(stats[name]['coefficient_bits_histogram'], {})
+
+    def test_rejections(self):
+        with instrument.instrumented():
+            with self.assertRaises(ValueError):
+                genpo.pol_fz_count(-1)
+        self.assertEqual(instrument.snapshot()['genpo.random.polynomials.pol_fz_count']['rejections'], 1)
+
+    def test_summary(self):
+        with instrument.instrumented():
+            ops.multiply([1, 1], [1, -1])
+        out = io.StringIO()
+        instrument.summary(out)
+        self.assertIn('genpo.operations.multiply', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from fractions import Fraction
+
+import genpo.polynomials as pols
+from genpo import modular
+from genpo._optional import numpy
+
+
+def expand(zeroes):
+    """The expansion of the roots with the schoolbook loop, the reference of the tests"""
+    coff = [1]
+    for zero in zeroes:
+        coff = [-zero * coff[0]] + [coff[j - 1] - zero * coff[j] for j in range(1, len(coff))] + [coff[-1]]
+    return coff
+
+
+@unittest.skipIf(numpy() is None, "NumPy is not installed")
+class TestModular(unittest.TestCase):
+
+    def test_from_roots_int(self):
+        zeroes = [i % 7 - 3 for i in range(40)]
+        self.assertEqual(modular.from_roots(zeroes), expand(zeroes))
+
+    def test_from_roots_fraction(self):
+        zeroes = [Fraction(1, 3), Fraction(-2, 5), 4, 4, -1]
+        self.assertEqual(modular.from_roots(zeroes), expand(zeroes))
+
+    def test_from_roots_roots_bigger_than_int64(self):
+        zeroes = [10 ** 20] + [1] * 200
+        self.assertEqual(modular.from_roots(zeroes), expand(zeroes))
+
+        zeroes = [Fraction(1, 10 ** 20)] * 3 + [1] * 20
+        self.assertEqual(modular.from_roots(zeroes), expand(zeroes))
+
+    def test_polynomials_from_roots_big_roots(self):
+        # Over the threshold of the modular backend, the roots that don't fit in int64 give the exact expansion
+        zeroes = [10 ** 20 + i for i in range(pols.FROM_ROOTS_MODULAR_THRESHOLD + 8)]
+        self.assertEqual(pols.from_roots(zeroes), expand(zeroes))
+
+        zeroes = [Fraction(1, 10 ** 20)] * 3 + [1] * (pols.FROM_ROOTS_MODULAR_THRESHOLD + 88)
+        self.assertEqual(pols.from_roots(zeroes), expand(zeroes))
+
+    def test_multiply(self):
+        pol1 = [3, -1, 0, 2] * 10
+        pol2 = [10 ** 25, 1, -7]
+        expected = [0] * (len(pol1) + len(pol2) - 1)
+        for i, a in enumerate(pol1):
+            for j, b in enumerate(pol2):
+                expected[i + j] += a * b
+        self.assertEqual(modular.multiply(pol1, pol2), expected)
+
+    def test_too_many_distinct_roots(self):
+        with self.assertRaises(ValueError):
+            modular.from_roots([10 ** 20 + i for i in range(20)])
+
+    def test_too_long(self):
+        with self.assertRaises(ValueError):
+            modular.from_roots([1] * modular.MAX_LENGTH)
+
+
+if __name__ == '__main__':
+    unittest.main()
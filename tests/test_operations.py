@@ -0,0 +1,136 @@
+import random
+import unittest
+from fractions import Fraction
+from unittest import mock
+
+import genpo.modular as modular
+import genpo.operations as ops
+from genpo._optional import numpy
+from genpo.compact import CompactPolynomial
+
+
+def reference(pol1, pol2):
+    """The product with the definition, the reference of the tests"""
+    res = [0] * (len(pol1) + len(pol2) - 1)
+    for i, a in enumerate(pol1):
+        for j, b in enumerate(pol2):
+            res[i + j] += a * b
+    return res
+
+
+def random_pol(length: int, rng, kind: str = 'int'):
+    if kind == 'int':
+        return [rng.randint(-50, 50) for _ in range(length)]
+    if kind == 'big':
+        return [rng.randint(-10 ** 25, 10 ** 25) for _ in range(length)]
+    if kind == 'fraction':
+        return [Fraction(rng.randint(-9, 9), rng.randint(1, 6)) for _ in range(length)]
+    return [rng.uniform(-5, 5) for _ in range(length)]
+
+
+class TestMultiply(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(1)
+
+    def assert_close(self, res, expected):
+        # The float sums are done in another order
+        self.assertEqual(len(res), len(expected))
+        for val, exp in zip(res, expected):
+            self.assertAlmostEqual(val, exp, places=6)
+
+    def test_schoolbook(self):
+        for kind in ('int', 'fraction'):
+            pol1, pol2 = random_pol(10, self.rng, kind), random_pol(7, self.rng, kind)
+            expected = reference(pol1, pol2)
+            self.assertEqual(ops._schoolbook(pol1, pol2), expected)
+            self.assertEqual(ops.multiply_2(pol1, pol2), expected)
+
+        pol1, pol2 = random_pol(10, self.rng, 'float'), random_pol(7, self.rng, 'float')
+        self.assert_close(ops.multiply_2(pol1, pol2), reference(pol1, pol2))
+
+    def test_karatsuba(self):
+        for len1, len2 in ((ops.KARATSUBA_THRESHOLD, ops.KARATSUBA_THRESHOLD), (150, 60), (60, 200), (97, 101)):
+            pol1, pol2 = random_pol(len1, self.rng), random_pol(len2, self.rng)
+            self.assertEqual(ops._karatsuba(pol1, pol2), reference(pol1, pol2))
+
+        # Float polynomies are multiplied with Karatsuba by multiply_2
+        pol1, pol2 = random_pol(100, self.rng, 'float'), random_pol(80, self.rng, 'float')
+        with mock.patch.object(ops, '_karatsuba', wraps=ops._karatsuba) as karatsuba:
+            res = ops.multiply_2(pol1, pol2)
+        karatsuba.assert_called()
+        self.assert_close(res, reference(pol1, pol2))
+
+    def test_kronecker(self):
+        for kind in ('int', 'big', 'fraction'):
+            pol1, pol2 = random_pol(ops.KRONECKER_THRESHOLD, self.rng, kind), random_pol(70, self.rng, kind)
+            with mock.patch.object(ops, '_kronecker', wraps=ops._kronecker) as kronecker:
+                res = ops.multiply_2(pol1, pol2)
+            kronecker.assert_called_once()
+            self.assertEqual(res, reference(pol1, pol2))
+
+        zero = [0] * ops.KRONECKER_THRESHOLD
+        self.assertEqual(ops.multiply_2(zero, random_pol(40, self.rng)), [0] * (ops.KRONECKER_THRESHOLD + 39))
+
+    @unittest.skipIf(numpy() is None, "NumPy is not installed")
+    def test_modular(self):
+        for kind in ('int', 'fraction'):
+            pols = [random_pol(300, self.rng, kind) for _ in range(4)]
+            with mock.patch.object(modular, 'multiply', wraps=modular.multiply) as multiply:
+                res = ops.multiply(*pols)
+            multiply.assert_called_once()
+            self.assertEqual(res, reference(reference(pols[0], pols[1]), reference(pols[2], pols[3])))
+
+    def test_product_tree(self):
+        pols = [random_pol(self.rng.randint(1, 20), self.rng) for _ in range(7)]
+        expected = [1]
+        for pol in pols:
+            expected = reference(expected, pol)
+        self.assertEqual(ops.multiply(*pols), expected)
+        self.assertEqual(ops.multiply([1, 2]), [1, 2])
+
+        with self.assertRaises(ValueError):
+            ops.multiply()
+
+    def test_compact(self):
+        pol1, pol2 = [Fraction(1, 2), 3], [Fraction(-2, 3), 1, 1]
+        res = ops.multiply(CompactPolynomial.from_coefficients(pol1), pol2)
+        self.assertIsInstance(res, CompactPolynomial)
+        self.assertEqual(res.to_list(), reference(pol1, pol2))
+
+
+class TestEvaluate(unittest.TestCase):
+
+    def test_horner(self):
+        self.assertEqual(ops.horner_evaluate([1, -3, 2], 2), (3, 5))
+        self.assertEqual(ops.horner_evaluate([Fraction(1, 2), 1], Fraction(1, 2)), (1, 1))
+
+    def test_horner_compact(self):
+        coff = [Fraction(1, 2), Fraction(-3, 4), 1]
+        compact = CompactPolynomial.from_coefficients(coff)
+        for x in (2, Fraction(1, 3)):
+            res = ops.horner_evaluate(compact, x)
+            self.assertEqual(res, ops.horner_evaluate(coff, x))
+            self.assertEqual([type(v) for v in res], [Fraction, Fraction])
+
+        p, pdx = ops.horner_evaluate(compact, 0.5)
+        self.assertIsInstance(p, float)
+        self.assertAlmostEqual(p, 0.375)
+        self.assertAlmostEqual(pdx, 0.25)
+
+    def test_evaluate_many(self):
+        rng = random.Random(2)
+        coff = random_pol(80, rng)
+        xs = [rng.randint(-5, 5) for _ in range(100)]
+        expected = [ops.horner_evaluate(coff, x)[0] for x in xs]
+        self.assertEqual(ops.evaluate_many(coff, xs, exact=True), expected)
+
+    def test_divide(self):
+        rng = random.Random(3)
+        divisor, quotient = random_pol(5, rng), random_pol(8, rng)
+        divisor[-1] = 3
+        self.assertEqual(ops.divide(reference(divisor, quotient), divisor), (quotient, [0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import genpo.parallel as parallel
+
+
+class TestParallel(unittest.TestCase):
+
+    def test_invalid_arguments_raise_at_the_call(self):
+        with self.assertRaises(ValueError):
+            parallel.generate_chunks('unknown', 10)
+        with self.assertRaises(ValueError):
+            parallel.generate_chunks('pol_fz_count', -1, grade=3)
+        with self.assertRaises(ValueError):
+            parallel.generate('pol_fz_count', 10, chunk_size=0, grade=3)
+
+    def test_empty(self):
+        self.assertEqual(list(parallel.generate('pol_fz_count', 0, grade=3)), [])
+
+    def test_same_seed(self):
+        with ProcessPoolExecutor(2) as executor:
+            chunks = list(parallel.generate_chunks('pol_fz_count', 25, seed=1, chunk_size=10, executor=executor, grade=3))
+            pols = list(parallel.generate('pol_fz_count', 25, seed=1, chunk_size=10, executor=executor, grade=3))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+        self.assertEqual([pol for chunk in chunks for pol in chunk], pols)
+
+        # The chunks depend only on the seed and the chunk size
+        seeds = parallel.chunk_seeds(1, 3)
+        self.assertEqual(chunks[1], parallel.generate_chunk('pol_fz_count', {'grade': 3}, 10, seeds[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import random
+import unittest
+from fractions import Fraction
+from unittest import mock
+
+import genpo.cache as cache
+import genpo.modular as modular
+import genpo.polynomials as pols
+from genpo._optional import numpy
+from genpo.compact import CompactPolynomial
+
+
+def expand(zeroes):
+    """The expansion of the roots with the schoolbook loop, the reference of the tests"""
+    coff = [1]
+    for zero in zeroes:
+        coff = [-zero * coff[0]] + [coff[j - 1] - zero * coff[j] for j in range(1, len(coff))] + [coff[-1]]
+    return coff
+
+
+class TestFromRoots(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(1)
+
+    def test_small(self):
+        self.assertEqual(pols.from_roots([]), [1])
+        self.assertEqual(pols.from_roots([1, 2]), [2, -3, 1])
+        self.assertEqual(pols.from_roots([Fraction(1, 2), -1]), [Fraction(-1, 2), Fraction(1, 2), 1])
+
+    def test_python(self):
+        zeroes = [self.rng.randint(-5, 5) for _ in range(20)]
+        with mock.patch.object(pols, '_speedups', None):
+            self.assertEqual(pols.from_roots(zeroes), expand(zeroes))
+
+    def test_tree(self):
+        zeroes = [Fraction(self.rng.randint(-5, 5), self.rng.randint(1, 3)) for _ in range(pols.FROM_ROOTS_TREE_THRESHOLD + 20)]
+        with mock.patch.object(pols, 'from_roots_tree', wraps=pols.from_roots_tree) as tree:
+            res = pols.from_roots(zeroes)
+        tree.assert_called_once()
+        self.assertEqual(res, expand(zeroes))
+        self.assertEqual(pols.from_roots_tree([]), [1])
+        self.assertEqual(pols.root_power(2, 3), expand([2, 2, 2]))
+
+    @unittest.skipIf(numpy() is None, "NumPy is not installed")
+    def test_modular(self):
+        zeroes = [self.rng.randint(-3, 3) for _ in range(pols.FROM_ROOTS_MODULAR_THRESHOLD)]
+        with mock.patch.object(modular, 'from_roots', wraps=modular.from_roots) as from_roots:
+            res = pols.from_roots(zeroes)
+        from_roots.assert_called_once()
+        self.assertEqual(res, expand(zeroes))
+
+    def test_cache(self):
+        cache.clear()
+        cache.configure(enabled=True, maxsize=16)
+        try:
+            self.assertEqual(pols.from_roots([3, 1, 2]), expand([3, 1, 2]))
+            self.assertEqual(pols.from_roots([2, 3, 1]), expand([1, 2, 3]))
+            self.assertEqual(pols.from_roots([1, 2, 5]), expand([1, 2, 5]))
+            info = cache.info()
+            self.assertEqual((info['misses'], info['hits'], info['prefix_hits']), (1, 1, 1))
+        finally:
+            cache.configure(enabled=False)
+            cache.clear()
+
+    def test_cache_types(self):
+        # Equal roots of different types are cached apart
+        types = lambda coff: [type(v) for v in coff]
+        cache.clear()
+        cache.configure(enabled=True, maxsize=16)
+        try:
+            for zeroes in ([0.5, 1, 2], [Fraction(1, 2), 1, 2], [Fraction(1, 2), 1.0, 2], [True, 1, 2]):
+                with self.subTest(zeroes=zeroes):
+                    res = pols.from_roots(zeroes)
+                    self.assertEqual(res, expand(zeroes))
+                    self.assertEqual(types(res), types(expand(sorted(zeroes, key=lambda zero: type(zero).__name__))))
+            self.assertEqual(types(pols.from_roots([1, Fraction(1, 2), 2])), [Fraction] * 3 + [int])
+        finally:
+            cache.configure(enabled=False)
+            cache.clear()
+
+    def test_compact(self):
+        res = pols.from_roots([Fraction(1, 2), 3], compact=True)
+        self.assertIsInstance(res, CompactPolynomial)
+        self.assertEqual(res.to_list(), expand([Fraction(1, 2), 3]))
+
+
+class TestFromRootsBatch(unittest.TestCase):
+
+    def check(self, zeroes_lists):
+        for count in (pols.FROM_ROOTS_BATCH_NUMPY_THRESHOLD - 1, pols.FROM_ROOTS_BATCH_NUMPY_THRESHOLD + 8):
+            lists = (zeroes_lists * count)[:count]
+            res = pols.from_roots_batch(lists)
+            self.assertEqual(res, [expand(zeroes) for zeroes in lists])
+            self.assertEqual([[type(v) for v in coff] for coff in res], [[type(v) for v in coff] for coff in map(pols.from_roots, lists)])
+
+    def test_int(self):
+        self.check([[1, -2, 3], [0, 0, 5], [4, 4, -4]])
+
+    def test_different_degrees(self):
+        self.check([[1], [2, -3], [0, 1, 1, 1]])
+
+    def test_fraction(self):
+        self.check([[Fraction(1, 2), 3], [Fraction(-2, 3), Fraction(1, 4)]])
+
+    def test_float(self):
+        self.check([[0.5, 3], [-1.25, 2]])
+
+    def test_big(self):
+        self.check([[10 ** 20, 1, 2], [3, -2 ** 40, 2 ** 40]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import random
+import unittest
+from collections import Counter
+
+import genpo.operations as ops
+import genpo.random.polynomials as genpo
+from genpo._optional import numpy
+
+
+class TestBatchGenerators(unittest.TestCase):
+
+    def check_batch(self, batch, n):
+        self.assertEqual(len(batch), n)
+        for i in range(n):
+            coff = batch.polynomial(i)
+            self.assertEqual(coff[-1], batch.high_coffs[i])
+            for zero in set(batch.zeroes[i]):
+                self.assertEqual(ops.horner_evaluate(coff, zero)[0], 0)
+
+    def test_seed(self):
+        for make in (lambda seed: genpo.pol_fz_count_batch(4, 2, n=30, seed=seed),
+                     lambda seed: genpo.pol_fz_multiplicities_batch([2, 1], n=30, seed=seed),
+                     lambda seed: genpo.pol_1_batch([1, 1], grade=4, n=30, seed=seed),
+                     lambda seed: genpo.pol_2_batch(3, 6, n=30, seed=seed)):
+            self.assertEqual(make(7), make(7))
+            self.assertEqual(make(random.Random(7)), make(7))
+            self.check_batch(make(7), 30)
+
+    def test_pol_2_batch(self):
+        batch = genpo.pol_2_batch(min_grade=3, max_grade=7, min_zeroes=1, max_zeroes=3, n=200, seed=1)
+        self.check_batch(batch, 200)
+        for i in range(200):
+            self.assertTrue(3 <= len(batch.coefficients[i]) - 1 <= 7)
+            self.assertTrue(1 <= len(set(batch.zeroes[i])) <= 3)
+
+    def test_pol_2_batch_without_zeroes(self):
+        batch = genpo.pol_2_batch(min_grade=4, max_grade=4, max_zeroes=0, n=10, seed=2)
+        self.assertEqual(batch.zeroes, [[]] * 10)
+        self.assertEqual(batch.high_coffs, [1] * 10)
+        self.assertEqual({len(coff) for coff in batch.coefficients}, {5})
+
+    def test_pol_2_batch_invalid(self):
+        with self.assertRaises(ValueError):
+            genpo.pol_2_batch(min_grade=5, max_grade=3)
+
+    @unittest.skipIf(numpy() is None, "NumPy is not installed")
+    def test_numpy_rng(self):
+        batch = genpo.pol_2_batch(3, 6, n=20, seed=numpy().random.default_rng(1))
+        self.check_batch(batch, 20)
+        self.assertEqual(batch, genpo.pol_2_batch(3, 6, n=20, seed=numpy().random.default_rng(1)))
+
+    def test_iter(self):
+        records = list(genpo.iter_pol_fz_count(3, count=25, seed=1, chunk_size=10))
+        self.assertEqual(len(records), 25)
+        self.assertEqual(records[:10], list(genpo.iter_pol_fz_count(3, count=10, seed=1, chunk_size=10)))
+        for coff, zeroes in records:
+            self.assertEqual(sum(Counter(zeroes).values()), len(coff) - 1)
+
+    def test_iter_invalid(self):
+        # The parameters are validated when the generator is created, not when it's first advanced
+        for make in (lambda: genpo.iter_pol_fz_count(2, zeroes_count=3),
+                     lambda: genpo.iter_pol_fz_multiplicities([]),
+                     lambda: genpo.iter_pol_fz_multiplicities([2, 0]),
+                     lambda: genpo.iter_pol_1([1], grade=2)):
+            with self.assertRaises(ValueError):
+                make()
+
+
+if __name__ == '__main__':
+    unittest.main()
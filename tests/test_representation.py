@@ -0,0 +1,40 @@
+import io
+import unittest
+from fractions import Fraction
+
+import genpo.representation as representation
+from genpo.compact import CompactPolynomial
+
+
+class TestRepresentation(unittest.TestCase):
+
+    def test_coff_str(self):
+        self.assertEqual(representation.coff_str([-2, 1, Fraction(-3, 4)]), '-3/4x^2 + 1x^1 + -2')
+        self.assertEqual(representation.coff_str([0.5, 0, 2.0]), '2.0x^2 + 0.5')
+        self.assertEqual(representation.coff_str([0]), '0')
+
+    def test_plain(self):
+        self.assertEqual(representation.render([-2, 1, Fraction(-3, 4)]), '-3/4x^2 + x - 2')
+        self.assertEqual(representation.render([0, 0, 0]), '0')
+        self.assertEqual(representation.render(CompactPolynomial([3, 0, -1], 2), var='y'), '-1/2y^2 + 3/2')
+
+    def test_float(self):
+        self.assertEqual(representation.render([0.5, -1.0, 2.25]), '2.25x^2 - x + 0.5')
+        self.assertEqual(representation.render([-0.5, 3.0], 'latex'), '3.0x - 0.5')
+        self.assertEqual(representation.render([1.5], 'mathml'), '<math><mrow><mn>1.5</mn></mrow></math>')
+
+    def test_latex(self):
+        self.assertEqual(representation.render([-2, 1, Fraction(-3, 4)], 'latex'), '-\\frac{3}{4}x^{2} + x - 2')
+
+    def test_mathml(self):
+        self.assertEqual(representation.render([1, -1], 'mathml'),
+                         '<math><mrow><mo>-</mo><mi>x</mi><mo>+</mo><mn>1</mn></mrow></math>')
+
+    def test_write_batch(self):
+        buffer = io.StringIO()
+        self.assertEqual(representation.write_batch([[1, 1], [0, 2]], buffer), 2)
+        self.assertEqual(buffer.getvalue(), 'x + 1\n2x\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
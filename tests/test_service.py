@@ -0,0 +1,86 @@
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from unittest import mock
+
+import genpo.parallel as parallel
+import genpo.service as service
+
+
+def overflowing(**params):
+    raise OverflowError("too big")
+
+
+class TestGenerateBatch(unittest.TestCase):
+
+    def test_coefficients(self):
+        [(ok, result)] = service.generate_batch([('pol_fz_count', {'grade': 3}, 20, 1)])
+        self.assertTrue(ok)
+        expected = parallel.generate_chunk('pol_fz_count', {'grade': 3}, 20, 1)
+        decoded = [[service._decode_coefficient(val) for val in pol] for pol in json.loads(result)]
+        self.assertEqual(decoded, expected)
+
+        # Integer coefficients are JSON integers, also when they are Fraction
+        self.assertEqual(json.loads(json.dumps([Fraction(-3), Fraction(3, 4), 2], default=service._encode_coefficient)), [-3, [3, 4], 2])
+
+    def test_errors_fail_only_their_chunk(self):
+        with mock.patch.dict(parallel.GENERATORS, {'overflowing': overflowing}):
+            results = service.generate_batch([('pol_fz_count', {'grade': 2}, 2, 1), ('overflowing', {}, 1, 1),
+                                              ('pol_fz_count', {'grade': -1}, 1, 1), ('pol_fz_count', {'grade': 2}, 2, 2)])
+
+        self.assertEqual([ok for ok, _ in results], [True, False, False, True])
+        self.assertIn('OverflowError', results[1][1])
+
+
+class TestService(unittest.TestCase):
+
+    def test_request(self):
+        async def run():
+            executor = ThreadPoolExecutor(2)
+            server = service.GenerationService(executor=executor, max_workers=2, chunk_size=7)
+            host, port = await server.start(port=0)
+            try:
+                pols = [pol async for pol in service.request('pol_1', count=20, seed=5, host=host, port=port, multiplicities=[1, 2], grade=5)]
+                with self.assertRaises(ValueError):
+                    [pol async for pol in service.request('unknown', host=host, port=port)]
+            finally:
+                await server.close()
+                executor.shutdown()
+            return pols
+
+        pols = asyncio.run(run())
+        self.assertEqual(len(pols), 20)
+        self.assertEqual(pols, [pol for chunk in parallel.generate_chunks('pol_1', 20, seed=5, chunk_size=7, max_workers=1, multiplicities=[1, 2], grade=5)
+                                for pol in chunk])
+
+    def test_errors(self):
+        async def errors():
+            executor = ThreadPoolExecutor(1)
+            server = service.GenerationService(executor=executor, max_workers=1)
+            host, port = await server.start(port=0)
+
+            async def error(**kwargs):
+                with self.assertRaises(ValueError) as context:
+                    await asyncio.wait_for(service.request('pol_fz_count', host=host, port=port, grade=3, **kwargs).__anext__(), 5)
+                return str(context.exception)
+
+            try:
+                res = [await error(seed=[1, 2]), await error(seed={})]
+                # An unexpected error of the server still sends a response
+                with mock.patch.object(service, 'chunk_seeds', side_effect=RuntimeError("broken")):
+                    res.append(await error(seed=1))
+            finally:
+                await server.close()
+                executor.shutdown()
+            return res
+
+        res = asyncio.run(errors())
+        self.assertIn('seed must be', res[0])
+        self.assertIn('seed must be', res[1])
+        self.assertIn('RuntimeError: broken', res[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
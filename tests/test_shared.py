@@ -0,0 +1,61 @@
+import multiprocessing
+import pickle
+import unittest
+
+import genpo.random.polynomials as genpo
+import genpo.shared as shared
+from genpo._optional import numpy
+
+
+def read_zeroes(args):
+    batch, i = args
+    return batch.zeroes(i)
+
+
+class TestShared(unittest.TestCase):
+
+    def setUp(self):
+        self.batch = genpo.pol_fz_count_batch(4, zeroes_count=3, n=20, seed=1)
+        self.shared = shared.export_batch(self.batch)
+
+    def tearDown(self):
+        try:
+            self.shared.unlink()
+        except FileNotFoundError:
+            pass
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.shared), 20)
+        for i in range(20):
+            coff, zeroes = self.shared[i]
+            self.assertEqual(coff, self.batch.polynomial(i))
+            self.assertEqual(zeroes, self.batch.zeroes[i])
+
+        with shared.attach(self.shared.name) as reader:
+            self.assertEqual(list(reader), list(self.shared))
+
+        copy = pickle.loads(pickle.dumps(self.shared))
+        self.assertEqual(copy[3], self.shared[3])
+        copy.close()
+
+    def test_other_process(self):
+        with multiprocessing.get_context('spawn').Pool(1) as pool:
+            zeroes = pool.map(read_zeroes, [(self.shared, i) for i in range(20)])
+        self.assertEqual(zeroes, self.batch.zeroes)
+
+    @unittest.skipIf(numpy() is None, "NumPy is not installed")
+    def test_unlink_with_live_arrays(self):
+        arrays = self.shared.arrays()
+        with self.assertRaises(BufferError):
+            self.shared.unlink()
+
+        # The block is freed even if the view can't be closed
+        with self.assertRaises(FileNotFoundError):
+            shared.attach(self.shared.name)
+
+        del arrays
+        self.shared.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import random
+import unittest
+from math import comb
+
+import genpo.random.space as space
+from genpo._optional import numpy
+
+
+class TestUnrank(unittest.TestCase):
+
+    def test_combination(self):
+        combinations = [space.unrank_combination(i, 5, 3) for i in range(comb(5, 3))]
+        self.assertEqual(combinations, sorted(combinations))
+        self.assertEqual(len({tuple(c) for c in combinations}), comb(5, 3))
+
+    def test_multiset(self):
+        multisets = {tuple(space.unrank_multiset(i, 4, 3)) for i in range(comb(6, 3))}
+        self.assertEqual(len(multisets), comb(6, 3))
+        self.assertTrue(all(list(m) == sorted(m) for m in multisets))
+
+    def test_composition(self):
+        compositions = {tuple(space.unrank_composition(i, 6, 3)) for i in range(comb(5, 2))}
+        self.assertEqual(len(compositions), comb(5, 2))
+        self.assertTrue(all(sum(c) == 6 and min(c) >= 1 for c in compositions))
+
+
+class TestSpaces(unittest.TestCase):
+
+    def check_distinct(self, sp):
+        records = list(sp)
+        self.assertEqual(len(records), sp.size)
+        self.assertEqual(len({tuple(coff) for coff, _ in records}), sp.size)
+
+    def test_fz_count_space(self):
+        sp = space.FzCountSpace(2, 1)
+        self.check_distinct(sp)
+        for coff, zeroes in sp:
+            self.assertEqual(len(coff), 3)
+            self.assertEqual(len(set(zeroes)), 1)
+
+    def test_pol_1_space(self):
+        self.check_distinct(space.Pol1Space([1], grade=3))
+
+    def test_index(self):
+        sp = space.FzCountSpace(4, 2)
+        self.assertEqual(sp[-1], sp[sp.size - 1])
+        with self.assertRaises(IndexError):
+            sp[sp.size]
+
+    def test_split(self):
+        sp = space.FzCountSpace(3, 2)
+        ranges = sp.split(4)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], sp.size)
+        self.assertEqual(sum(len(list(sp.iter_range(start, stop))) for start, stop in ranges), sp.size)
+
+    def test_sample(self):
+        sp = space.FzCountSpace(4, 2)
+        records = list(sp.sample(50, seed=1))
+        self.assertEqual(len({tuple(coff) for coff, _ in records}), 50)
+        self.assertEqual(records, list(sp.sample(50, seed=random.Random(1))))
+
+        with self.assertRaises(ValueError):
+            sp.sample(sp.size + 1)
+
+    @unittest.skipIf(numpy() is None, "NumPy is not installed")
+    def test_sample_numpy_rng(self):
+        sp = space.FzCountSpace(4, 2)
+        records = list(sp.sample(50, seed=numpy().random.default_rng(1)))
+        self.assertEqual(len({tuple(coff) for coff, _ in records}), 50)
+
+        big = space.Pol1Space([1] * 6, grade=100)
+        self.assertGreater(big.size, 2 ** 63)
+        self.assertEqual(len(list(big.sample(3, seed=numpy().random.default_rng(1)))), 3)
+
+    def test_sample_big_space(self):
+        big = space.Pol1Space([1] * 6, grade=100)
+        records = list(big.sample(5, seed=1))
+        self.assertEqual(len({tuple(coff) for coff, _ in records}), 5)
+
+    def test_partial_subclass(self):
+        class PartialSpace(space.Space):
+            size = 1
+
+        with self.assertRaises(TypeError):
+            PartialSpace()
+
+
+if __name__ == '__main__':
+    unittest.main()
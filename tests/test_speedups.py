@@ -0,0 +1,97 @@
+import random
+import timeit
+import unittest
+from fractions import Fraction
+from math import copysign
+
+import genpo.operations as ops
+import genpo.polynomials as pols
+from genpo._optional import speedups
+
+compiled = speedups()
+
+KINDS = ('int64', 'bigint', 'float', 'fraction')
+
+
+def random_values(kind: str, n: int, rng):
+    if kind == 'int64':
+        return [rng.randint(-5, 5) for _ in range(n)]
+    if kind == 'bigint':
+        return [rng.randint(-10 ** 30, 10 ** 30) for _ in range(n)]
+    if kind == 'float':
+        return [rng.uniform(-5, 5) for _ in range(n)]
+    return [Fraction(rng.randint(-5, 5), rng.randint(1, 4)) for _ in range(n)]
+
+
+def same(a, b):
+    """True if the values are equal and have the same types, and the float zeroes have the same sign"""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if type(a) is float:
+        return a == b and copysign(1, a) == copysign(1, b) or a != a and b != b
+    return a == b
+
+
+def set_speedups(module):
+    ops._speedups = module
+    pols._speedups = module
+
+
+@unittest.skipIf(compiled is None, "The compiled kernels are not built")
+class TestSpeedups(unittest.TestCase):
+
+    def tearDown(self):
+        set_speedups(compiled)
+
+    def assert_parity(self, fun):
+        set_speedups(None)
+        expected = fun()
+        set_speedups(compiled)
+        self.assertTrue(same(fun(), expected))
+
+    def test_parity(self):
+        rng = random.Random(1)
+        for kind in KINDS:
+            for degree in (0, 1, 7, 40):
+                with self.subTest(kind=kind, degree=degree):
+                    pol1, pol2 = random_values(kind, degree + 1, rng), random_values(kind, degree // 2 + 1, rng)
+                    x = rng.choice([-1, 1]) if kind == 'int64' else random_values(kind, 1, rng)[0]
+                    zeroes = random_values(kind, degree, rng)
+
+                    self.assert_parity(lambda: pols.from_roots(zeroes))
+                    self.assert_parity(lambda: ops.horner_evaluate(pol1, x))
+                    self.assert_parity(lambda: (lambda coff: (ops.sum_2(coff, pol2), coff))(pol1[:]))
+                    self.assert_parity(lambda: (lambda coff: (ops.apply_factor(coff, x), coff))(pol1[:]))
+                    self.assert_parity(lambda: ops.multiply(pol1, pol2, zeroes + [1]))
+
+    def test_parity_overflow(self):
+        # The int64 paths fall back to python ints when a result doesn't fit
+        big = 2 ** 62
+        self.assert_parity(lambda: pols.from_roots([big, big, -3]))
+        self.assert_parity(lambda: ops.horner_evaluate([big, big, big], 3))
+        self.assert_parity(lambda: (lambda coff: (ops.sum_2(coff, [big, big]), coff))([big, 1, 2]))
+        self.assert_parity(lambda: (lambda coff: (ops.apply_factor(coff, 4), coff))([big, -big]))
+
+    def test_errors(self):
+        for module in (None, compiled):
+            set_speedups(module)
+            with self.assertRaises(TypeError):
+                pols.from_roots([1, 'a'])
+            with self.assertRaises(IndexError):
+                ops.sum_2([1], [1, 2])
+
+    def test_from_roots_speedup(self):
+        # The expansion of int64 and float roots must be at least 10 times faster than the python code
+        rng = random.Random(2)
+        for zeroes in ([rng.randint(-1, 1) for _ in range(32)], [rng.uniform(-5, 5) for _ in range(32)]):
+            set_speedups(None)
+            python = min(timeit.repeat(lambda: pols.from_roots(zeroes), number=50, repeat=5))
+            set_speedups(compiled)
+            fast = min(timeit.repeat(lambda: pols.from_roots(zeroes), number=50, repeat=5))
+            self.assertGreaterEqual(python / fast, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+import genpo.random.polynomials as genpo
+import genpo.store as store
+
+
+class TestStore(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.gpb')
+        os.close(fd)
+        os.unlink(self.path)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def test_round_trip(self):
+        batch = genpo.pol_1_batch([2, 1], grade=5, n=50, seed=1)
+        records = [([10 ** 30, 0, 1], [])]
+        with store.BankWriter(self.path) as writer:
+            writer.write_batch(batch, 'pol_1', {'multiplicities': [2, 1], 'grade': 5}, seed=1)
+            writer.write_records(records)
+
+        with store.BankReader(self.path) as reader:
+            self.assertEqual(len(reader), 51)
+            for i in range(len(batch)):
+                coff, zeroes = reader[i]
+                self.assertEqual(coff, batch.polynomial(i))
+                self.assertEqual(sorted(zeroes), sorted(batch.zeroes[i]))
+            self.assertEqual(reader[50], records[0])
+            self.assertEqual(reader.params(0)['params'], {'multiplicities': [2, 1], 'grade': 5})
+            with self.assertRaises(IndexError):
+                reader[51]
+
+    def test_close_with_live_slice_arrays(self):
+        batch = genpo.pol_fz_count_batch(3, n=10, seed=2)
+        with store.BankWriter(self.path) as writer:
+            writer.write_batch(batch)
+
+        with store.BankReader(self.path) as reader:
+            expected = [reader.polynomial(i) for i in range(5)]
+            offsets, numerators, denominators = reader.slice_arrays(0, 5)
+
+        # The arrays without copies keep the map open after the reader is closed
+        for i in range(5):
+            self.assertEqual(list(numerators[offsets[i]:offsets[i + 1]]), list(expected[i].numerators))
+            self.assertEqual(denominators[i], expected[i].denominator)
+
+
+if __name__ == '__main__':
+    unittest.main()